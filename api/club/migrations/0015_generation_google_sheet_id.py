@@ -0,0 +1,18 @@
+# Generated by Django 5.1.4 on 2026-10-18 09:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('club', '0014_alter_clubapply_generation'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='generation',
+            name='google_sheet_id',
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+    ]
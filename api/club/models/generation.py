@@ -20,6 +20,9 @@ class Generation(SoftDeleteModel):
     invite_code = models.CharField(max_length=6, null=True, blank=True)
     auto_approve = models.BooleanField(default=False)
 
+    # 출석 정보를 내보낸 구글 시트 (다음 내보내기에서 재사용)
+    google_sheet_id = models.CharField(max_length=100, null=True, blank=True)
+
     @property
     def member_count(self):
         return self.gen_members.count()
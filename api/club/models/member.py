@@ -39,6 +39,16 @@ class Member(SoftDeleteModel):
     updated_at = models.DateTimeField(auto_now=True)
 
     def get_current_generation(self):
+        if "gen_members" in getattr(self, "_prefetched_objects_cache", {}):
+            # gen_members(generation 포함)를 미리 불러온 경우 메모리에서 찾음
+            gen_members = list(self.gen_members.all())
+            activated = [gm for gm in gen_members if gm.generation.activated]
+            return max(
+                activated or gen_members,
+                key=lambda gm: gm.generation.start_date,
+                default=None,
+            )
+
         if self.gen_members.filter(generation__activated=True).exists():
             return (
                 self.gen_members.filter(generation__activated=True)
@@ -49,6 +59,8 @@ class Member(SoftDeleteModel):
             return self.gen_members.all().order_by("-generation__start_date").first()
 
     def is_activated(self):
+        if "gen_members" in getattr(self, "_prefetched_objects_cache", {}):
+            return any(gm.generation.activated for gm in self.gen_members.all())
         return self.gen_members.filter(generation__activated=True).exists()
 
     class Meta:
@@ -22,6 +22,8 @@ class GenerationInfoSerializer(serializers.ModelSerializer):
     member_count = serializers.SerializerMethodField()
 
     def get_member_count(self, obj: Generation):
+        if hasattr(obj, "gen_member_count"):
+            return obj.gen_member_count
         return obj.gen_members.count()
 
     class Meta:
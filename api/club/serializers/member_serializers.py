@@ -32,6 +32,17 @@ class GenerationMappingSerializer(serializers.ModelSerializer):
         fields = ["id", "generation", "role", "member"]
 
 
+class GenerationMemberSerializer(serializers.ModelSerializer):
+    """기수 정보를 제외한 기수 회원 정보 (기수 정보는 응답 최상단에 한 번만 포함)"""
+
+    role = RoleSerializer()
+    member = MemberSerializer()
+
+    class Meta:
+        model = GenMember
+        fields = ["id", "role", "member"]
+
+
 class MemberRoleChangeRequestSerializer(serializers.Serializer):
     role_id = serializers.IntegerField()
     user_generation_id = serializers.IntegerField()
@@ -2,6 +2,7 @@ from django.db import transaction
 from loguru import logger
 
 from api.club.models import ClubApply, Generation, GenMember, Member
+from api.club.services.roster_cache import RosterCache
 from api.userapp.models import User
 from common.component.fcm_component import FCMComponent
 from common.component.notification_template import NotificationTemplate
@@ -47,6 +48,7 @@ class ApplyService:
             return
 
         ClubApply.objects.create(user=user, generation=generation)
+        RosterCache.invalidate(generation.id)
 
         result = fcm_component.send_to_users(
             notice_users,
@@ -100,6 +102,7 @@ class ApplyService:
         if not club_apply:
             raise CustomException(ErrorCode.APPLY_NOT_FOUND)
         club_apply.delete()
+        RosterCache.invalidate(club_apply.generation_id)
         fcm_component.send_to_user(
             club_apply.user,
             NotificationTemplate.CLUB_APPLY_REJECT.get_title(
@@ -136,5 +139,6 @@ class ApplyService:
             role=generation.club.default_role,
             is_current=True,
         )
+        RosterCache.invalidate(generation.id)
 
         return member, generation_mapping
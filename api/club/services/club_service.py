@@ -2,6 +2,7 @@ import random
 import string
 
 from django.db import transaction
+from django.db.models import Count, Prefetch
 
 from api.club.models import Club, Generation, GenMember, Member, Role
 from api.userapp.models import User
@@ -60,6 +61,38 @@ class ClubService:
 
         return club, member
 
+    @staticmethod
+    def get_user_clubs(user: User):
+        """
+        사용자가 속한 클럽 목록 (ClubInfoSerializer용)
+
+        기수 매핑, 기수(멤버 수 포함), 역할과 클럽의 기수 목록을 미리 불러와
+        멤버 수와 관계없이 고정된 쿼리 수로 직렬화할 수 있도록 합니다.
+        """
+        return (
+            Member.objects.filter(user=user, club__deleted=False)
+            .select_related("user", "club")
+            .prefetch_related(
+                Prefetch(
+                    "gen_members", queryset=GenMember.objects.select_related("role")
+                ),
+                # gen_member.generation과 같이 삭제된 기수도 포함
+                Prefetch(
+                    "gen_members__generation",
+                    queryset=Generation.all_objects.annotate(
+                        gen_member_count=Count("gen_members")
+                    ),
+                ),
+                Prefetch(
+                    "club__generation_set",
+                    queryset=Generation.objects.annotate(
+                        gen_member_count=Count("gen_members")
+                    ).order_by("start_date"),
+                ),
+            )
+            .order_by("club__name")
+        )
+
     @staticmethod
     def create_generation(
         club: Club, generation_data: dict, user: User
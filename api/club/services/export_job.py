@@ -0,0 +1,161 @@
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django_redis import get_redis_connection
+
+
+class ExportJobStatus:
+    PENDING = "pending"
+    PROCESSING = "processing"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class ExportJob:
+    """
+    백그라운드 내보내기 작업 상태 (캐시)
+
+    요청에서는 작업을 만들어 job_id만 돌려주고, Celery 작업이 진행하면서 상태를
+    갱신합니다. 상태 조회 API는 job_id로 캐시를 읽습니다.
+
+    - kind          -> 작업 종류 (예: "excel", "notion")
+    - generation_id -> 대상 기수
+    - status        -> ExportJobStatus
+    - path          -> 완료 시 업로드된 파일 경로
+    - done/total    -> 진행 상황 (작업이 기록하는 경우)
+    """
+
+    KEY = "export_job:{job_id}"
+    # 기수별로 하나만 실행할 작업의 잠금 (값은 실행 중인 job_id)
+    LOCK_KEY = "export_job_lock:{kind}:{generation_id}"
+
+    # 잠금 값이 ARGV[1]일 때만 ARGV[2]로 바꾸고 만료 시간을 ARGV[3]초로 설정
+    _REPLACE_LOCK = """
+    if redis.call("GET", KEYS[1]) == ARGV[1] then
+        redis.call("SET", KEYS[1], ARGV[2], "EX", ARGV[3])
+        return 1
+    end
+    return 0
+    """
+    # 잠금 값이 ARGV[1]일 때만 삭제
+    _RELEASE_LOCK = """
+    if redis.call("GET", KEYS[1]) == ARGV[1] then
+        return redis.call("DEL", KEYS[1])
+    end
+    return 0
+    """
+
+    @classmethod
+    def _key(cls, job_id: str) -> str:
+        return cls.KEY.format(job_id=job_id)
+
+    @classmethod
+    def _lock_key(cls, kind: str, generation_id: int) -> str:
+        return cls.LOCK_KEY.format(kind=kind, generation_id=generation_id)
+
+    @classmethod
+    def _redis(cls):
+        return get_redis_connection("default")
+
+    @classmethod
+    def _save(cls, job_id: str, kind: str, generation_id: int, user_id: int | None):
+        cache.set(
+            cls._key(job_id),
+            {
+                "kind": kind,
+                "generation_id": generation_id,
+                "user_id": user_id,
+                "status": ExportJobStatus.PENDING,
+            },
+            settings.EXPORT_JOB_TTL,
+        )
+
+    @classmethod
+    def create(cls, kind: str, generation_id: int, user_id: int | None) -> str:
+        job_id = uuid.uuid4().hex
+        cls._save(job_id, kind, generation_id, user_id)
+        return job_id
+
+    @classmethod
+    def create_exclusive(
+        cls, kind: str, generation_id: int, user_id: int | None
+    ) -> tuple[str, bool]:
+        """
+        기수별로 하나만 실행되는 작업 생성
+
+        같은 기수에 진행 중인 같은 종류의 작업이 있으면 새로 만들지 않고 그 작업을
+        반환합니다. 잠금은 작업이 끝나면 release()로 풀고, 실행 중에는
+        extend_lock()으로 연장합니다. 워커가 죽은 경우에는 EXPORT_JOB_LOCK_TTL이
+        지나면 풀립니다.
+
+        Returns:
+            (job_id, 새로 만들었는지 여부)
+        """
+        job_id = uuid.uuid4().hex
+        # 잠금을 잡기 전에 작업 상태를 먼저 저장해, 잠금이 보이는 순간 작업도 조회됨
+        cls._save(job_id, kind, generation_id, user_id)
+
+        redis = cls._redis()
+        lock_key = cls._lock_key(kind, generation_id)
+        ttl = settings.EXPORT_JOB_LOCK_TTL
+        while not redis.set(lock_key, job_id, nx=True, ex=ttl):
+            running_job_id = redis.get(lock_key)
+            if running_job_id is None:
+                # 그 사이 잠금이 풀렸으면 다시 시도
+                continue
+            running_job_id = running_job_id.decode()
+            if cls.get(running_job_id) is not None:
+                cache.delete(cls._key(job_id))
+                return running_job_id, False
+            # 잠금은 남았는데 작업 상태가 만료된 경우, 그 잠금 그대로일 때만 교체
+            if redis.eval(cls._REPLACE_LOCK, 1, lock_key, running_job_id, job_id, ttl):
+                break
+        return job_id, True
+
+    @classmethod
+    def extend_lock(cls, job_id: str) -> bool:
+        """
+        create_exclusive()로 잡은 잠금의 만료 시간을 EXPORT_JOB_LOCK_TTL로 다시 늘림
+
+        오래 걸리는 작업이 진행 중에 주기적으로 호출합니다.
+
+        Returns:
+            아직 이 작업이 잠금을 가지고 있는지 여부
+        """
+        job = cls.get(job_id)
+        if job is None:
+            return False
+        lock_key = cls._lock_key(job["kind"], job["generation_id"])
+        return bool(
+            cls._redis().eval(
+                cls._REPLACE_LOCK,
+                1,
+                lock_key,
+                job_id,
+                job_id,
+                settings.EXPORT_JOB_LOCK_TTL,
+            )
+        )
+
+    @classmethod
+    def release(cls, job_id: str):
+        """create_exclusive()로 잡은 잠금 해제 (다른 작업의 잠금이면 그대로 둠)"""
+        job = cls.get(job_id)
+        if job is None:
+            return
+        lock_key = cls._lock_key(job["kind"], job["generation_id"])
+        cls._redis().eval(cls._RELEASE_LOCK, 1, lock_key, job_id)
+
+    @classmethod
+    def get(cls, job_id: str) -> dict | None:
+        return cache.get(cls._key(job_id))
+
+    @classmethod
+    def update(cls, job_id: str, **fields):
+        """상태를 갱신 (만료된 작업이면 무시)"""
+        job = cls.get(job_id)
+        if job is None:
+            return
+        job.update(fields)
+        cache.set(cls._key(job_id), job, settings.EXPORT_JOB_TTL)
@@ -1,7 +1,7 @@
 from api.club.models import GenMember, Role
 from api.club.models.club_apply import ClubApply
-from api.event.models import Attendance, Event
-from api.event.models.enums import AttendanceStatus
+from api.club.services.roster_cache import RosterCache
+from api.event.models import AttendanceCurrent, Event, GenMemberAttendanceStats
 from api.event.serializers import AttendanceSerializer
 from common.component import FCMComponent, NotificationTemplate
 from common.exceptions import CustomException, ErrorCode
@@ -25,6 +25,7 @@ class GenMemberService:
                 raise CustomException(ErrorCode.OWNER_ROLE_MUST_BE_MORE_THAN_ONE)
         gen_member.role = role
         gen_member.save()
+        RosterCache.invalidate(gen_member.generation_id)
         fcm_component.send_to_user(
             gen_member.member.user,
             NotificationTemplate.MEMBER_ROLE_CHANGE.get_title(),
@@ -44,6 +45,7 @@ class GenMemberService:
         if gen_member.get_siblings().count() == 0:
             gen_member.member.delete()
         gen_member.delete()
+        RosterCache.invalidate(gen_member.generation_id)
 
     @classmethod
     def get_gen_member_attendances(cls, gen_member_id: int):
@@ -54,29 +56,19 @@ class GenMemberService:
             "-date", "-start_datetime"
         )
 
-        # 모든 Event에 대한 해당 GenMember의 Attendance를 한 번에 가져오기
-        attendances = Attendance.objects.filter(
+        # 모든 Event에 대한 해당 GenMember의 최신 Attendance를 한 번에 가져오기
+        current_attendances = AttendanceCurrent.objects.filter(
             event__in=events, generation_mapping=gen_member
-        ).order_by("event_id", "-created_at")
-
-        # 각 Event에 대한 최신 Attendance만 필터링 (event_id별로 가장 최신 것만)
-        latest_attendances_map = {}
-        for attendance in attendances:
-            if attendance.event_id not in latest_attendances_map:
-                latest_attendances_map[attendance.event_id] = attendance
-
-        # 출석 통계 계산
-        total_attendances = 0
-        total_absences = 0
-        total_late_attendances = 0
+        ).select_related("attendance")
+        latest_attendances_map = {
+            current.event_id: current.attendance for current in current_attendances
+        }
 
-        for attendance in latest_attendances_map.values():
-            if attendance.status == AttendanceStatus.PRESENT:
-                total_attendances += 1
-            elif attendance.status == AttendanceStatus.LATE:
-                total_late_attendances += 1
-            elif attendance.status == AttendanceStatus.ABSENT:
-                total_absences += 1
+        # 출석 통계 (미리 집계된 멤버별 카운터)
+        stats = GenMemberAttendanceStats.objects.filter(gen_member=gen_member).first()
+        total_attendances = stats.present_count if stats else 0
+        total_absences = stats.absent_count if stats else 0
+        total_late_attendances = stats.late_count if stats else 0
 
         # EventSerializer 구조에 맞춘 이벤트 데이터 구성
         events_data = []
@@ -1,11 +1,12 @@
-from django.db.models import Case, Count, F, IntegerField, OuterRef, Subquery, When
+from django.db.models import F
+from django.db.models.functions import Coalesce
 
 from api.club.models import Generation, GenMember
 from api.club.models.member import Member
 from api.club.services.apply_service import ApplyService
-from api.event.models import Attendance
+from api.club.services.export_job import ExportJob, ExportJobStatus
+from api.club.tasks import sync_notion_attendance
 from api.userapp.models import User
-from common.utils.notion import NotionAttendanceManager
 
 
 class GenerationService:
@@ -13,62 +14,17 @@ class GenerationService:
     def get_generation_stats(generation_id: int) -> list[GenMember]:
         generation = Generation.objects.get(id=generation_id)
 
-        # Get all generation mappings and their members
+        # 멤버별로 미리 집계된 출석 통계(GenMemberAttendanceStats)를 한 행씩 조인
+        def count_status(field):
+            return Coalesce(F(f"attendance_stats__{field}"), 0)
+
         stats = (
             GenMember.objects.filter(generation=generation)
             .select_related("member__user")
             .annotate(
-                present_count=Count(
-                    Case(
-                        When(
-                            attendances__created_at=Subquery(
-                                Attendance.objects.filter(
-                                    generation_mapping=OuterRef("id"),
-                                    event=OuterRef("attendances__event"),
-                                )
-                                .order_by("-created_at")
-                                .values("created_at")[:1]
-                            ),
-                            attendances__status=1,
-                            then=1,
-                        ),
-                        output_field=IntegerField(),
-                    )
-                ),
-                late_count=Count(
-                    Case(
-                        When(
-                            attendances__created_at=Subquery(
-                                Attendance.objects.filter(
-                                    generation_mapping=OuterRef("id"),
-                                    event=OuterRef("attendances__event"),
-                                )
-                                .order_by("-created_at")
-                                .values("created_at")[:1]
-                            ),
-                            attendances__status=2,
-                            then=1,
-                        ),
-                        output_field=IntegerField(),
-                    )
-                ),
-                absent_count=Count(
-                    Case(
-                        When(
-                            attendances__created_at=Subquery(
-                                Attendance.objects.filter(
-                                    generation_mapping=OuterRef("id"),
-                                    event=OuterRef("attendances__event"),
-                                )
-                                .order_by("-created_at")
-                                .values("created_at")[:1]
-                            ),
-                            attendances__status=3,
-                            then=1,
-                        ),
-                        output_field=IntegerField(),
-                    )
-                ),
+                present_count=count_status("present_count"),
+                late_count=count_status("late_count"),
+                absent_count=count_status("absent_count"),
                 member_name=F("member__user__username"),
             )
             .order_by("member_name")
@@ -95,10 +51,31 @@ class GenerationService:
                     notion_database_id = part
                     break
 
-        notion_db = NotionAttendanceManager()
-        return notion_db.update_attendance_database_async(
-            generation, database_id=notion_database_id, user=user
+        # 같은 기수의 동기화가 진행 중이면 새로 시작하지 않고 그 작업을 알려줌
+        job_id, created = ExportJob.create_exclusive(
+            "notion", generation.id, user.id if user else None
         )
+        if not created:
+            return {
+                "status": ExportJobStatus.PROCESSING,
+                "job_id": job_id,
+                "message": "이미 노션 데이터베이스 업데이트가 진행 중입니다. 완료 시 알림이 발송됩니다.",
+            }
+
+        try:
+            sync_notion_attendance.delay(
+                job_id, generation.id, notion_database_id, user.id if user else None
+            )
+        except Exception as e:
+            # 작업을 등록하지 못하면 잠금이 남아 재시도가 모두 이 작업으로 합쳐지므로 해제
+            ExportJob.update(job_id, status=ExportJobStatus.FAILED, error=str(e))
+            ExportJob.release(job_id)
+            raise
+        return {
+            "status": ExportJobStatus.PROCESSING,
+            "job_id": job_id,
+            "message": "노션 데이터베이스 업데이트가 백그라운드에서 처리 중입니다. 완료 시 알림이 발송됩니다.",
+        }
 
     @staticmethod
     def activate_generation(generation: Generation):
@@ -124,7 +101,24 @@ class GenerationService:
 
     @classmethod
     def get_generations_by_member(cls, member: Member):
-        return cls.get_generations_by_user(member.user, member.club.id)
+        if "gen_members" not in getattr(member, "_prefetched_objects_cache", {}):
+            return cls.get_generations_by_user(member.user, member.club.id)
+
+        # ClubService.get_user_clubs로 미리 불러온 데이터에서 바로 계산
+        current_gen_member = member.get_current_generation()
+        if (
+            current_gen_member.generation.activated
+            and current_gen_member.role.history_edit
+        ):
+            return list(member.club.generation_set.all())
+        generations = {
+            gm.generation.id: gm.generation
+            for gm in member.gen_members.all()
+            if not gm.generation.is_deleted
+        }
+        return sorted(
+            generations.values(), key=lambda generation: generation.start_date
+        )
 
     @classmethod
     def get_generations_by_user(cls, user: User, club_id: int):
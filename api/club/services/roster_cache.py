@@ -0,0 +1,131 @@
+from django.conf import settings
+from django.db import transaction
+from django_redis import get_redis_connection
+from redis.exceptions import WatchError
+
+from api.club.models import ClubApply, GenMember
+
+
+class RosterCache:
+    """
+    기수별 출석 명단 캐시 (Redis 해시)
+
+    QR 출석 시 user_id로 GenMember를 찾기 위해 매번 member/user를 조인하지 않도록
+    기수 단위로 아래 필드를 하나의 해시에 보관합니다.
+
+    - m:{user_id} -> gen_member_id
+    - a:{user_id} -> 가입 승인 대기 중인 신청자
+    - __built__   -> 명단이 만들어졌는지 여부 (빈 기수도 캐시하기 위함)
+
+    명단이 바뀔 때마다 기수별 버전을 올리고, build()는 DB를 읽기 전의 버전이
+    그대로일 때만 캐시를 씁니다. 읽는 사이에 바뀐 명단이 다시 캐시되지 않습니다.
+    """
+
+    KEY = "roster:{generation_id}"
+    VERSION_KEY = "roster:{generation_id}:version"
+    BUILT_FIELD = "__built__"
+
+    @classmethod
+    def _redis(cls):
+        return get_redis_connection("default")
+
+    @classmethod
+    def _key(cls, generation_id: int) -> str:
+        return cls.KEY.format(generation_id=generation_id)
+
+    @classmethod
+    def _version_key(cls, generation_id: int) -> str:
+        return cls.VERSION_KEY.format(generation_id=generation_id)
+
+    @classmethod
+    def build(cls, generation_id: int) -> dict | None:
+        """
+        DB에서 명단을 읽어 캐시를 새로 만듦
+
+        Returns:
+            캐시에 쓴 명단, 읽는 사이 명단이 바뀌어 쓰지 않았으면 None
+        """
+        redis = cls._redis()
+        version_key = cls._version_key(generation_id)
+        version = redis.get(version_key)
+
+        mapping = {cls.BUILT_FIELD: 1}
+        for user_id, gen_member_id in GenMember.objects.filter(
+            generation_id=generation_id
+        ).values_list("member__user_id", "id"):
+            mapping[f"m:{user_id}"] = gen_member_id
+        for user_id in ClubApply.objects.filter(
+            generation_id=generation_id, accepted=False
+        ).values_list("user_id", flat=True):
+            mapping[f"a:{user_id}"] = 1
+
+        key = cls._key(generation_id)
+        with redis.pipeline() as pipeline:
+            try:
+                pipeline.watch(version_key)
+                if pipeline.get(version_key) != version:
+                    return None
+                pipeline.multi()
+                pipeline.delete(key)
+                pipeline.hset(key, mapping=mapping)
+                pipeline.expire(key, settings.ROSTER_CACHE_TTL)
+                pipeline.execute()
+            except WatchError:
+                return None
+        return mapping
+
+    @classmethod
+    def resolve(cls, generation_id: int, user_id: int) -> tuple[int | None, bool]:
+        """
+        기수 명단에서 사용자를 찾음
+
+        Returns:
+            (gen_member_id, 승인 대기 여부), 명단에 없으면 gen_member_id는 None
+        """
+        built, gen_member_id, applied = cls._redis().hmget(
+            cls._key(generation_id),
+            cls.BUILT_FIELD,
+            f"m:{user_id}",
+            f"a:{user_id}",
+        )
+        if built is None:
+            mapping = cls.build(generation_id)
+            if mapping is None:
+                # 명단이 바뀌는 중이면 이 사용자만 DB에서 조회
+                return cls._resolve_from_db(generation_id, user_id)
+            gen_member_id = mapping.get(f"m:{user_id}")
+            applied = mapping.get(f"a:{user_id}")
+        if gen_member_id is not None:
+            gen_member_id = int(gen_member_id)
+        return gen_member_id, applied is not None
+
+    @classmethod
+    def _resolve_from_db(
+        cls, generation_id: int, user_id: int
+    ) -> tuple[int | None, bool]:
+        gen_member_id = (
+            GenMember.objects.filter(
+                generation_id=generation_id, member__user_id=user_id
+            )
+            .values_list("id", flat=True)
+            .first()
+        )
+        applied = ClubApply.objects.filter(
+            generation_id=generation_id, user_id=user_id, accepted=False
+        ).exists()
+        return gen_member_id, applied
+
+    @classmethod
+    def invalidate(cls, generation_id: int):
+        """명단이 바뀌면 호출 (트랜잭션 안이라면 커밋 후 버전을 올리고 삭제)"""
+        key = cls._key(generation_id)
+        version_key = cls._version_key(generation_id)
+
+        def invalidate():
+            pipeline = cls._redis().pipeline()
+            pipeline.incr(version_key)
+            pipeline.expire(version_key, settings.ROSTER_CACHE_TTL)
+            pipeline.delete(key)
+            pipeline.execute()
+
+        transaction.on_commit(invalidate)
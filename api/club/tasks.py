@@ -0,0 +1,94 @@
+import logging
+import threading
+from contextlib import contextmanager
+
+from celery import shared_task
+from django.conf import settings
+
+from api.club.models import Generation
+from api.club.services.export_job import ExportJob, ExportJobStatus
+from api.userapp.models import User
+from common.utils.excel import create_attendance_excel
+from common.utils.notion import NotionAttendanceManager
+
+logger = logging.getLogger(__name__)
+
+
+@contextmanager
+def _keep_lock(job_id: str):
+    """블록이 실행되는 동안 작업 잠금을 EXPORT_JOB_LOCK_TTL의 1/3마다 연장"""
+    stopped = threading.Event()
+
+    def extend():
+        while not stopped.wait(settings.EXPORT_JOB_LOCK_TTL / 3):
+            if not ExportJob.extend_lock(job_id):
+                logger.warning(f"export job lock lost - job {job_id}")
+                return
+
+    thread = threading.Thread(target=extend, daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stopped.set()
+        thread.join()
+
+
+@shared_task
+def export_attendance_excel(job_id: str, generation_id: int):
+    """
+    기수 출석 정보를 엑셀로 만들어 S3에 업로드하고 작업 상태를 갱신합니다.
+    """
+    ExportJob.update(job_id, status=ExportJobStatus.PROCESSING)
+    try:
+        generation = Generation.objects.select_related("club").get(id=generation_id)
+        path = create_attendance_excel(generation)
+    except Exception:
+        logger.exception(f"export_attendance_excel failed - job {job_id}")
+        ExportJob.update(job_id, status=ExportJobStatus.FAILED)
+        raise
+
+    ExportJob.update(job_id, status=ExportJobStatus.DONE, path=path)
+    return {"job_id": job_id, "path": path}
+
+
+@shared_task
+def sync_notion_attendance(
+    job_id: str, generation_id: int, database_id: str, user_id: int | None = None
+):
+    """
+    기수 출석 정보를 노션 데이터베이스에 동기화합니다.
+
+    진행 상황(done/total)을 작업 상태에 기록하고, 끝나면 요청한 사용자에게
+    완료/실패 알림을 보냅니다. 실행 중에는 기수별 잠금을 연장하고, 끝나면
+    성공/실패와 관계없이 최종 상태를 기록한 뒤 해제합니다.
+    """
+    ExportJob.update(job_id, status=ExportJobStatus.PROCESSING)
+    manager = NotionAttendanceManager()
+    user = None
+
+    def progress(done: int, total: int):
+        ExportJob.update(job_id, done=done, total=total)
+
+    try:
+        try:
+            generation = Generation.objects.select_related("club").get(id=generation_id)
+            user = User.objects.filter(id=user_id).first() if user_id else None
+            with _keep_lock(job_id):
+                manager.update_attendance_database(
+                    generation, database_id=database_id, progress=progress
+                )
+        except Exception as e:
+            logger.exception(f"sync_notion_attendance failed - job {job_id}")
+            ExportJob.update(job_id, status=ExportJobStatus.FAILED, error=str(e))
+            if user:
+                manager.notify_failed(generation, user, e)
+            raise
+        ExportJob.update(job_id, status=ExportJobStatus.DONE)
+    finally:
+        # 최종 상태를 기록한 뒤에 잠금을 풀어야 새 요청이 끝난 작업을 진행 중으로 보지 않음
+        ExportJob.release(job_id)
+
+    if user:
+        manager.notify_completed(generation, user)
+    return {"job_id": job_id}
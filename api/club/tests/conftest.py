@@ -184,11 +184,23 @@ def mock_fcm(mocker):
 def mock_excel(mocker):
     """엑셀 생성 모킹"""
     return mocker.patch(
-        "common.utils.excel.create_attendance_excel",
+        "api.club.views.generation_view.create_attendance_excel",
         return_value="/test/path/attendance.xlsx",
     )
 
 
+@pytest.fixture
+def mock_excel_job(mocker):
+    """엑셀 생성 작업 등록 모킹"""
+    return mocker.patch("api.club.tasks.export_attendance_excel.delay")
+
+
+@pytest.fixture
+def mock_notion_sync(mocker):
+    """노션 동기화 작업 등록 모킹"""
+    return mocker.patch("api.club.tasks.sync_notion_attendance.delay")
+
+
 @pytest.fixture
 def mock_google_sheet(mocker):
     """구글 시트 생성 모킹"""
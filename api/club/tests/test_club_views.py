@@ -5,7 +5,8 @@ from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
 
-from api.club.models import ClubApply, Generation
+from api.club import serializers as sz
+from api.club.models import ClubApply, Generation, Member
 from api.club.services.club_service import ClubService
 from api.club.tests.club_test_utils import ClubTestUtils
 from common.exceptions import ErrorCode
@@ -117,6 +118,43 @@ class TestClubListView:
         club_names = [item["club_name"] for item in response.data]
         assert club_names == ["테스트클럽1", "테스트클럽2"]
 
+    def test_list_clubs_query_count(
+        self, authenticated_client, test_users, django_assert_num_queries
+    ):
+        """클럽 수와 관계없이 고정된 쿼리 수로 조회되는지 테스트"""
+        user1 = test_users[0]
+        for i in range(3):
+            club, _ = ClubService.create_club(
+                user=user1,
+                name=f"테스트클럽{i}",
+                image=None,
+                description="테스트 클럽 설명",
+                short_description="테스트 클럽",
+                generation_data={
+                    "name": "1기",
+                    "start_date": date.today() - timedelta(days=365),
+                    "end_date": date.today(),
+                },
+            )
+            ClubService.create_generation(
+                club,
+                {"name": "2기", "start_date": date.today(), "activated": True},
+                user1,
+            )
+
+        members = Member.objects.filter(user=user1).order_by("club__name")
+        expected = sz.ClubInfoSerializer(members, many=True).data
+
+        # 멤버 + 기수 매핑 + 기수 + 클럽 기수 목록
+        with django_assert_num_queries(4):
+            response = authenticated_client.get(reverse("clubs-list"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == expected
+        assert [item["current_generation"]["name"] for item in response.data] == [
+            "2기"
+        ] * 3
+
     def test_list_clubs_empty(self, authenticated_client):
         """클럽이 없을 때 빈 목록 반환 테스트"""
         url = reverse("clubs-list")
@@ -0,0 +1,124 @@
+import pytest
+
+from api.club.services.export_job import ExportJob, ExportJobStatus
+from api.club.services.generation_service import GenerationService
+from api.club.tasks import sync_notion_attendance
+
+GENERATION_ID = 987654
+
+
+@pytest.fixture(autouse=True)
+def clear_export_job_lock():
+    """이전 테스트 실행에서 Redis에 남은 작업 잠금 제거"""
+    redis = ExportJob._redis()
+    for key in redis.scan_iter(ExportJob.LOCK_KEY.format(kind="*", generation_id="*")):
+        redis.delete(key)
+
+
+class TestExportJobLock:
+    """기수별 작업 잠금 테스트"""
+
+    def lock_value(self, generation_id=GENERATION_ID):
+        value = ExportJob._redis().get(ExportJob._lock_key("notion", generation_id))
+        return value.decode() if value is not None else None
+
+    def test_coalesces_running_job(self):
+        """진행 중인 작업이 있으면 그 작업을 반환"""
+        job_id, created = ExportJob.create_exclusive("notion", GENERATION_ID, None)
+        second_id, second_created = ExportJob.create_exclusive(
+            "notion", GENERATION_ID, None
+        )
+
+        assert (created, second_created) == (True, False)
+        assert second_id == job_id
+        assert self.lock_value() == job_id
+
+    def test_replaces_lock_of_expired_job(self):
+        """작업 상태가 만료된 잠금은 새 작업으로 교체"""
+        ExportJob._redis().set(ExportJob._lock_key("notion", GENERATION_ID), "gone")
+
+        job_id, created = ExportJob.create_exclusive("notion", GENERATION_ID, None)
+
+        assert created
+        assert self.lock_value() == job_id
+        assert ExportJob.get(job_id)["status"] == ExportJobStatus.PENDING
+
+    def test_extend_lock(self):
+        """잠금을 가진 작업만 만료 시간을 연장"""
+        job_id, _ = ExportJob.create_exclusive("notion", GENERATION_ID, None)
+        lock_key = ExportJob._lock_key("notion", GENERATION_ID)
+        redis = ExportJob._redis()
+        redis.expire(lock_key, 5)
+
+        assert ExportJob.extend_lock(job_id)
+        assert redis.ttl(lock_key) > 5
+
+        other_id = ExportJob.create("notion", GENERATION_ID, None)
+        assert not ExportJob.extend_lock(other_id)
+        assert self.lock_value() == job_id
+
+    def test_release_keeps_other_lock(self):
+        """다른 작업의 잠금은 해제하지 않음"""
+        job_id, _ = ExportJob.create_exclusive("notion", GENERATION_ID, None)
+        other_id = ExportJob.create("notion", GENERATION_ID, None)
+
+        ExportJob.release(other_id)
+        assert self.lock_value() == job_id
+
+        ExportJob.release(job_id)
+        assert self.lock_value() is None
+
+
+@pytest.mark.django_db
+class TestSyncNotionAttendance:
+    """노션 동기화 작업 테스트"""
+
+    @pytest.mark.parametrize(
+        "error, expected",
+        [(None, ExportJobStatus.DONE), (RuntimeError("boom"), ExportJobStatus.FAILED)],
+    )
+    def test_final_status_before_release(
+        self, mocker, club_with_member, error, expected
+    ):
+        """잠금을 풀기 전에 최종 상태가 기록됨"""
+        club, _ = club_with_member
+        generation = club.current_generation
+        job_id, _ = ExportJob.create_exclusive("notion", generation.id, None)
+        mocker.patch(
+            "api.club.tasks.NotionAttendanceManager.update_attendance_database",
+            side_effect=error,
+        )
+        statuses = []
+        release = mocker.patch.object(
+            ExportJob,
+            "release",
+            side_effect=lambda job_id: statuses.append(ExportJob.get(job_id)["status"]),
+        )
+
+        if error is None:
+            sync_notion_attendance(job_id, generation.id, "database_id")
+        else:
+            with pytest.raises(RuntimeError):
+                sync_notion_attendance(job_id, generation.id, "database_id")
+
+        release.assert_called_once_with(job_id)
+        assert statuses == [expected]
+
+    def test_enqueue_failure_releases_lock(self, mocker, club_with_member):
+        """작업 등록에 실패하면 작업을 실패로 기록하고 잠금을 해제"""
+        club, _ = club_with_member
+        generation = club.current_generation
+        mocker.patch(
+            "api.club.services.generation_service.sync_notion_attendance.delay",
+            side_effect=ConnectionError("broker down"),
+        )
+        create_exclusive = mocker.spy(ExportJob, "create_exclusive")
+
+        with pytest.raises(ConnectionError):
+            GenerationService.update_notion(generation, "database_id")
+
+        job_id, _ = create_exclusive.spy_return
+        assert ExportJob.get(job_id)["status"] == ExportJobStatus.FAILED
+        assert (
+            ExportJob._redis().get(ExportJob._lock_key("notion", generation.id)) is None
+        )
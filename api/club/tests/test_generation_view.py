@@ -2,10 +2,12 @@ from datetime import date, timedelta
 
 import pytest
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework import status
 
 from api.club.models import Generation
-from api.event.models import Event
+from api.club.services.export_job import ExportJob, ExportJobStatus
+from api.event.models import Attendance, AttendanceStatus, Event
 
 
 @pytest.mark.django_db
@@ -80,6 +82,52 @@ class TestGenerationMembersView:
         usernames = [member["member"]["user"]["username"] for member in response.data]
         assert usernames == sorted(usernames)
 
+    def test_generation_members_cursor_pagination(
+        self, authenticated_client, club_with_members, django_assert_num_queries
+    ):
+        """기수 멤버 커서 페이지네이션 테스트"""
+        club, members, gen_members = club_with_members
+        generation = club.current_generation
+        url = reverse("generations-members", kwargs={"pk": generation.id})
+
+        # 기수 + 회원 목록
+        with django_assert_num_queries(2):
+            response = authenticated_client.get(url, {"page_size": 2})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["generation"]["id"] == generation.id
+        first_page = response.data["results"]
+        assert len(first_page) == 2
+        assert "generation" not in first_page[0]
+
+        response = authenticated_client.get(response.data["next"])
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["next"] is None
+        usernames = [
+            row["member"]["user"]["username"]
+            for row in first_page + response.data["results"]
+        ]
+        assert usernames == sorted(usernames)
+        assert len(usernames) == len(set(usernames))
+
+    def test_generation_members_fields(self, authenticated_client, club_with_members):
+        """기수 멤버 필드 선택 테스트"""
+        club, members, gen_members = club_with_members
+        generation = club.current_generation
+
+        url = reverse("generations-members", kwargs={"pk": generation.id})
+        response = authenticated_client.get(
+            url, {"fields": "id,member.user.username,role.name"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        row = response.data["results"][0]
+        assert set(row) == {"id", "member", "role"}
+        assert set(row["member"]) == {"user"}
+        assert set(row["member"]["user"]) == {"username"}
+        assert set(row["role"]) == {"name"}
+
     def test_generation_members_empty(
         self, authenticated_client, test_users, mock_storage
     ):
@@ -211,6 +259,44 @@ class TestGenerationStatsView:
         assert response.status_code == status.HTTP_200_OK
         assert isinstance(response.data, list)
 
+    def test_generation_stats_counts_latest_status(
+        self, authenticated_client, club_with_members
+    ):
+        """이벤트별 최신 출석 상태만 집계되는지 테스트"""
+        club, members, gen_members = club_with_members
+        generation = club.current_generation
+        events = [
+            Event.objects.create(
+                generation=generation,
+                title=f"통계 이벤트 {i}",
+                date=date.today(),
+                start_datetime=timezone.now(),
+                end_datetime=timezone.now() + timedelta(hours=1),
+                start_minutes=0,
+                late_minutes=10,
+                fail_minutes=30,
+                location="테스트 장소",
+            )
+            for i in range(2)
+        ]
+        for status_ in [AttendanceStatus.PRESENT, AttendanceStatus.LATE]:
+            Attendance.objects.create(
+                event=events[0], generation_mapping=gen_members[1], status=status_
+            )
+        Attendance.objects.create(
+            event=events[1],
+            generation_mapping=gen_members[1],
+            status=AttendanceStatus.ABSENT,
+        )
+
+        url = reverse("generations-stats", kwargs={"pk": generation.id})
+        response = authenticated_client.get(url)
+
+        row = next(row for row in response.data if row["id"] == gen_members[1].id)
+        assert row["present_count"] == 0
+        assert row["late_count"] == 1
+        assert row["absent_count"] == 1
+
     def test_generation_stats_not_found(self, authenticated_client):
         """존재하지 않는 기수 통계 조회 실패 테스트"""
         url = reverse("generations-stats", kwargs={"pk": 99999})
@@ -370,7 +456,7 @@ class TestGenerationNotionView:
         assert response.data["notion_database_id"] == "test_database_id"
 
     def test_generation_notion_post_success(
-        self, authenticated_client, club_with_member
+        self, authenticated_client, club_with_member, mock_notion_sync
     ):
         """기수 노션 연동 성공 테스트"""
         club, _ = club_with_member
@@ -381,6 +467,43 @@ class TestGenerationNotionView:
         response = authenticated_client.post(url, data, format="json")
 
         assert response.status_code == status.HTTP_202_ACCEPTED
+        mock_notion_sync.assert_called_once()
+        assert mock_notion_sync.call_args.args[0] == response.data["job_id"]
+        ExportJob.release(response.data["job_id"])
+
+    def test_generation_notion_post_coalesced(
+        self, authenticated_client, club_with_member, mock_notion_sync
+    ):
+        """진행 중인 동기화가 있으면 같은 작업을 반환하고 새로 등록하지 않음"""
+        club, _ = club_with_member
+        generation = club.current_generation
+
+        url = reverse("generations-notion", kwargs={"pk": generation.id})
+        data = {"notion_database_url": "https://notion.so/database/test"}
+        first = authenticated_client.post(url, data, format="json")
+        second = authenticated_client.post(url, data, format="json")
+
+        assert second.status_code == status.HTTP_202_ACCEPTED
+        assert second.data["job_id"] == first.data["job_id"]
+        mock_notion_sync.assert_called_once()
+        ExportJob.release(first.data["job_id"])
+
+    def test_generation_notion_status(self, authenticated_client, club_with_member):
+        """노션 동기화 진행 상황 조회 테스트"""
+        club, _ = club_with_member
+        generation = club.current_generation
+        job_id = ExportJob.create("notion", generation.id, None)
+        ExportJob.update(job_id, status=ExportJobStatus.PROCESSING, done=3, total=10)
+
+        url = reverse(
+            "generations-notion-status", kwargs={"pk": generation.id, "job_id": job_id}
+        )
+        response = authenticated_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["status"] == ExportJobStatus.PROCESSING
+        assert response.data["done"] == 3
+        assert response.data["total"] == 10
 
     def test_generation_notion_post_invalid_data(
         self, authenticated_client, club_with_member
@@ -430,6 +553,62 @@ class TestGenerationExcelView:
         assert response.status_code == status.HTTP_200_OK
         assert "url" in response.data
         assert "attendance.xlsx" in response.data["url"]
+        mock_excel.assert_called_once_with(generation)
+
+    def test_generation_excel_job(
+        self, authenticated_client, club_with_member, mock_excel_job
+    ):
+        """기수 엑셀 생성 작업 등록 테스트"""
+        club, _ = club_with_member
+        generation = club.current_generation
+
+        url = reverse("generations-excel-jobs", kwargs={"pk": generation.id})
+        response = authenticated_client.post(url)
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        job_id = response.data["job_id"]
+        assert response.data["status"] == ExportJobStatus.PENDING
+        mock_excel_job.assert_called_once_with(job_id, generation.id)
+
+    def test_generation_excel_status(
+        self, authenticated_client, club_with_member, settings
+    ):
+        """엑셀 생성 작업 상태 조회 테스트 (완료 시 다운로드 URL)"""
+        club, _ = club_with_member
+        generation = club.current_generation
+        settings.FILE_SERVER_URL = "https://files.test/"
+        job_id = ExportJob.create("excel", generation.id, None)
+        url = reverse(
+            "generations-excel-status", kwargs={"pk": generation.id, "job_id": job_id}
+        )
+
+        response = authenticated_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["status"] == ExportJobStatus.PENDING
+        assert "url" not in response.data
+
+        ExportJob.update(
+            job_id, status=ExportJobStatus.DONE, path="excel/attendance.xlsx"
+        )
+        response = authenticated_client.get(url)
+        assert response.data["status"] == ExportJobStatus.DONE
+        assert response.data["url"] == "https://files.test/excel/attendance.xlsx"
+
+    def test_generation_excel_status_not_found(
+        self, authenticated_client, club_with_member
+    ):
+        """없는 작업 또는 다른 기수의 작업 조회 실패 테스트"""
+        club, _ = club_with_member
+        generation = club.current_generation
+        other_job_id = ExportJob.create("excel", generation.id + 1, None)
+
+        for job_id in ("0" * 32, other_job_id):
+            url = reverse(
+                "generations-excel-status",
+                kwargs={"pk": generation.id, "job_id": job_id},
+            )
+            response = authenticated_client.get(url)
+            assert response.status_code == status.HTTP_404_NOT_FOUND
 
     def test_generation_excel_not_found(self, authenticated_client, mock_excel):
         """존재하지 않는 기수 엑셀 생성 실패 테스트"""
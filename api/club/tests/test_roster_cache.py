@@ -0,0 +1,87 @@
+import pytest
+
+from api.club.models import GenMember
+from api.club.services.apply_service import ApplyService
+from api.club.services.gen_member_service import GenMemberService
+from api.club.services.roster_cache import RosterCache
+
+
+@pytest.fixture(autouse=True)
+def clear_roster_cache():
+    """이전 테스트 실행에서 Redis에 남은 명단 캐시 제거"""
+    redis = RosterCache._redis()
+    for key in redis.scan_iter(RosterCache.KEY.format(generation_id="*")):
+        redis.delete(key)
+
+
+@pytest.mark.django_db
+class TestRosterCache:
+    """기수 명단 캐시 테스트"""
+
+    def test_resolve_member_and_applicant(self, club_with_members, test_users):
+        """멤버는 gen_member_id, 신청자/비회원은 None으로 조회"""
+        club, members, gen_members = club_with_members
+        generation_id = club.current_generation.id
+
+        assert RosterCache.resolve(generation_id, test_users[1].id) == (
+            gen_members[1].id,
+            False,
+        )
+        assert RosterCache.resolve(generation_id, test_users[4].id) == (None, False)
+
+    def test_resolve_pending_applicant(self, generation_with_apply, test_users):
+        """승인 대기 중인 신청자 조회"""
+        generation, _ = generation_with_apply
+
+        assert RosterCache.resolve(generation.id, test_users[1].id) == (None, True)
+
+    def test_join_generation_invalidates(
+        self, generation_with_apply, test_users, django_capture_on_commit_callbacks
+    ):
+        """가입 승인 후 명단 캐시에 반영"""
+        generation, applies = generation_with_apply
+        RosterCache.resolve(generation.id, test_users[1].id)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            _, gen_member = ApplyService.join_generation(test_users[1], generation)
+
+        assert RosterCache.resolve(generation.id, test_users[1].id)[0] == (
+            gen_member.id
+        )
+
+    def test_delete_gen_member_invalidates(
+        self, club_with_members, test_users, django_capture_on_commit_callbacks
+    ):
+        """기수 멤버 삭제 후 명단 캐시에서 제거"""
+        club, _, gen_members = club_with_members
+        generation_id = club.current_generation.id
+        RosterCache.resolve(generation_id, test_users[1].id)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            GenMemberService.delete_gen_member(gen_members[1])
+
+        assert RosterCache.resolve(generation_id, test_users[1].id) == (None, False)
+
+    def test_build_skips_roster_changed_while_reading(
+        self, club_with_members, test_users, mocker
+    ):
+        """명단을 읽는 사이 무효화되면 캐시에 쓰지 않고 DB에서 조회"""
+        club, _, gen_members = club_with_members
+        generation_id = club.current_generation.id
+        redis = RosterCache._redis()
+        filter_gen_members = GenMember.objects.filter
+
+        def filter_and_invalidate(*args, **kwargs):
+            redis.incr(RosterCache._version_key(generation_id))
+            return filter_gen_members(*args, **kwargs)
+
+        mocker.patch.object(
+            GenMember.objects, "filter", side_effect=filter_and_invalidate
+        )
+
+        assert RosterCache.build(generation_id) is None
+        assert not redis.exists(RosterCache._key(generation_id))
+        assert RosterCache.resolve(generation_id, test_users[1].id) == (
+            gen_members[1].id,
+            False,
+        )
@@ -16,6 +16,8 @@ class ClubView(ModelViewSet):
     permission_classes = [IsAuthenticatedCustom]
 
     def get_queryset(self):
+        if self.action == "list":
+            return ClubService.get_user_clubs(self.request.user)
         return Member.objects.filter(
             user=self.request.user, club__deleted=False
         ).order_by("club__name")
@@ -1,5 +1,5 @@
-import os
-
+from django.conf import settings
+from django.db.models import Count, F
 from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -13,14 +13,20 @@ from api.club.serializers.generation_serializers import (
     GenerationStatsSerializer,
     NotionIdSerializer,
 )
-from api.club.serializers.member_serializers import (
-    GenerationMappingSerializer,
-)
+from api.club.serializers.member_serializers import GenerationMemberSerializer
+from api.club.services.export_job import ExportJob, ExportJobStatus
 from api.club.services.generation_service import GenerationService
+from api.club.tasks import export_attendance_excel
 from api.event.models import Event
 from api.event.serializers.event_serializer import EventSerializer
+from api.event.service.event_service import EventService
+from common.exceptions import CustomException, ErrorCode
+from common.pagination import DefaultCursorPagination
+from common.responses.streaming_response import StreamingJSONResponse
+from common.serializers.field_projection import parse_fields, restrict_fields
 from common.utils.excel import create_attendance_excel
 from common.utils.google_sheet import create_attendance_sheet
+from common.utils.query_count import report_query_count
 
 
 class GenerationView(
@@ -30,6 +36,11 @@ class GenerationView(
 ):
     queryset = Generation.objects.all()
 
+    def get_queryset(self):
+        if self.action == "members":
+            return self.queryset.annotate(gen_member_count=Count("gen_members"))
+        return super().get_queryset()
+
     def get_serializer_class(self):
         if self.action == "apply":
             return ClubApplySerializer
@@ -45,15 +56,61 @@ class GenerationView(
         return Response(serializer.data, status=status.HTTP_200_OK)
 
     @action(detail=True, methods=["get"])
+    @report_query_count
     def members(self, request, *args, **kwargs):
-        """기수별 회원 정보"""
-        members = GenMember.objects.filter(generation=self.get_object()).order_by(
-            "member__user__username"
+        """
+        기수별 회원 정보
+
+        cursor, page_size, fields 쿼리 파라미터 중 하나라도 있으면
+        {generation, next, previous, results} 형식으로 기수 정보는 한 번만 내려주고
+        회원 목록은 커서 페이지네이션과 필드 선택(?fields=id,member.user.username)을 적용
+        """
+        generation = self.get_object()
+        members = GenMember.objects.filter(generation=generation).select_related(
+            "member__user", "role"
+        )
+        generation_data = GenerationInfoSerializer(generation).data
+
+        params = request.query_params
+        if not {"cursor", "page_size", "fields"} & params.keys():
+            # 기존 형식: 회원마다 같은 기수 정보를 포함
+            rows = GenerationMemberSerializer(
+                members.order_by("member__user__username"), many=True
+            ).data
+            return Response(
+                [
+                    {
+                        "id": row["id"],
+                        "generation": generation_data,
+                        "role": row["role"],
+                        "member": row["member"],
+                    }
+                    for row in rows
+                ],
+                status=status.HTTP_200_OK,
+            )
+
+        paginator = DefaultCursorPagination()
+        paginator.ordering = ("username", "id")
+        page = paginator.paginate_queryset(
+            members.annotate(username=F("member__user__username")), request, view=self
+        )
+        serializer = restrict_fields(
+            GenerationMemberSerializer(page, many=True),
+            parse_fields(params.get("fields")),
+        )
+        return Response(
+            {
+                "generation": generation_data,
+                "next": paginator.get_next_link(),
+                "previous": paginator.get_previous_link(),
+                "results": serializer.data,
+            },
+            status=status.HTTP_200_OK,
         )
-        serializer = GenerationMappingSerializer(members, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
 
     @action(detail=True, methods=["get"])
+    @report_query_count
     def events(self, request, *args, **kwargs):
         """
         /clubs/generations/<generation_id>/events/
@@ -62,16 +119,34 @@ class GenerationView(
         events = Event.objects.filter(generation=self.get_object()).order_by(
             "-start_datetime"
         )
-        serializer = EventSerializer(events, context={"user": request.user}, many=True)
+        serializer = EventSerializer(
+            events,
+            context={
+                "user": request.user,
+                "attendance_status_map": EventService.get_attendance_status_map(
+                    events, request.user
+                ),
+            },
+            many=True,
+        )
         return Response(serializer.data, status=status.HTTP_200_OK)
 
     @action(detail=True, methods=["get"])
     def stats(self, request, *args, **kwargs):
-        """기수 출석 통계"""
+        """
+        기수 출석 통계
+        ?stream=1이면 멤버별 통계를 한 행씩 스트리밍
+        """
         generation = self.get_object()
 
         # Get all generation mappings and their members
         stats = GenerationService.get_generation_stats(generation.id)
+        if StreamingJSONResponse.is_requested(request):
+            serializer = GenerationStatsSerializer()
+            return StreamingJSONResponse(
+                serializer.to_representation(gen_member)
+                for gen_member in stats.iterator(chunk_size=500)
+            )
         serializer = GenerationStatsSerializer(stats, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -121,9 +196,64 @@ class GenerationView(
 
     @action(detail=True, methods=["get"], url_path="stats/excel")
     def excel(self, request, *args, **kwargs):
-        """엑셀 연동"""
+        """엑셀 연동 (생성이 끝나면 다운로드 URL 반환)"""
         generation = self.get_object()
         file_path = create_attendance_excel(generation)
         return Response(
-            {"url": os.getenv("FILE_SERVER_URL") + file_path}, status=status.HTTP_200_OK
+            {"url": settings.FILE_SERVER_URL + file_path}, status=status.HTTP_200_OK
         )
+
+    @action(detail=True, methods=["post"], url_path="stats/excel/jobs")
+    def excel_jobs(self, request, *args, **kwargs):
+        """
+        엑셀 생성 작업 등록
+
+        파일은 백그라운드 작업으로 생성되며, 반환된 job_id로
+        stats/excel/jobs/{job_id}를 조회해 다운로드 URL을 받습니다.
+        """
+        generation = self.get_object()
+        job_id = ExportJob.create("excel", generation.id, request.user.id)
+        export_attendance_excel.delay(job_id, generation.id)
+        return Response(
+            {"job_id": job_id, "status": ExportJobStatus.PENDING},
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+    @action(
+        detail=True,
+        methods=["get"],
+        url_path=r"stats/excel/jobs/(?P<job_id>[0-9a-f]{32})",
+    )
+    def excel_status(self, request, job_id=None, *args, **kwargs):
+        """엑셀 생성 작업 상태 (완료 시 다운로드 URL 포함)"""
+        job = self._get_export_job(job_id, "excel")
+
+        data = {"job_id": job_id, "status": job["status"]}
+        if job["status"] == ExportJobStatus.DONE:
+            data["url"] = settings.FILE_SERVER_URL + job["path"]
+        return Response(data, status=status.HTTP_200_OK)
+
+    @action(
+        detail=True,
+        methods=["get"],
+        url_path=r"stats/notion/(?P<job_id>[0-9a-f]{32})",
+    )
+    def notion_status(self, request, job_id=None, *args, **kwargs):
+        """노션 동기화 작업 상태 (반영한 행 수/전체 행 수)"""
+        job = self._get_export_job(job_id, "notion")
+        return Response(
+            {
+                "job_id": job_id,
+                "status": job["status"],
+                "done": job.get("done", 0),
+                "total": job.get("total"),
+            },
+            status=status.HTTP_200_OK,
+        )
+
+    def _get_export_job(self, job_id: str, kind: str) -> dict:
+        generation = self.get_object()
+        job = ExportJob.get(job_id)
+        if job is None or job["generation_id"] != generation.id or job["kind"] != kind:
+            raise CustomException(ErrorCode.EXPORT_JOB_NOT_FOUND)
+        return job
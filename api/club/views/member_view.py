@@ -12,6 +12,7 @@ from api.club.serializers.member_serializers import (
     MemberSerializer,
     TagUpdateRequestSerializer,
 )
+from api.club.services.roster_cache import RosterCache
 
 
 class MemberView(ModelViewSet):
@@ -38,6 +39,7 @@ class MemberView(ModelViewSet):
         )
         user_generation.role = requested_role
         user_generation.save()
+        RosterCache.invalidate(user_generation.generation_id)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
     @action(detail=True, methods=["put", "delete"], url_path="tag", url_name="tag")
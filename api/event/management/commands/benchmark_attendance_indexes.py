@@ -0,0 +1,247 @@
+import json
+import random
+import statistics
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from api.club.models import Club, Generation, GenMember, Member
+from api.event.models import Attendance, AttendanceStatus, AttendanceType, Event
+from api.userapp.models import User
+from api.userapp.models.user_meta import Platform, UniqueToken
+
+
+class Command(BaseCommand):
+    help = (
+        "대량의 가상 출석 데이터를 만들어 attendances 인덱스 적용 전/후의 "
+        "EXPLAIN ANALYZE 실행 시간을 비교합니다. 측정은 같은 DB 서버에 만든 임시 DB에서 "
+        "하고 끝나면 삭제합니다. DEBUG가 아니면 --i-know-this-locks가 필요합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--events",
+            type=int,
+            default=200,
+            help="생성할 이벤트 수 (기본값: 200)",
+        )
+        parser.add_argument(
+            "--members",
+            type=int,
+            default=300,
+            help="생성할 기수 멤버 수 (기본값: 300)",
+        )
+        parser.add_argument(
+            "--history",
+            type=int,
+            default=3,
+            help="멤버/이벤트별 출석 기록 수 (기본값: 3)",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="쿼리별 반복 측정 횟수, 중앙값을 사용 (기본값: 5)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="bulk_create 배치 크기 (기본값: 5000)",
+        )
+        parser.add_argument(
+            "--i-know-this-locks",
+            action="store_true",
+            help=(
+                "DEBUG가 아닌 환경에서도 실행 (임시 DB 생성과 대량 삽입으로 "
+                "같은 DB 서버에 부하와 잠금이 생김)"
+            ),
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError("PostgreSQL에서만 실행할 수 있습니다.")
+        if not (settings.DEBUG or options["i_know_this_locks"]):
+            raise CommandError(
+                "운영 DB 서버에 부하를 주므로 DEBUG 환경에서만 실행합니다. "
+                "그래도 실행하려면 --i-know-this-locks를 추가하세요."
+            )
+
+        # 인덱스를 DROP하는 동안 실제 테이블이 잠기지 않도록 임시 DB에서 측정
+        old_name = connection.settings_dict["NAME"]
+        test_settings = connection.settings_dict["TEST"]
+        old_test_name = test_settings.get("NAME")
+        test_settings["NAME"] = f"{old_name}_benchmark"
+        self.stdout.write(f"임시 DB({test_settings['NAME']})를 만듭니다...")
+        connection.creation.create_test_db(
+            verbosity=0, autoclobber=True, serialize=False
+        )
+        try:
+            before, after = self.run_benchmark(options)
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            test_settings["NAME"] = old_test_name
+
+        self.print_report(before, after)
+
+    def run_benchmark(self, options):
+        index_names = [index.name for index in Attendance._meta.indexes]
+
+        with transaction.atomic():
+            self.stdout.write("가상 데이터를 생성합니다...")
+            event, gen_member, unique_token = self.seed(options)
+            with connection.cursor() as cursor:
+                cursor.execute(f"ANALYZE {Attendance._meta.db_table}")
+
+            queries = self.get_queries(event, gen_member, unique_token)
+
+            # 인덱스를 지운 상태(적용 전)를 세이브포인트 안에서 측정 후 되돌림
+            with transaction.atomic():
+                with connection.cursor() as cursor:
+                    for name in index_names:
+                        cursor.execute(
+                            f"DROP INDEX IF EXISTS {connection.ops.quote_name(name)}"
+                        )
+                before = self.measure(queries, options["repeat"])
+                transaction.set_rollback(True)
+
+            after = self.measure(queries, options["repeat"])
+            transaction.set_rollback(True)
+
+        return before, after
+
+    def seed(self, options):
+        events_count = options["events"]
+        members_count = options["members"]
+        history = options["history"]
+        batch_size = options["batch_size"]
+        now = timezone.now()
+
+        club = Club.objects.create(name="[benchmark] attendance indexes")
+        generation = Generation.objects.create(
+            club=club, name="benchmark", start_date=now.date()
+        )
+
+        users = User.objects.bulk_create(
+            [
+                User(identifier=f"benchmark-{i}", username=f"benchmark-{i}")
+                for i in range(members_count)
+            ],
+            batch_size=batch_size,
+        )
+        members = Member.objects.bulk_create(
+            [Member(user=user, club=club) for user in users], batch_size=batch_size
+        )
+        gen_members = GenMember.objects.bulk_create(
+            [GenMember(member=member, generation=generation) for member in members],
+            batch_size=batch_size,
+        )
+        unique_tokens = UniqueToken.objects.bulk_create(
+            [
+                UniqueToken(
+                    user=user, token=f"benchmark-{user.id}", platform=Platform.UNKNOWN
+                )
+                for user in users
+            ],
+            batch_size=batch_size,
+        )
+        events = Event.objects.bulk_create(
+            [
+                Event(
+                    generation=generation,
+                    title=f"benchmark-{i}",
+                    date=(now - timedelta(days=i)).date(),
+                    start_datetime=now - timedelta(days=i),
+                    end_datetime=now - timedelta(days=i) + timedelta(hours=2),
+                    start_minutes=-10,
+                    late_minutes=10,
+                    fail_minutes=30,
+                    location="benchmark",
+                    attendance_type=AttendanceType.QR,
+                )
+                for i in range(events_count)
+            ],
+            batch_size=batch_size,
+        )
+
+        rng = random.Random(events_count * members_count)
+        statuses = list(AttendanceStatus.values)
+        attendances = []
+        for event in events:
+            for gen_member, unique_token in zip(gen_members, unique_tokens):
+                for h in range(history):
+                    attendances.append(
+                        Attendance(
+                            event=event,
+                            generation_mapping=gen_member,
+                            status=rng.choice(statuses),
+                            is_modified=h > 0,
+                            unique_token=unique_token if h == 0 else None,
+                        )
+                    )
+            if len(attendances) >= batch_size:
+                Attendance.objects.bulk_create(attendances, batch_size=batch_size)
+                attendances = []
+        Attendance.objects.bulk_create(attendances, batch_size=batch_size)
+
+        total = events_count * members_count * history
+        self.stdout.write(f"출석 기록 {total}건 생성 완료")
+
+        middle = len(gen_members) // 2
+        return events[len(events) // 2], gen_members[middle], unique_tokens[middle]
+
+    def get_queries(self, event, gen_member, unique_token):
+        """서비스 코드에서 자주 실행되는 출석 조회 쿼리"""
+        return {
+            "latest_attendance": Attendance.objects.filter(
+                event=event, generation_mapping=gen_member
+            ).order_by("-created_at")[:1],
+            "member_log": Attendance.objects.filter(
+                event=event, generation_mapping=gen_member, is_modified=True
+            ).order_by("-created_at")[:1],
+            "unchecked": Attendance.objects.filter(
+                event=event, status=AttendanceStatus.UNCHECKED
+            ).values_list("generation_mapping_id", flat=True),
+            "duplicated_token": Attendance.objects.filter(
+                event=event, unique_token=unique_token
+            ).exclude(generation_mapping=gen_member)[:1],
+        }
+
+    def measure(self, queries, repeat):
+        results = {}
+        for name, queryset in queries.items():
+            timings = []
+            for _ in range(repeat):
+                explain = json.loads(queryset.explain(analyze=True, format="json"))[0]
+                timings.append(explain["Execution Time"])
+            results[name] = (statistics.median(timings), self.get_scan(explain["Plan"]))
+        return results
+
+    def get_scan(self, plan):
+        """attendances 테이블을 읽는 노드의 스캔 방식"""
+        if plan.get("Relation Name") == Attendance._meta.db_table:
+            if "Index Name" in plan:
+                return f"{plan['Node Type']} ({plan['Index Name']})"
+            return plan["Node Type"]
+        for child in plan.get("Plans", []):
+            scan = self.get_scan(child)
+            if scan:
+                return scan
+        return None
+
+    def print_report(self, before, after):
+        self.stdout.write("")
+        self.stdout.write(
+            f"{'query':<20} {'before(ms)':>12} {'after(ms)':>12} {'speedup':>9}"
+        )
+        for name, (before_time, before_scan) in before.items():
+            after_time, after_scan = after[name]
+            speedup = before_time / after_time if after_time else float("inf")
+            self.stdout.write(
+                f"{name:<20} {before_time:>12.3f} {after_time:>12.3f} {speedup:>8.1f}x"
+            )
+            self.stdout.write(f"  {before_scan} -> {after_scan}")
+        self.stdout.write(self.style.SUCCESS("\n측정 완료 (임시 DB는 삭제됨)"))
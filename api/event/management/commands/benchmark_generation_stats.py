@@ -0,0 +1,216 @@
+import random
+import statistics
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import (
+    Case,
+    Count,
+    DurationField,
+    ExpressionWrapper,
+    F,
+    IntegerField,
+    OuterRef,
+    Subquery,
+    Value,
+    When,
+)
+from django.utils import timezone
+
+from api.club.models import Club, Generation, GenMember, Member
+from api.club.services.generation_service import GenerationService
+from api.event.models import (
+    Attendance,
+    AttendanceCurrent,
+    AttendanceStatus,
+    AttendanceType,
+    Event,
+)
+from api.userapp.models import User
+
+STAT_FIELDS = ["id", "present_count", "late_count", "absent_count"]
+
+
+def legacy_generation_stats(generation_id: int):
+    """기존 구현: 상태별로 "최신 출석" 상관 서브쿼리를 조인된 출석 기록마다 실행"""
+
+    def count_status(status):
+        return Count(
+            Case(
+                When(
+                    attendances__created_at=Subquery(
+                        Attendance.objects.filter(
+                            generation_mapping=OuterRef("id"),
+                            event=OuterRef("attendances__event"),
+                        )
+                        .order_by("-created_at")
+                        .values("created_at")[:1]
+                    ),
+                    attendances__status=status,
+                    then=1,
+                ),
+                output_field=IntegerField(),
+            )
+        )
+
+    return (
+        GenMember.objects.filter(generation_id=generation_id)
+        .select_related("member__user")
+        .annotate(
+            present_count=count_status(AttendanceStatus.PRESENT),
+            late_count=count_status(AttendanceStatus.LATE),
+            absent_count=count_status(AttendanceStatus.ABSENT),
+            member_name=F("member__user__username"),
+        )
+        .order_by("member_name")
+    )
+
+
+class Command(BaseCommand):
+    help = (
+        "대량의 가상 출석 이력을 만들어 기수 출석 통계 쿼리의 기존/현재 구현 "
+        "실행 시간과 결과를 비교합니다. (모든 변경은 롤백됩니다)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--events",
+            type=int,
+            default=50,
+            help="생성할 이벤트 수 (기본값: 50)",
+        )
+        parser.add_argument(
+            "--members",
+            type=int,
+            default=100,
+            help="생성할 기수 멤버 수 (기본값: 100)",
+        )
+        parser.add_argument(
+            "--history",
+            type=int,
+            default=3,
+            help="멤버/이벤트별 출석 기록 수 (기본값: 3)",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=3,
+            help="구현별 반복 측정 횟수, 중앙값을 사용 (기본값: 3)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="bulk_create 배치 크기 (기본값: 5000)",
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError("PostgreSQL에서만 실행할 수 있습니다.")
+
+        with transaction.atomic():
+            self.stdout.write("가상 데이터를 생성합니다...")
+            generation = self.seed(options)
+            with connection.cursor() as cursor:
+                cursor.execute(f"ANALYZE {Attendance._meta.db_table}")
+                cursor.execute(f"ANALYZE {AttendanceCurrent._meta.db_table}")
+
+            before, before_rows = self.measure(
+                legacy_generation_stats, generation.id, options["repeat"]
+            )
+            after, after_rows = self.measure(
+                GenerationService.get_generation_stats, generation.id, options["repeat"]
+            )
+            transaction.set_rollback(True)
+
+        self.stdout.write("")
+        self.stdout.write(f"기존  : {before * 1000:>10.1f} ms")
+        self.stdout.write(f"현재  : {after * 1000:>10.1f} ms")
+        self.stdout.write(f"speedup: {before / after:.1f}x")
+        if before_rows == after_rows:
+            self.stdout.write(self.style.SUCCESS("두 구현의 통계가 같습니다."))
+        else:
+            self.stdout.write(self.style.ERROR("두 구현의 통계가 다릅니다."))
+
+    def seed(self, options) -> Generation:
+        events_count = options["events"]
+        members_count = options["members"]
+        batch_size = options["batch_size"]
+        now = timezone.now()
+
+        club = Club.objects.create(name="[benchmark] generation stats")
+        generation = Generation.objects.create(
+            club=club, name="benchmark", start_date=now.date()
+        )
+        users = User.objects.bulk_create(
+            [
+                User(identifier=f"benchmark-{i}", username=f"benchmark-{i}")
+                for i in range(members_count)
+            ],
+            batch_size=batch_size,
+        )
+        members = Member.objects.bulk_create(
+            [Member(user=user, club=club) for user in users], batch_size=batch_size
+        )
+        gen_members = GenMember.objects.bulk_create(
+            [GenMember(member=member, generation=generation) for member in members],
+            batch_size=batch_size,
+        )
+        events = Event.objects.bulk_create(
+            [
+                Event(
+                    generation=generation,
+                    title=f"benchmark-{i}",
+                    date=(now - timedelta(days=i)).date(),
+                    start_datetime=now - timedelta(days=i),
+                    end_datetime=now - timedelta(days=i) + timedelta(hours=2),
+                    start_minutes=-10,
+                    late_minutes=10,
+                    fail_minutes=30,
+                    location="benchmark",
+                    attendance_type=AttendanceType.QR,
+                )
+                for i in range(events_count)
+            ],
+            batch_size=batch_size,
+        )
+
+        rng = random.Random(events_count * members_count)
+        statuses = list(AttendanceStatus.values)
+        Attendance.objects.bulk_create(
+            [
+                Attendance(
+                    event=event,
+                    generation_mapping=gen_member,
+                    status=rng.choice(statuses),
+                    is_modified=h > 0,
+                )
+                for event in events
+                for gen_member in gen_members
+                for h in range(rng.randint(0, options["history"]))
+            ],
+            batch_size=batch_size,
+        )
+        # created_at(auto_now_add)이 같은 기록이 없도록 id 순서대로 벌려 둠
+        attendances = Attendance.objects.filter(event__generation=generation)
+        attendances.update(
+            created_at=F("created_at")
+            + ExpressionWrapper(
+                F("id") * Value(timedelta(microseconds=1)),
+                output_field=DurationField(),
+            )
+        )
+        AttendanceCurrent.sync(attendances)
+
+        self.stdout.write(f"출석 기록 {attendances.count()}건 생성 완료")
+        return generation
+
+    def measure(self, get_stats, generation_id, repeat):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            rows = list(get_stats(generation_id).values_list(*STAT_FIELDS))
+            timings.append(time.perf_counter() - started)
+        return statistics.median(timings), rows
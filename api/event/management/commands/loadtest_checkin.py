@@ -0,0 +1,231 @@
+import json
+import statistics
+import time
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from types import SimpleNamespace
+from unittest import mock
+
+import requests
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import Client
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import AccessToken
+
+from api.club.models import Club
+from api.club.services.roster_cache import RosterCache
+from api.event.service.checkin_queue import CheckInQueue
+from api.userapp.models import User
+from common.test_utils.entity_creator import EntityCreator
+from common.utils.code_generator import HashTimeGenerator
+from common.utils.query_count import QueryCounter
+
+
+class Command(BaseCommand):
+    help = (
+        "클럽 전체가 동시에 QR 출석하는 상황을 재현해 처리량, 지연 시간, 에러, "
+        "쿼리 수를 측정합니다. (프로세스 내 요청은 FCM을 로컬 스텁으로 대체하며, "
+        "--base-url로 보낸 요청은 대상 서버가 실제 FCM으로 전송)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--members",
+            type=int,
+            default=100,
+            help="동시에 출석할 멤버 수 (기본값: 100)",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=20,
+            help="동시 요청 스레드 수 (기본값: 20)",
+        )
+        parser.add_argument(
+            "--base-url",
+            help="실행 중인 서버로 요청 (예: http://localhost:8000), "
+            "지정하지 않으면 프로세스 내에서 요청. FCM 스텁은 이 프로세스에만 "
+            "적용되므로 대상 서버는 실제 푸시 알림을 보냄",
+        )
+        parser.add_argument(
+            "--keep-data",
+            action="store_true",
+            help="측정 후 생성한 클럽/유저를 삭제하지 않음",
+        )
+
+    def handle(self, *args, **options):
+        if options["base_url"]:
+            self.stdout.write(
+                self.style.WARNING(
+                    "--base-url 대상 서버에서는 FCM이 스텁되지 않아 "
+                    "생성한 테스트 유저에게 실제 푸시 알림이 전송될 수 있습니다."
+                )
+            )
+        with self.stub_fcm() as pushes:
+            self.stdout.write(f"{options['members']}명의 테스트 클럽을 생성합니다...")
+            creator = self.seed(options["members"])
+            event = creator.events[0]
+            try:
+                path = reverse("event-attendance", kwargs={"event_id": event.id})
+                users = creator.users[1:]
+                tokens = [str(AccessToken.for_user(user)) for user in users]
+
+                self.stdout.write(
+                    f"{len(users)}건의 출석 요청을 {options['concurrency']}개 스레드로 전송합니다..."
+                )
+                started = time.perf_counter()
+                with ThreadPoolExecutor(max_workers=options["concurrency"]) as pool:
+                    results = list(
+                        pool.map(
+                            lambda args: self.check_in(
+                                options["base_url"], path, event, *args
+                            ),
+                            enumerate(tokens),
+                        )
+                    )
+                elapsed = time.perf_counter() - started
+
+                drain_elapsed = None
+                if settings.ATTENDANCE_WRITE_BEHIND and not options["base_url"]:
+                    drain_started = time.perf_counter()
+                    CheckInQueue.drain(batch_size=settings.CHECKIN_STREAM_BATCH_SIZE)
+                    drain_elapsed = time.perf_counter() - drain_started
+            finally:
+                if not options["keep_data"]:
+                    self.cleanup(creator)
+
+        # --base-url이면 대상 서버의 푸시는 집계할 수 없음
+        push_count = None if options["base_url"] else len(pushes)
+        self.print_report(results, elapsed, drain_elapsed, push_count)
+
+    @contextmanager
+    def stub_fcm(self):
+        """firebase 전송을 로컬 스텁으로 대체하고 전송 요청을 기록"""
+        pushes = []
+
+        def send(message, *args, **kwargs):
+            pushes.append(message)
+            return "loadtest"
+
+        def send_each_for_multicast(message, *args, **kwargs):
+            pushes.append(message)
+            return SimpleNamespace(
+                success_count=len(message.tokens), failure_count=0, responses=[]
+            )
+
+        with mock.patch.multiple(
+            "firebase_admin.messaging",
+            send=send,
+            send_each_for_multicast=send_each_for_multicast,
+        ):
+            yield pushes
+
+    def seed(self, members_count):
+        suffix = uuid.uuid4().hex[:8]
+        creator = EntityCreator()
+        creator.create_club(
+            club_name=f"loadtest-{suffix}",
+            user_name=f"loadtest-{suffix}-owner",
+            with_image=False,
+        )
+        creator.create_members(
+            user_count=members_count,
+            with_image=False,
+            username_prefix=f"loadtest-{suffix}-",
+        )
+        creator.create_event(with_image=False)
+        return creator
+
+    def cleanup(self, creator):
+        RosterCache.invalidate(creator.generation.id)
+        # Club/Generation은 soft delete이므로 queryset delete로 실제 삭제
+        Club.objects.filter(id=creator.club.id).delete()
+        User.objects.filter(id__in=[user.id for user in creator.users]).delete()
+
+    def check_in(self, base_url, path, event, index, token):
+        payload = {
+            "qr_code": HashTimeGenerator.generate_code(
+                event.qr_code, HashTimeGenerator.get_current_time_in_seconds()
+            ),
+            "latitude": 37.5665,
+            "longitude": 126.978,
+            "device_id": f"loadtest-device-{index}",
+        }
+        headers = {"Authorization": f"Bearer {token}"}
+
+        if base_url:
+            started = time.perf_counter()
+            response = requests.post(
+                f"{base_url.rstrip('/')}{path}", json=payload, headers=headers
+            )
+            latency = time.perf_counter() - started
+            return latency, response.status_code, response.content, None
+
+        client = Client(HTTP_HOST=self.get_host())
+        counter = QueryCounter()
+        with connection.execute_wrapper(counter):
+            started = time.perf_counter()
+            response = client.post(
+                path,
+                payload,
+                content_type="application/json",
+                headers=headers,
+            )
+            latency = time.perf_counter() - started
+        return latency, response.status_code, response.content, counter.count
+
+    def get_host(self):
+        for host in settings.ALLOWED_HOSTS:
+            if host and host != "*":
+                return host.lstrip(".")
+        return "localhost"
+
+    def get_error(self, status_code, content):
+        try:
+            body = json.loads(content)
+            return f"{status_code} {body.get('code') or body.get('message')}"
+        except (ValueError, AttributeError):
+            return f"{status_code}"
+
+    def print_report(self, results, elapsed, drain_elapsed, push_count):
+        latencies = [latency * 1000 for latency, _, _, _ in results]
+        errors = Counter(
+            self.get_error(status_code, content)
+            for _, status_code, content, _ in results
+            if status_code >= 400
+        )
+        query_counts = [count for _, _, _, count in results if count is not None]
+
+        self.stdout.write("")
+        self.stdout.write(f"요청 수        : {len(results)}")
+        self.stdout.write(f"총 소요 시간   : {elapsed:.2f}s")
+        self.stdout.write(f"처리량         : {len(results) / elapsed:.1f} req/s")
+        if len(latencies) > 1:
+            percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+            self.stdout.write(
+                f"지연 시간 (ms) : p50 {percentiles[49]:.1f} / "
+                f"p95 {percentiles[94]:.1f} / p99 {percentiles[98]:.1f} / "
+                f"max {max(latencies):.1f}"
+            )
+        if query_counts:
+            self.stdout.write(
+                f"요청당 쿼리 수 : 평균 {statistics.mean(query_counts):.1f} / "
+                f"최대 {max(query_counts)}"
+            )
+        if drain_elapsed is not None:
+            self.stdout.write(f"큐 저장 시간   : {drain_elapsed:.2f}s")
+        if push_count is None:
+            self.stdout.write("FCM 스텁 호출  : 스텁 안 됨 (대상 서버가 실제로 전송)")
+        else:
+            self.stdout.write(f"FCM 스텁 호출  : {push_count}")
+
+        if errors:
+            self.stdout.write(self.style.WARNING(f"에러 {sum(errors.values())}건"))
+            for error, count in errors.most_common():
+                self.stdout.write(f"  {error}: {count}")
+        else:
+            self.stdout.write(self.style.SUCCESS("에러 없음"))
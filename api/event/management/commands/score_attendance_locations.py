@@ -0,0 +1,90 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from api.event.models import Attendance, Event
+from api.event.models.abusing import Abusing
+from common.utils.geofence import Geofence, score_outliers
+
+
+class Command(BaseCommand):
+    help = (
+        "이벤트의 QR 출석 위치를 한 번에 분석해 GPS 이상치와 영역 밖 출석을 찾습니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("event_id", type=int, help="분석할 이벤트 ID")
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=3.5,
+            help="이상치로 판단할 robust z-score 기준 (기본값: 3.5)",
+        )
+        parser.add_argument(
+            "--record",
+            action="store_true",
+            help="이상치로 판단된 출석을 Abusing으로 기록",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            event = Event.objects.get(id=options["event_id"])
+        except Event.DoesNotExist:
+            raise CommandError("존재하지 않는 이벤트입니다.")
+
+        # 관리자 수정 기록을 제외한 실제 출석 요청의 좌표
+        rows = list(
+            Attendance.objects.filter(
+                event=event,
+                is_modified=False,
+                latitude__isnull=False,
+                longitude__isnull=False,
+            ).values_list(
+                "id",
+                "latitude",
+                "longitude",
+                "generation_mapping__member__user__username",
+            )
+        )
+        if not rows:
+            self.stdout.write("위치 정보가 있는 출석 기록이 없습니다.")
+            return
+
+        ids, latitudes, longitudes, usernames = zip(*rows)
+        scores = score_outliers(latitudes, longitudes)
+        geofence = Geofence.from_event(event)
+        inside = (
+            geofence.contains_many(latitudes, longitudes)
+            if geofence is not None
+            else [True] * len(rows)
+        )
+
+        flagged = []
+        for i, attendance_id in enumerate(ids):
+            reasons = []
+            if scores[i] > options["threshold"]:
+                reasons.append(f"GPS 이상치 (score {scores[i]:.1f})")
+            if not inside[i]:
+                reasons.append("출석 영역 밖")
+            if reasons:
+                flagged.append((attendance_id, usernames[i], ", ".join(reasons)))
+                self.stdout.write(
+                    f"{attendance_id} {usernames[i]} "
+                    f"({latitudes[i]}, {longitudes[i]}): {', '.join(reasons)}"
+                )
+
+        self.stdout.write(
+            self.style.SUCCESS(f"{len(rows)}건 중 {len(flagged)}건이 의심됩니다.")
+        )
+
+        if options["record"] and flagged:
+            Abusing.objects.bulk_create(
+                [
+                    Abusing(
+                        attendance_id=attendance_id,
+                        reason=f"위치 이상 - {username}: {reason}",
+                    )
+                    for attendance_id, username, reason in flagged
+                ]
+            )
+            self.stdout.write(
+                self.style.SUCCESS(f"{len(flagged)}건을 Abusing으로 기록했습니다.")
+            )
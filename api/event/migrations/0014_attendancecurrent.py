@@ -0,0 +1,61 @@
+# Generated by Django 5.1.4 on 2026-10-18 08:38
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_attendance_currents(apps, schema_editor):
+    Attendance = apps.get_model("event", "Attendance")
+    AttendanceCurrent = apps.get_model("event", "AttendanceCurrent")
+
+    latest_attendances = (
+        Attendance.objects.order_by("event_id", "generation_mapping_id", "-created_at")
+        .distinct("event_id", "generation_mapping_id")
+        .values_list("id", "event_id", "generation_mapping_id", "status")
+    )
+
+    batch = []
+    for attendance_id, event_id, generation_mapping_id, status in (
+        latest_attendances.iterator(chunk_size=2000)
+    ):
+        batch.append(
+            AttendanceCurrent(
+                event_id=event_id,
+                generation_mapping_id=generation_mapping_id,
+                attendance_id=attendance_id,
+                status=status,
+            )
+        )
+        if len(batch) >= 2000:
+            AttendanceCurrent.objects.bulk_create(batch)
+            batch = []
+    AttendanceCurrent.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('club', '0014_alter_clubapply_generation'),
+        ('event', '0013_absentapply_is_rejected_editrequest_is_rejected'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AttendanceCurrent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.IntegerField(choices=[(0, '인증전'), (1, '출석'), (2, '지각'), (3, '결석')], default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('attendance', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='event.attendance')),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='current_attendances', to='event.event')),
+                ('generation_mapping', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='current_attendances', to='club.genmember')),
+            ],
+            options={
+                'db_table': 'attendance_currents',
+                'constraints': [models.UniqueConstraint(fields=('event', 'generation_mapping'), name='unique_attendance_current')],
+            },
+        ),
+        migrations.RunPython(
+            backfill_attendance_currents, reverse_code=migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.1.4 on 2026-10-18 08:43
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # 운영 중인 attendances 테이블을 잠그지 않도록 CONCURRENTLY로 생성
+    atomic = False
+
+    dependencies = [
+        ('club', '0014_alter_clubapply_generation'),
+        ('event', '0014_attendancecurrent'),
+        ('userapp', '0008_version'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='attendance',
+            index=models.Index(fields=['event', 'generation_mapping', '-created_at'], name='attendance_event_gm_created'),
+        ),
+        AddIndexConcurrently(
+            model_name='attendance',
+            index=models.Index(fields=['event', 'generation_mapping', 'is_modified', '-created_at'], name='attendance_event_gm_modified'),
+        ),
+        AddIndexConcurrently(
+            model_name='attendance',
+            index=models.Index(condition=models.Q(('status', 0)), fields=['event'], name='attendance_event_unchecked'),
+        ),
+        AddIndexConcurrently(
+            model_name='attendance',
+            index=models.Index(condition=models.Q(('unique_token__isnull', False)), fields=['event', 'unique_token'], name='attendance_event_token'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.1.4 on 2026-10-18 08:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('event', '0015_attendance_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='geofence_latitude',
+            field=models.DecimalField(blank=True, decimal_places=8, max_digits=11, null=True),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='geofence_longitude',
+            field=models.DecimalField(blank=True, decimal_places=8, max_digits=12, null=True),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='geofence_polygon',
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='geofence_radius',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+    ]
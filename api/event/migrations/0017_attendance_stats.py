@@ -0,0 +1,78 @@
+# Generated by Django 5.1.4 on 2026-10-18 09:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+# AttendanceStatus: PRESENT=1, LATE=2, ABSENT=3
+COUNTS = {
+    "present_count": Count("id", filter=Q(status=1)),
+    "late_count": Count("id", filter=Q(status=2)),
+    "absent_count": Count("id", filter=Q(status=3)),
+}
+
+
+def backfill_attendance_stats(apps, schema_editor):
+    AttendanceCurrent = apps.get_model("event", "AttendanceCurrent")
+    GenMemberAttendanceStats = apps.get_model("event", "GenMemberAttendanceStats")
+    EventAttendanceStats = apps.get_model("event", "EventAttendanceStats")
+
+    for model, key in (
+        (GenMemberAttendanceStats, "generation_mapping_id"),
+        (EventAttendanceStats, "event_id"),
+    ):
+        field = "gen_member_id" if key == "generation_mapping_id" else key
+        rows = (
+            AttendanceCurrent.objects.values(key)
+            .annotate(**COUNTS)
+            .values_list(key, *COUNTS)
+        )
+        batch = []
+        for row in rows.iterator(chunk_size=2000):
+            batch.append(model(**{field: row[0]}, **dict(zip(COUNTS, row[1:]))))
+            if len(batch) >= 2000:
+                model.objects.bulk_create(batch)
+                batch = []
+        model.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('club', '0015_generation_google_sheet_id'),
+        ('event', '0016_event_geofence'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventAttendanceStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('present_count', models.IntegerField(default=0)),
+                ('late_count', models.IntegerField(default=0)),
+                ('absent_count', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('event', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='attendance_stats', to='event.event')),
+            ],
+            options={
+                'db_table': 'event_attendance_stats',
+            },
+        ),
+        migrations.CreateModel(
+            name='GenMemberAttendanceStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('present_count', models.IntegerField(default=0)),
+                ('late_count', models.IntegerField(default=0)),
+                ('absent_count', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('gen_member', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='attendance_stats', to='club.genmember')),
+            ],
+            options={
+                'db_table': 'gen_member_attendance_stats',
+            },
+        ),
+        migrations.RunPython(
+            backfill_attendance_stats, reverse_code=migrations.RunPython.noop
+        ),
+    ]
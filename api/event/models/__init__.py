@@ -1,6 +1,8 @@
 from .absent_apply import AbsentApply
 from .abusing import Abusing
 from .attendance import Attendance
+from .attendance_current import AttendanceCurrent
+from .attendance_stats import EventAttendanceStats, GenMemberAttendanceStats
 from .edit_request import EditRequest
 from .enums import AbsentApplyStatus, AttendanceStatus, AttendanceType
 from .event import Event
@@ -14,6 +16,9 @@ __all__ = [
     AttendanceStatus,
     AbsentApplyStatus,
     Attendance,
+    AttendanceCurrent,
+    GenMemberAttendanceStats,
+    EventAttendanceStats,
     EditRequest,
     Abusing,
 ]
@@ -1,4 +1,4 @@
-from django.db import models
+from django.db import models, transaction
 
 from api.club.models.generation_mapping import GenMember
 from api.event.models.enums import AttendanceStatus
@@ -49,3 +49,49 @@ class Attendance(models.Model):
 
     class Meta:
         db_table = "attendances"
+        indexes = [
+            # 멤버별 최신 출석 조회 (AttendanceCurrent.refresh, 출석 이력)
+            models.Index(
+                fields=["event", "generation_mapping", "-created_at"],
+                name="attendance_event_gm_created",
+            ),
+            # 출석 로그 조회 (get_member_log: 수정/미수정 기록별 최신)
+            models.Index(
+                fields=["event", "generation_mapping", "is_modified", "-created_at"],
+                name="attendance_event_gm_modified",
+            ),
+            # 결석 처리 대상 조회 (mark_absent_for_past_events)
+            models.Index(
+                fields=["event"],
+                name="attendance_event_unchecked",
+                condition=models.Q(status=AttendanceStatus.UNCHECKED),
+            ),
+            # 같은 기기 중복 출석 검사
+            models.Index(
+                fields=["event", "unique_token"],
+                name="attendance_event_token",
+                condition=models.Q(unique_token__isnull=False),
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        from api.event.models.attendance_current import AttendanceCurrent
+
+        adding = self._state.adding
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            # 새 기록은 항상 최신, 기존 기록 수정은 최신 기록을 다시 계산
+            if adding:
+                AttendanceCurrent.sync([self])
+            else:
+                AttendanceCurrent.refresh(self.event_id, self.generation_mapping_id)
+
+    def delete(self, *args, **kwargs):
+        from api.event.models.attendance_current import AttendanceCurrent
+
+        with transaction.atomic():
+            # 최신 상태가 이 기록을 가리키면 CASCADE로 함께 지워지므로 통계에서 먼저 빼줌
+            AttendanceCurrent.remove(AttendanceCurrent.objects.filter(attendance=self))
+            result = super().delete(*args, **kwargs)
+            AttendanceCurrent.refresh(self.event_id, self.generation_mapping_id)
+        return result
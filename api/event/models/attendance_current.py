@@ -0,0 +1,253 @@
+from typing import Iterable
+
+from django.db import connection, models, transaction
+from django.db.models.functions import Greatest
+
+from api.club.models.generation_mapping import GenMember
+from api.event.models.attendance import Attendance
+from api.event.models.attendance_stats import (
+    COUNT_FIELDS,
+    STATUS_FIELDS,
+    AttendanceStats,
+)
+from api.event.models.enums import AttendanceStatus
+from api.event.models.event import Event
+
+
+class AttendanceCurrent(models.Model):
+    """
+    (이벤트, 기수 멤버)별 최신 출석 상태
+
+    Attendance는 이력으로 계속 쌓이고, 이 테이블은 Attendance가 기록될 때마다
+    upsert되어 항상 가장 최근 기록만 가리킵니다. 상태가 바뀌면 멤버별/이벤트별
+    출석 통계(AttendanceStats)도 같은 트랜잭션에서 함께 증감합니다.
+    """
+
+    def __str__(self):
+        return f"{self.event_id} - {self.generation_mapping_id} - {AttendanceStatus(self.status).label}"
+
+    event = models.ForeignKey(
+        Event, on_delete=models.CASCADE, related_name="current_attendances"
+    )
+    generation_mapping = models.ForeignKey(
+        GenMember, on_delete=models.CASCADE, related_name="current_attendances"
+    )
+    attendance = models.ForeignKey(
+        Attendance, on_delete=models.CASCADE, related_name="+"
+    )
+    status = models.IntegerField(
+        choices=AttendanceStatus.choices,
+        default=AttendanceStatus.UNCHECKED,
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "attendance_currents"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["event", "generation_mapping"],
+                name="unique_attendance_current",
+            )
+        ]
+
+    @classmethod
+    def sync(cls, attendances: Iterable[Attendance]):
+        """
+        새로 기록된 Attendance들을 최신 상태로 반영
+
+        큐에 쌓여 있다가 늦게 저장된 출석처럼, 현재 상태가 정해진 시각보다 먼저
+        기록된 Attendance는 이력에만 남기고 최신 상태로 반영하지 않습니다.
+
+        Args:
+            attendances: 저장이 완료된 Attendance 목록
+        """
+        latest = {}
+        for attendance in attendances:
+            key = (attendance.event_id, attendance.generation_mapping_id)
+            if key not in latest or latest[key].created_at <= attendance.created_at:
+                latest[key] = attendance
+
+        if not latest:
+            return
+
+        with transaction.atomic(savepoint=False):
+            previous = cls._lock_statuses(latest.keys())
+            latest = {
+                key: attendance
+                for key, attendance in latest.items()
+                if key not in previous
+                or previous[key][1]
+                <= cls._status_time(
+                    attendance.created_at,
+                    attendance.modified_at,
+                    attendance.is_modified,
+                )
+            }
+            cls._upsert(latest, previous)
+
+    @classmethod
+    def refresh(cls, event_id: int, generation_mapping_id: int):
+        """
+        이력에서 최신 Attendance를 다시 찾아 반영 (수정/삭제된 경우)
+
+        sync()와 같이 상태가 정해진 시각(_status_time) 순서로 최신 기록을 고릅니다.
+        """
+        key = (event_id, generation_mapping_id)
+        with transaction.atomic(savepoint=False):
+            previous = cls._lock_statuses([key])
+            attendance = (
+                Attendance.objects.filter(
+                    event_id=event_id, generation_mapping_id=generation_mapping_id
+                )
+                .annotate(status_time=cls._status_time_expression())
+                .order_by("-status_time", "-id")
+                .first()
+            )
+            if attendance is None:
+                cls.objects.filter(
+                    event_id=event_id, generation_mapping_id=generation_mapping_id
+                ).delete()
+                AttendanceStats.apply_changes(
+                    [(*key, previous[key][0] if key in previous else None, None)]
+                )
+                return
+            cls._upsert({key: attendance}, previous)
+
+    @classmethod
+    def _upsert(cls, latest: dict, previous: dict):
+        """잠근 칸들의 최신 상태를 덮어쓰고 통계에 반영 (_lock_statuses 이후 호출)"""
+        cls.objects.bulk_create(
+            [
+                cls(
+                    event_id=attendance.event_id,
+                    generation_mapping_id=attendance.generation_mapping_id,
+                    attendance=attendance,
+                    status=attendance.status,
+                )
+                for attendance in latest.values()
+            ],
+            update_conflicts=True,
+            unique_fields=["event", "generation_mapping"],
+            update_fields=["attendance", "status", "updated_at"],
+        )
+        AttendanceStats.apply_changes(
+            (*key, previous[key][0] if key in previous else None, attendance.status)
+            for key, attendance in latest.items()
+        )
+
+    @classmethod
+    def update_status(cls, queryset: models.QuerySet, status: int) -> int:
+        """
+        save()를 거치지 않고 최신 상태를 한 번에 변경 (통계도 함께 반영)
+
+        Returns:
+            변경된 행 수
+        """
+        with transaction.atomic(savepoint=False):
+            previous = list(
+                queryset.select_for_update().values_list(
+                    "id", "event_id", "generation_mapping_id", "status"
+                )
+            )
+            updated = cls.objects.filter(id__in=[row[0] for row in previous]).update(
+                status=status
+            )
+            AttendanceStats.apply_changes(
+                (event_id, generation_mapping_id, old_status, status)
+                for _, event_id, generation_mapping_id, old_status in previous
+            )
+        return updated
+
+    @classmethod
+    def remove(cls, queryset: models.QuerySet):
+        """최신 상태를 삭제하고 통계에서 빼줌 (이벤트/멤버 삭제 전 호출)"""
+        with transaction.atomic(savepoint=False):
+            previous = list(
+                queryset.select_for_update().values_list(
+                    "id", "event_id", "generation_mapping_id", "status"
+                )
+            )
+            cls.objects.filter(id__in=[row[0] for row in previous]).delete()
+            AttendanceStats.apply_changes(
+                (event_id, generation_mapping_id, old_status, None)
+                for _, event_id, generation_mapping_id, old_status in previous
+            )
+
+    @staticmethod
+    def _status_time(created_at, modified_at, is_modified: bool):
+        """상태가 정해진 시각 (관리자 수정/결석 처리는 수정 시각)"""
+        if is_modified and modified_at:
+            return max(created_at, modified_at)
+        return created_at
+
+    @staticmethod
+    def _status_time_expression():
+        """_status_time()과 같은 값을 계산하는 Attendance 쿼리 표현식"""
+        return models.Case(
+            models.When(
+                is_modified=True,
+                modified_at__isnull=False,
+                then=Greatest("created_at", "modified_at"),
+            ),
+            default=models.F("created_at"),
+        )
+
+    @classmethod
+    def _lock_statuses(cls, keys: Iterable[tuple[int, int]]) -> dict:
+        """
+        (event_id, generation_mapping_id)별 현재 상태와 그 상태가 정해진 시각을
+        잠그고 조회 (트랜잭션 안에서 호출)
+
+        같은 칸을 동시에 바꾸는 요청이 통계를 두 번 증감하지 않도록 합니다.
+        아직 행이 없는 칸은 SELECT FOR UPDATE로 잠글 수 없으므로, 칸별 advisory
+        lock으로 처음 기록하는 요청끼리도 순서대로 처리합니다.
+        """
+        keys = set(keys)
+        with connection.cursor() as cursor:
+            # 해시 순서로 잠가서 여러 칸을 잠그는 요청끼리 교착되지 않도록 함
+            cursor.execute(
+                "SELECT pg_advisory_xact_lock(h) FROM ("
+                "  SELECT DISTINCT hashtextextended(k, 0) AS h"
+                "  FROM unnest(%s::text[]) AS k ORDER BY h"
+                ") AS cells",
+                [[f"attendance_current:{e}:{g}" for e, g in keys]],
+            )
+        rows = (
+            cls.objects.filter(
+                event_id__in={event_id for event_id, _ in keys},
+                generation_mapping_id__in={gm_id for _, gm_id in keys},
+            )
+            .select_for_update(of=("self",))
+            .values_list(
+                "event_id",
+                "generation_mapping_id",
+                "status",
+                "attendance__created_at",
+                "attendance__modified_at",
+                "attendance__is_modified",
+            )
+        )
+        return {
+            (event_id, gm_id): (
+                status,
+                cls._status_time(created_at, modified_at, is_modified),
+            )
+            for event_id, gm_id, status, created_at, modified_at, is_modified in rows
+            if (event_id, gm_id) in keys
+        }
+
+    @classmethod
+    def status_counts(cls, group_by: str, **filters) -> dict[int, tuple]:
+        """group_by별 (출석, 지각, 결석) 개수 (통계 검증용)"""
+        return {
+            row[0]: tuple(row[1:])
+            for row in cls.objects.filter(**filters)
+            .values(group_by)
+            .annotate(
+                **{
+                    field: models.Count("id", filter=models.Q(status=status))
+                    for status, field in STATUS_FIELDS.items()
+                }
+            )
+            .values_list(group_by, *COUNT_FIELDS)
+        }
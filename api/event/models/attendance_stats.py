@@ -0,0 +1,150 @@
+from collections import Counter, defaultdict
+from typing import Callable, Iterable
+
+from django.db import models
+from django.db.models import F
+from django.utils import timezone
+
+from api.club.models.generation_mapping import GenMember
+from api.event.models.enums import AttendanceStatus
+from api.event.models.event import Event
+
+# 집계하는 상태와 카운터 필드
+STATUS_FIELDS = {
+    AttendanceStatus.PRESENT: "present_count",
+    AttendanceStatus.LATE: "late_count",
+    AttendanceStatus.ABSENT: "absent_count",
+}
+COUNT_FIELDS = list(STATUS_FIELDS.values())
+
+
+class AttendanceStats(models.Model):
+    """
+    최신 출석 상태(AttendanceCurrent)의 상태별 개수
+
+    AttendanceCurrent가 바뀔 때 같은 트랜잭션에서 증감하므로 통계를 읽을 때
+    출석 이력을 집계하지 않아도 됩니다. 어긋난 값은 reconcile()로 바로잡습니다.
+    """
+
+    # 집계 대상 FK의 컬럼 이름 (gen_member_id / event_id)
+    KEY = None
+
+    present_count = models.IntegerField(default=0)
+    late_count = models.IntegerField(default=0)
+    absent_count = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def apply(cls, deltas: dict[int, Counter]):
+        """
+        카운터 증감 반영 (F() 업데이트)
+
+        Args:
+            deltas: {KEY 값: Counter({카운터 필드: 증감})}
+        """
+        deltas = {
+            key: {field: value for field, value in delta.items() if value}
+            for key, delta in deltas.items()
+        }
+        deltas = {key: delta for key, delta in deltas.items() if delta}
+        if not deltas:
+            return
+
+        cls.objects.bulk_create(
+            [cls(**{cls.KEY: key}) for key in deltas], ignore_conflicts=True
+        )
+        # 같은 증감끼리 묶어서 한 번에 업데이트 (예: 결석 처리는 모두 absent +1)
+        groups = defaultdict(list)
+        for key, delta in deltas.items():
+            groups[tuple(sorted(delta.items()))].append(key)
+        now = timezone.now()
+        for delta, keys in groups.items():
+            cls.objects.filter(**{f"{cls.KEY}__in": keys}).update(
+                updated_at=now,
+                **{field: F(field) + value for field, value in delta},
+            )
+
+    @classmethod
+    def reconcile(cls, queryset, count_expected: Callable[[], dict]) -> int:
+        """
+        기대 값과 다른 행을 덮어씀 (트랜잭션 안에서 호출)
+
+        통계 행을 먼저 잠근 뒤 기대 값을 계산하므로, 그 사이에 커밋된 출석 변경은
+        기대 값에 포함되고 아직 커밋되지 않은 변경은 잠금이 풀린 뒤 증감됩니다.
+
+        Args:
+            queryset: 비교할 범위의 통계 행
+            count_expected: {KEY 값: (present, late, absent)}를 반환, 없는 키는 모두 0
+
+        Returns:
+            바로잡은 행 수
+        """
+        actual = {
+            row[0]: tuple(row[1:])
+            for row in queryset.select_for_update(of=("self",)).values_list(
+                cls.KEY, *COUNT_FIELDS
+            )
+        }
+        expected = count_expected()
+        zero = (0,) * len(COUNT_FIELDS)
+        fixes = [
+            cls(**{cls.KEY: key}, **dict(zip(COUNT_FIELDS, expected.get(key, zero))))
+            for key in set(expected) | set(actual)
+            if expected.get(key, zero) != actual.get(key)
+        ]
+        cls.objects.bulk_create(
+            fixes,
+            update_conflicts=True,
+            unique_fields=[cls.KEY.removesuffix("_id")],
+            update_fields=[*COUNT_FIELDS, "updated_at"],
+        )
+        return len(fixes)
+
+    @staticmethod
+    def apply_changes(changes: Iterable[tuple[int, int, int | None, int | None]]):
+        """
+        최신 출석 상태 변경을 멤버별/이벤트별 카운터에 반영
+
+        Args:
+            changes: (event_id, generation_mapping_id, 이전 상태, 새 상태),
+                상태가 없던/없어진 경우는 None
+        """
+        member_deltas = defaultdict(Counter)
+        event_deltas = defaultdict(Counter)
+        for event_id, generation_mapping_id, old_status, new_status in changes:
+            if old_status == new_status:
+                continue
+            for status, sign in ((old_status, -1), (new_status, 1)):
+                field = STATUS_FIELDS.get(status)
+                if field is None:
+                    continue
+                member_deltas[generation_mapping_id][field] += sign
+                event_deltas[event_id][field] += sign
+
+        GenMemberAttendanceStats.apply(member_deltas)
+        EventAttendanceStats.apply(event_deltas)
+
+
+class GenMemberAttendanceStats(AttendanceStats):
+    KEY = "gen_member_id"
+
+    gen_member = models.OneToOneField(
+        GenMember, on_delete=models.CASCADE, related_name="attendance_stats"
+    )
+
+    class Meta:
+        db_table = "gen_member_attendance_stats"
+
+
+class EventAttendanceStats(AttendanceStats):
+    KEY = "event_id"
+
+    event = models.OneToOneField(
+        Event, on_delete=models.CASCADE, related_name="attendance_stats"
+    )
+
+    class Meta:
+        db_table = "event_attendance_stats"
@@ -54,6 +54,15 @@ class Event(models.Model):
         default=list,
     )
     attendance_type = models.CharField(max_length=10, choices=AttendanceType.choices)
+    # 위치 출석 영역 (중심 좌표 + 반경 또는 [[위도, 경도], ...] 다각형)
+    geofence_latitude = models.DecimalField(
+        max_digits=11, decimal_places=8, null=True, blank=True
+    )
+    geofence_longitude = models.DecimalField(
+        max_digits=12, decimal_places=8, null=True, blank=True
+    )
+    geofence_radius = models.PositiveIntegerField(null=True, blank=True)  # 미터
+    geofence_polygon = models.JSONField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -1,19 +1,20 @@
-from datetime import timedelta
-
-from django.utils import timezone
 from rest_framework import serializers
-from storages.backends.s3boto3 import S3Boto3Storage
 
 from api.club.models import GenMember
 from api.club.serializers.generation_serializers import SimpleGenerationSerializer
 from api.club.serializers.member_serializers import MemberSerializer
-from api.event.models import AbsentApply, Attendance, Event
-from api.event.models.edit_request import EditRequest
+from api.event.models import (
+    Attendance,
+    AttendanceCurrent,
+    AttendanceType,
+    Event,
+)
 from api.event.serializers.attend_serializer import (
     AbsentApplySerializer,
     AttendanceSerializer,
 )
 from api.event.serializers.edit_request_serializer import EditRequestSerializer
+from common.utils.storage_url import StorageURLCache
 
 
 class EventCreateSerializer(serializers.Serializer):
@@ -31,6 +32,26 @@ class EventCreateSerializer(serializers.Serializer):
     start_minutes = serializers.IntegerField()
     late_minutes = serializers.IntegerField()
     fail_minutes = serializers.IntegerField()
+    attendance_type = serializers.ChoiceField(
+        choices=AttendanceType.choices, required=False, default=AttendanceType.QR
+    )
+    geofence_latitude = serializers.DecimalField(
+        max_digits=11, decimal_places=8, required=False, allow_null=True
+    )
+    geofence_longitude = serializers.DecimalField(
+        max_digits=12, decimal_places=8, required=False, allow_null=True
+    )
+    geofence_radius = serializers.IntegerField(
+        min_value=1, required=False, allow_null=True
+    )
+    geofence_polygon = serializers.ListField(
+        child=serializers.ListField(
+            child=serializers.FloatField(), min_length=2, max_length=2
+        ),
+        min_length=3,
+        required=False,
+        allow_null=True,
+    )
 
 
 class EventUpdateSerializer(serializers.Serializer):
@@ -50,6 +71,26 @@ class EventUpdateSerializer(serializers.Serializer):
     start_minutes = serializers.IntegerField(required=False, allow_null=True)
     late_minutes = serializers.IntegerField(required=False, allow_null=True)
     fail_minutes = serializers.IntegerField(required=False, allow_null=True)
+    attendance_type = serializers.ChoiceField(
+        choices=AttendanceType.choices, required=False, allow_null=True
+    )
+    geofence_latitude = serializers.DecimalField(
+        max_digits=11, decimal_places=8, required=False, allow_null=True
+    )
+    geofence_longitude = serializers.DecimalField(
+        max_digits=12, decimal_places=8, required=False, allow_null=True
+    )
+    geofence_radius = serializers.IntegerField(
+        min_value=1, required=False, allow_null=True
+    )
+    geofence_polygon = serializers.ListField(
+        child=serializers.ListField(
+            child=serializers.FloatField(), min_length=2, max_length=2
+        ),
+        min_length=3,
+        required=False,
+        allow_null=True,
+    )
 
 
 class SimpleEventSerializer(serializers.ModelSerializer):
@@ -87,46 +128,55 @@ class EventSerializer(serializers.ModelSerializer):
         ]
 
     def get_attendance_status(self, obj):
+        # 목록 조회 시에는 함께 조회된 상태를 사용
+        if hasattr(obj, "user_attendance_status"):
+            return obj.user_attendance_status
+        status_map = self.context.get("attendance_status_map")
+        if status_map is not None:
+            return status_map.get(obj.id, 0)
+
         user = self.context.get("user")
-        try:
-            attendance = (
-                Attendance.objects.filter(
-                    event=obj, generation_mapping__member__user=user
-                )
-                .order_by("-created_at")
-                .first()
+        status = (
+            AttendanceCurrent.objects.filter(
+                event=obj, generation_mapping__member__user=user
             )
-
-            if attendance is None or attendance.status is None:
-                return 0
-            return attendance.status
-        except Attendance.DoesNotExist:
+            .values_list("status", flat=True)
+            .first()
+        )
+        if status is None:
             return 0
+        return status
+
+
+class UpcomingEventQuerySerializer(serializers.Serializer):
+    past_limit = serializers.IntegerField(
+        required=False, min_value=1, max_value=100, help_text="지난 이벤트 개수"
+    )
+    past_cursor = serializers.CharField(
+        required=False, help_text="이전 응답의 past_next_cursor"
+    )
 
 
 class UpcomingEventSerializer(serializers.Serializer):
+    """
+    EventService.get_upcoming_events 결과(is_past로 구분, 정렬 완료)를
+    다가오는 이벤트와 지난 이벤트로 나눠서 직렬화
+    """
+
     upcoming_events = serializers.SerializerMethodField()
     past_events = serializers.SerializerMethodField()
+    past_next_cursor = serializers.SerializerMethodField()
 
     def get_past_events(self, obj):
-        yesterday = timezone.now().date() - timedelta(days=1)
-        past_events = self.instance.filter(date__lt=yesterday).order_by(
-            "-start_datetime"
-        )
-        # past_events = [event for event in self.instance if event.date < yesterday]
-        return EventSerializer(
-            past_events, many=True, context={"user": self.context.get("user")}
-        ).data
+        past_events = [event for event in self.instance if event.is_past]
+        return EventSerializer(past_events, many=True, context=self.context).data
 
     def get_upcoming_events(self, obj):
-        yesterday = timezone.now().date() - timedelta(days=1)
-        upcoming_events = self.instance.filter(date__gte=yesterday).order_by(
-            "start_datetime"
-        )
-        # upcoming_events = [event for event in self.instance if event.date >= yesterday]
-        return EventSerializer(
-            upcoming_events, many=True, context={"user": self.context.get("user")}
-        ).data
+        upcoming_events = [event for event in self.instance if not event.is_past]
+        return EventSerializer(upcoming_events, many=True, context=self.context).data
+
+    def get_past_next_cursor(self, obj):
+        return self.context.get("past_next_cursor")
 
 
 class EventListForPCSerializer(serializers.ModelSerializer):
@@ -154,7 +204,7 @@ class EventListForPCSerializer(serializers.ModelSerializer):
 class EventDetailSerializer(serializers.ModelSerializer):
     images = serializers.SerializerMethodField()
     attendance_status = serializers.SerializerMethodField()
-    qr_code_url = serializers.ImageField()
+    qr_code_url = serializers.SerializerMethodField()
 
     class Meta:
         model = Event
@@ -175,33 +225,37 @@ class EventDetailSerializer(serializers.ModelSerializer):
             "images",
             "qr_code_url",
             "qr_code",
+            "attendance_type",
+            "geofence_latitude",
+            "geofence_longitude",
+            "geofence_radius",
+            "geofence_polygon",
             "attendance_status",
         ]
 
     def get_images(self, obj):
-        if not obj.images:
-            return []
-        storage = S3Boto3Storage()
-        return [storage.url(image_path) for image_path in obj.images]
+        return StorageURLCache.urls(obj.images)
+
+    def get_qr_code_url(self, obj):
+        return StorageURLCache.url(obj.qr_code_url.name)
 
     def get_attendance_status(self, obj):
         user = self.context.get("request").user
-        try:
-            attendance = (
-                Attendance.objects.filter(
-                    event=obj, generation_mapping__member__user=user
-                )
-                .order_by("-created_at")
-                .first()
+        status = (
+            AttendanceCurrent.objects.filter(
+                event=obj, generation_mapping__member__user=user
             )
-            if attendance is None or attendance.status is None:
-                return 0
-            return attendance.status
-        except Attendance.DoesNotExist:
+            .values_list("status", flat=True)
+            .first()
+        )
+        if status is None:
             return 0
+        return status
 
 
 class MemberAttendanceSerializer(serializers.ModelSerializer):
+    """EventService.get_attendance_roster로 조회한 GenMember를 직렬화"""
+
     member_id = serializers.IntegerField(source="member.id")
     gen_member_id = serializers.IntegerField(source="id")
     member = MemberSerializer()
@@ -221,21 +275,21 @@ class MemberAttendanceSerializer(serializers.ModelSerializer):
         ]
 
     def get_attendance_status(self, obj):
-        attendance = self.context.get("attendance_map", {}).get(obj.id)
-        if attendance:
-            return AttendanceSerializer(attendance).data
+        currents = obj.event_current_attendances
+        if currents:
+            return AttendanceSerializer(currents[0].attendance).data
         return AttendanceSerializer(Attendance(status=0)).data
 
     def get_absent_apply(self, obj):
-        absent_apply = self.context.get("absent_apply_map", {}).get(obj.id)
-        if absent_apply:
-            return AbsentApplySerializer(absent_apply).data
+        # 가장 최근 불참 신청
+        if obj.event_absent_applies:
+            return AbsentApplySerializer(obj.event_absent_applies[-1]).data
         return None
 
     def get_edit_request(self, obj):
-        edit_requests = self.context.get("edit_requests_map", {}).get(obj.id)
-        if edit_requests:
-            return EditRequestSerializer(edit_requests).data
+        # 가장 최근 수정 요청
+        if obj.event_edit_requests:
+            return EditRequestSerializer(obj.event_edit_requests[-1]).data
         return None
 
 
@@ -249,75 +303,11 @@ class EventAttendanceSerializer(serializers.ModelSerializer):
         fields = ["id", "title", "date", "members"]
 
     def get_members(self, obj):
-        # Get all members for this generation
-        members = obj.generation.gen_members.all().select_related("member__user")
-
-        # Prefetch all attendance records for this event in a single query
-        # Use a dictionary for O(1) lookups instead of filtering in the serializer
-        attendances = Attendance.objects.filter(
-            event=obj, generation_mapping__in=members
-        ).order_by("-created_at")
-
-        # Create a map of gen_member_id -> attendance for efficient lookup
-        attendance_map = {}
-        for attendance in attendances:
-            # Only keep the most recent attendance record for each member
-            if attendance.generation_mapping_id not in attendance_map:
-                attendance_map[attendance.generation_mapping_id] = attendance
-
-        # Prefetch all absent_apply records for this event in a single query
-        absent_applies = AbsentApply.objects.filter(
-            event=obj, gen_member__in=members
-        ).order_by("created_at")
-
-        edit_requests = EditRequest.objects.filter(
-            event=obj, gen_member__in=members
-        ).order_by("created_at")
-
-        # Create a map of gen_member_id -> absent_apply for efficient lookup
-        absent_apply_map = {
-            absent_apply.gen_member_id: absent_apply for absent_apply in absent_applies
-        }
-
-        edit_requests_map = {
-            edit_request.gen_member_id: edit_request for edit_request in edit_requests
-        }
-
-        # Sort members by:
-        # 1. First, members with non-approved absent_apply or edit_request (is_approved=False) come first
-        # 2. Then sort by surname and name
-        def sort_key(member):
-            has_non_approved_absent_apply = False
-            has_non_approved_edit_request = False
-
-            if member.id in absent_apply_map:
-                has_non_approved_absent_apply = (
-                    absent_apply_map[member.id].is_approved is False
-                )
-
-            if member.id in edit_requests_map:
-                has_non_approved_edit_request = (
-                    edit_requests_map[member.id].is_approved is False
-                )
-
-            return (
-                not (
-                    has_non_approved_absent_apply or has_non_approved_edit_request
-                ),  # False comes first in sorting
-                member.member.user.username[0],  # Then sort by surname
-                member.member.user.username[1:],  # Then by name
-            )
-
-        members = sorted(members, key=sort_key)
+        from api.event.service.event_service import EventService
 
+        # 표시 순서대로 정렬된 출석부를 한 번에 조회 (출석/불참 신청/수정 요청 prefetch)
         return MemberAttendanceSerializer(
-            members,
-            many=True,
-            context={
-                "attendance_map": attendance_map,
-                "absent_apply_map": absent_apply_map,
-                "edit_requests_map": edit_requests_map,
-            },
+            EventService.get_attendance_roster(obj), many=True
         ).data
 
 
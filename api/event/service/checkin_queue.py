@@ -0,0 +1,331 @@
+import json
+import os
+import socket
+from datetime import datetime
+from decimal import Decimal
+
+from django.db import DataError, IntegrityError, transaction
+from django.utils import timezone
+from django_redis import get_redis_connection
+from loguru import logger
+from redis.exceptions import ResponseError
+
+from api.event.models import Attendance, AttendanceCurrent
+from api.event.models.abusing import Abusing
+from api.userapp.models.user_meta import Platform, UniqueToken
+
+
+class CheckInQueue:
+    """
+    QR 출석 요청을 Redis Stream에 쌓아두고 Celery 작업이 모아서 저장하는 write-behind 큐
+
+    - enqueue: 출석 상태를 계산해 스트림에 추가하고, 저장 전까지는 pending 해시에 기록
+    - drain: 스트림을 배치로 읽어 bulk_create 후 pending 해시에서 제거
+    - get_pending: 아직 저장되지 않은 출석을 조회 (read-your-writes 보장)
+
+    저장할 수 없는 요청(삭제된 멤버 등)이 섞인 배치는 나눠서 다시 저장하고,
+    MAX_DELIVERIES번 넘게 전달된 요청은 dead-letter 스트림으로 옮깁니다.
+    """
+
+    STREAM_KEY = "checkin:stream"
+    GROUP_NAME = "checkin-writers"
+    PENDING_KEY = "checkin:pending:{event_id}"
+    PENDING_TTL = 60 * 60 * 24
+    # 처리 중 죽은 consumer의 메시지를 가져오기까지의 대기 시간 (ms)
+    CLAIM_IDLE_MS = 60 * 1000
+    # 저장에 실패한 요청을 dead-letter 스트림으로 옮기기까지의 전달 횟수
+    MAX_DELIVERIES = 5
+    DEAD_LETTER_KEY = "checkin:dead"
+
+    @classmethod
+    def _redis(cls):
+        return get_redis_connection("default")
+
+    @classmethod
+    def _pending_key(cls, event_id: int) -> str:
+        return cls.PENDING_KEY.format(event_id=event_id)
+
+    @classmethod
+    def enqueue(
+        cls,
+        event_id: int,
+        generation_mapping_id: int,
+        user_id: int,
+        status: int,
+        latitude: Decimal | None = None,
+        longitude: Decimal | None = None,
+        device_id: str | None = None,
+        model: str | None = None,
+    ) -> Attendance | None:
+        """
+        출석 요청을 큐에 추가
+
+        Returns:
+            저장 예정인 Attendance (아직 DB에 없음), 이미 대기 중인 출석이 있으면 None
+        """
+        created_at = timezone.now()
+        payload = {
+            "event_id": event_id,
+            "generation_mapping_id": generation_mapping_id,
+            "user_id": user_id,
+            "status": status,
+            "latitude": str(latitude) if latitude is not None else None,
+            "longitude": str(longitude) if longitude is not None else None,
+            "device_id": device_id,
+            "model": model,
+            "created_at": created_at.isoformat(),
+        }
+        data = json.dumps(payload)
+
+        redis = cls._redis()
+        pending_key = cls._pending_key(event_id)
+        # 같은 멤버의 중복 요청은 HSETNX로 한 번만 통과
+        if not redis.hsetnx(pending_key, generation_mapping_id, data):
+            return None
+        pipeline = redis.pipeline()
+        pipeline.expire(pending_key, cls.PENDING_TTL)
+        pipeline.xadd(cls.STREAM_KEY, {"data": data})
+        pipeline.execute()
+
+        return cls._to_attendance(payload)
+
+    @classmethod
+    def get_pending(
+        cls, event_id: int, generation_mapping_id: int
+    ) -> Attendance | None:
+        """아직 DB에 저장되지 않은 출석 조회"""
+        data = cls._redis().hget(cls._pending_key(event_id), generation_mapping_id)
+        if data is None:
+            return None
+        return cls._to_attendance(json.loads(data))
+
+    @classmethod
+    def _to_attendance(cls, payload: dict) -> Attendance:
+        return Attendance(
+            event_id=payload["event_id"],
+            generation_mapping_id=payload["generation_mapping_id"],
+            status=payload["status"],
+            latitude=Decimal(payload["latitude"]) if payload["latitude"] else None,
+            longitude=Decimal(payload["longitude"]) if payload["longitude"] else None,
+            is_modified=False,
+            created_at=datetime.fromisoformat(payload["created_at"]),
+        )
+
+    @classmethod
+    def _ensure_group(cls, redis):
+        try:
+            redis.xgroup_create(cls.STREAM_KEY, cls.GROUP_NAME, id="0", mkstream=True)
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    @classmethod
+    def drain(cls, batch_size: int = 500, max_batches: int = 20) -> int:
+        """
+        스트림에 쌓인 출석 요청을 배치로 저장
+
+        Returns:
+            저장한 Attendance 수
+        """
+        redis = cls._redis()
+        cls._ensure_group(redis)
+        consumer = f"{socket.gethostname()}-{os.getpid()}"
+
+        # 처리 도중 죽은 consumer가 남긴 메시지부터 회수
+        _, entries, *_ = redis.xautoclaim(
+            cls.STREAM_KEY,
+            cls.GROUP_NAME,
+            consumer,
+            min_idle_time=cls.CLAIM_IDLE_MS,
+            count=batch_size,
+        )
+        total = cls._write_batch(redis, entries) if entries else 0
+
+        for _ in range(max_batches):
+            response = redis.xreadgroup(
+                cls.GROUP_NAME, consumer, {cls.STREAM_KEY: ">"}, count=batch_size
+            )
+            if not response:
+                break
+            entries = response[0][1]
+            total += cls._write_batch(redis, entries)
+            if len(entries) < batch_size:
+                break
+        return total
+
+    @classmethod
+    def _write_batch(cls, redis, entries) -> int:
+        """
+        배치를 한 트랜잭션으로 저장
+
+        저장할 수 없는 요청이 섞여 있으면 배치를 반으로 나눠 다시 시도하고,
+        남은 한 건은 ack하지 않고 두었다가 XAUTOCLAIM으로 다시 시도합니다.
+        """
+        payloads = [json.loads(fields[b"data"]) for _, fields in entries if fields]
+
+        try:
+            with transaction.atomic():
+                attendances = cls._create_attendances(payloads)
+        except (IntegrityError, DataError) as e:
+            if len(entries) == 1:
+                cls._retry_or_dead_letter(redis, entries[0], e)
+                return 0
+            middle = len(entries) // 2
+            return cls._write_batch(redis, entries[:middle]) + cls._write_batch(
+                redis, entries[middle:]
+            )
+
+        pipeline = redis.pipeline()
+        cls._ack(pipeline, entries)
+        pipeline.execute()
+
+        logger.info(f"Wrote {len(attendances)} queued check-ins")
+        return len(attendances)
+
+    @classmethod
+    def _retry_or_dead_letter(cls, redis, entry, error: Exception):
+        """전달 횟수가 MAX_DELIVERIES에 이르면 dead-letter 스트림으로 옮기고 ack"""
+        message_id, fields = entry
+        pending = redis.xpending_range(
+            cls.STREAM_KEY, cls.GROUP_NAME, min=message_id, max=message_id, count=1
+        )
+        deliveries = pending[0]["times_delivered"] if pending else cls.MAX_DELIVERIES
+        if deliveries < cls.MAX_DELIVERIES:
+            logger.warning(
+                f"Queued check-in {message_id} failed ({deliveries} deliveries): {error}"
+            )
+            return
+
+        logger.error(f"Moving queued check-in {message_id} to dead letters: {error}")
+        pipeline = redis.pipeline()
+        pipeline.xadd(
+            cls.DEAD_LETTER_KEY,
+            {**fields, "message_id": message_id, "error": str(error)},
+        )
+        cls._ack(pipeline, [entry])
+        pipeline.execute()
+
+    @classmethod
+    def _ack(cls, pipeline, entries):
+        """pending 해시에서 지우고 스트림에서 ack/삭제"""
+        message_ids = [message_id for message_id, _ in entries]
+        for _, fields in entries:
+            if not fields:
+                continue
+            payload = json.loads(fields[b"data"])
+            pipeline.hdel(
+                cls._pending_key(payload["event_id"]),
+                payload["generation_mapping_id"],
+            )
+        pipeline.xack(cls.STREAM_KEY, cls.GROUP_NAME, *message_ids)
+        pipeline.xdel(cls.STREAM_KEY, *message_ids)
+
+    @classmethod
+    def _create_attendances(cls, payloads: list[dict]) -> list[Attendance]:
+        # 저장 후 ack 전에 중단되어 다시 읽힌 메시지는 건너뜀
+        saved = set(
+            AttendanceCurrent.objects.filter(
+                event_id__in={p["event_id"] for p in payloads},
+                generation_mapping_id__in={
+                    p["generation_mapping_id"] for p in payloads
+                },
+            ).values_list("event_id", "generation_mapping_id", "attendance__created_at")
+        )
+        payloads = [
+            p
+            for p in payloads
+            if (
+                p["event_id"],
+                p["generation_mapping_id"],
+                datetime.fromisoformat(p["created_at"]),
+            )
+            not in saved
+        ]
+        if not payloads:
+            return []
+
+        unique_tokens = cls._get_unique_tokens(payloads)
+
+        attendances = []
+        for payload in payloads:
+            attendance = cls._to_attendance(payload)
+            attendance.unique_token = unique_tokens.get(payload["device_id"])
+            attendances.append(attendance)
+        Attendance.objects.bulk_create(attendances)
+
+        # bulk_create는 auto_now_add로 created_at을 덮어쓰므로 요청 시각으로 되돌림
+        for attendance, payload in zip(attendances, payloads):
+            attendance.created_at = datetime.fromisoformat(payload["created_at"])
+            attendance.timestamp = attendance.created_at
+        Attendance.objects.bulk_update(attendances, ["created_at", "timestamp"])
+        AttendanceCurrent.sync(attendances)
+
+        cls._record_abusing(attendances)
+        return attendances
+
+    @classmethod
+    def _get_unique_tokens(cls, payloads: list[dict]) -> dict[str, UniqueToken]:
+        device_payloads = {p["device_id"]: p for p in payloads if p["device_id"]}
+        if not device_payloads:
+            return {}
+
+        unique_tokens = {}
+        for unique_token in UniqueToken.objects.filter(
+            token__in=device_payloads.keys()
+        ).order_by("-id"):
+            unique_tokens[unique_token.token] = unique_token
+
+        missing = [
+            UniqueToken(
+                user_id=payload["user_id"],
+                token=device_id,
+                platform=Platform.UNKNOWN,
+                model=payload["model"],
+            )
+            for device_id, payload in device_payloads.items()
+            if device_id not in unique_tokens
+        ]
+        for unique_token in UniqueToken.objects.bulk_create(missing):
+            unique_tokens[unique_token.token] = unique_token
+        return unique_tokens
+
+    @classmethod
+    def _record_abusing(cls, attendances: list[Attendance]):
+        """같은 기기로 같은 이벤트에 출석한 기록을 Abusing으로 남김"""
+        token_attendances = [a for a in attendances if a.unique_token_id]
+        if not token_attendances:
+            return
+
+        others_by_key = {}
+        for other in (
+            Attendance.objects.filter(
+                event_id__in={a.event_id for a in token_attendances},
+                unique_token_id__in={a.unique_token_id for a in token_attendances},
+            )
+            .select_related("generation_mapping__member__user")
+            .order_by("id")
+        ):
+            others_by_key.setdefault(
+                (other.event_id, other.unique_token_id), []
+            ).append(other)
+
+        abusings = []
+        for attendance in token_attendances:
+            duplicated_attendance = next(
+                (
+                    other
+                    for other in others_by_key.get(
+                        (attendance.event_id, attendance.unique_token_id), []
+                    )
+                    if other.id != attendance.id
+                ),
+                None,
+            )
+            if duplicated_attendance:
+                abusings.append(
+                    Abusing(
+                        attendance=duplicated_attendance,
+                        reason=f"중복 출석 - {duplicated_attendance.generation_mapping.member.user.username}",
+                    )
+                )
+        Abusing.objects.bulk_create(abusings)
@@ -1,22 +1,50 @@
+import base64
+import binascii
 from datetime import datetime, timedelta
 
+from django.conf import settings
+from django.db import transaction
+from django.db.models import (
+    BooleanField,
+    Case,
+    Exists,
+    F,
+    OuterRef,
+    Prefetch,
+    Q,
+    Subquery,
+    Value,
+    When,
+    Window,
+)
+from django.db.models.functions import Coalesce, Collate, RowNumber
 from django.utils import timezone
 from rest_framework.exceptions import PermissionDenied
 
 from api.club.models import Generation, GenMember
-from api.club.models.club_apply import ClubApply
-from api.event.models import Attendance, AttendanceStatus, Event
+from api.club.services.roster_cache import RosterCache
+from api.event.models import (
+    AbsentApply,
+    Attendance,
+    AttendanceCurrent,
+    AttendanceStatus,
+    AttendanceType,
+    EditRequest,
+    Event,
+)
 from api.event.models.abusing import Abusing
 from api.event.serializers import (
     CheckQRCodeSerializer,
     EventCreateSerializer,
     EventUpdateSerializer,
 )
+from api.event.service.checkin_queue import CheckInQueue
 from api.userapp.models import User
 from api.userapp.models.user_meta import Platform, UniqueToken
 from common.component import FCMComponent, NotificationTemplate, UserSelector
 from common.exceptions import CustomException, ErrorCode
 from common.utils.code_generator import HashTimeGenerator
+from common.utils.geofence import Geofence
 from common.utils.qr_code import generate_uuid_qr_for_imagefield
 
 fcm_component = FCMComponent()
@@ -51,6 +79,11 @@ class EventService:
             start_minutes=data.validated_data.get("start_minutes"),
             late_minutes=data.validated_data.get("late_minutes"),
             fail_minutes=data.validated_data.get("fail_minutes"),
+            attendance_type=data.validated_data.get("attendance_type"),
+            geofence_latitude=data.validated_data.get("geofence_latitude"),
+            geofence_longitude=data.validated_data.get("geofence_longitude"),
+            geofence_radius=data.validated_data.get("geofence_radius"),
+            geofence_polygon=data.validated_data.get("geofence_polygon"),
             qr_code=qr_code,
             qr_code_url=qr_file,
         )
@@ -95,38 +128,72 @@ class EventService:
             event.late_minutes = data.validated_data.get("late_minutes")
         if data.validated_data.get("fail_minutes") is not None:
             event.fail_minutes = data.validated_data.get("fail_minutes")
+        if data.validated_data.get("attendance_type") is not None:
+            event.attendance_type = data.validated_data.get("attendance_type")
+        # 위치 영역은 null로 해제할 수 있도록 전달된 값은 그대로 반영
+        for field in (
+            "geofence_latitude",
+            "geofence_longitude",
+            "geofence_radius",
+            "geofence_polygon",
+        ):
+            if field in data.validated_data:
+                setattr(event, field, data.validated_data.get(field))
 
         event.save()
 
     @staticmethod
     def check_qr_code(serializer: CheckQRCodeSerializer, event: Event, user: User):
-        # TODO: 캐싱하기
-        valid_code = HashTimeGenerator.auto_generate_code_list(event.qr_code)
-        if serializer.validated_data.get("qr_code") not in valid_code:
+        if not HashTimeGenerator.is_valid_code(
+            event.qr_code,
+            serializer.validated_data.get("qr_code"),
+            time_range=settings.QR_CODE_VALID_SECONDS,
+        ):
             raise CustomException(ErrorCode.INVALID_QR_CODE)
 
-        try:
-            generation_mapping = GenMember.objects.get(
-                member__user=user, generation=event.generation
+        if event.attendance_type in (AttendanceType.LOCATION, AttendanceType.BOTH):
+            EventService.check_location(
+                event,
+                serializer.validated_data.get("latitude"),
+                serializer.validated_data.get("longitude"),
             )
-        except GenMember.DoesNotExist:
-            if ClubApply.objects.filter(
-                user=user, generation=event.generation, accepted=False
-            ).exists():
+
+        # 기수 명단 캐시로 멤버 여부 확인 (DB 조회 없음)
+        generation_mapping_id, is_applied = RosterCache.resolve(
+            event.generation_id, user.id
+        )
+        if generation_mapping_id is None:
+            if is_applied:
                 raise CustomException(ErrorCode.WAITING_FOR_APPROVAL)
             else:
                 raise CustomException(ErrorCode.NOT_REGISTERED_CLUB)
 
         if (
-            attendance := Attendance.objects.filter(
-                event=event, generation_mapping=generation_mapping
+            current_status := AttendanceCurrent.objects.filter(
+                event=event, generation_mapping_id=generation_mapping_id
             )
-            .order_by("-created_at")
+            .values_list("status", flat=True)
             .first()
-        ):
-            if attendance.status != AttendanceStatus.UNCHECKED:
+        ) is not None:
+            if current_status != AttendanceStatus.UNCHECKED:
                 raise CustomException(ErrorCode.ALREADY_CHECKED_IN)
 
+        if settings.ATTENDANCE_WRITE_BEHIND:
+            # 저장은 drain_checkin_stream 작업이 배치로 처리
+            attendance = CheckInQueue.enqueue(
+                event_id=event.id,
+                generation_mapping_id=generation_mapping_id,
+                user_id=user.id,
+                status=EventService.check_attendance_status(event),
+                latitude=serializer.validated_data.get("latitude", None),
+                longitude=serializer.validated_data.get("longitude", None),
+                device_id=serializer.validated_data.get("device_id", None),
+                model=serializer.validated_data.get("model", None),
+            )
+            if attendance is None:
+                raise CustomException(ErrorCode.ALREADY_CHECKED_IN)
+            return attendance
+
         unique_token = None
 
         if serializer.validated_data.get("device_id", None):
@@ -145,7 +212,7 @@ class EventService:
         # 계속 생성되게 변경
         attendance = Attendance.objects.create(
             event=event,
-            generation_mapping=generation_mapping,
+            generation_mapping_id=generation_mapping_id,
             status=EventService.check_attendance_status(event),
             latitude=serializer.validated_data.get("latitude", None),
             longitude=serializer.validated_data.get("longitude", None),
@@ -175,6 +242,17 @@ class EventService:
 
         return attendance
 
+    @staticmethod
+    def check_location(event: Event, latitude, longitude):
+        """이벤트에 설정된 위치 영역 안에서 출석했는지 확인"""
+        geofence = Geofence.from_event(event)
+        if geofence is None:
+            return
+        if latitude is None or longitude is None:
+            raise CustomException(ErrorCode.LOCATION_REQUIRED)
+        if not geofence.contains(latitude, longitude):
+            raise CustomException(ErrorCode.OUT_OF_GEOFENCE)
+
     @staticmethod
     def check_attendance_status(event: Event):
         start_date_time = timezone.make_aware(
@@ -203,13 +281,14 @@ class EventService:
         send_notification: bool = True,
     ):
         # 가장 최근의 attendance 레코드를 가져옴
-        attendance = (
-            Attendance.objects.filter(
+        current = (
+            AttendanceCurrent.objects.filter(
                 event__id=event_id, generation_mapping__member__id=member_id
             )
-            .order_by("-created_at")
+            .select_related("attendance")
             .first()
         )
+        attendance = current.attendance if current else None
 
         # attendance가 없는 경우, 새로 생성
         if attendance is None or attendance.status != status:
@@ -245,31 +324,235 @@ class EventService:
 
     @staticmethod
     def attend_all(event: Event, user: User):
-        generation_mappings = GenMember.objects.filter(generation=event.generation)
-        for generation_mapping in generation_mappings:
-            # TODO: 알림 한번에 보내기
-            EventService.change_attendance_status(
-                event.id, generation_mapping.member.id, AttendanceStatus.PRESENT, user
+        modify_user = GenMember.objects.get(
+            member__user=user, generation=event.generation
+        )
+        # 최신 상태가 이미 출석인 멤버를 제외한 대상을 한 번에 조회
+        generation_mappings = list(
+            GenMember.objects.filter(generation=event.generation)
+            .exclude(
+                Exists(
+                    AttendanceCurrent.objects.filter(
+                        event=event,
+                        generation_mapping=OuterRef("pk"),
+                        status=AttendanceStatus.PRESENT,
+                    )
+                )
+            )
+            .select_related("member__user")
+        )
+        if not generation_mappings:
+            return []
+
+        with transaction.atomic():
+            attendances = Attendance.objects.bulk_create(
+                [
+                    Attendance(
+                        event=event,
+                        generation_mapping=generation_mapping,
+                        status=AttendanceStatus.PRESENT,
+                        created_by=modify_user,
+                        is_modified=True,
+                    )
+                    for generation_mapping in generation_mappings
+                ]
             )
+            AttendanceCurrent.sync(attendances)
+
+        fcm_component.send_to_users(
+            [
+                generation_mapping.member.user
+                for generation_mapping in generation_mappings
+            ],
+            NotificationTemplate.ATTENDANCE_CHANGE.get_title(),
+            NotificationTemplate.ATTENDANCE_CHANGE.get_body(
+                event_name=event.title,
+                attendance_status=AttendanceStatus.PRESENT.label,
+            ),
+            data=NotificationTemplate.ATTENDANCE_CHANGE.get_deeplink_data(
+                event_id=event.id,
+            ),
+        )
+        return attendances
 
     @staticmethod
     def get_me(event: Event, user: User):
         generation_mapping = GenMember.objects.get(
             member__user=user, generation=event.generation
         )
-        try:
-            attendance = (
-                Attendance.objects.filter(
-                    event=event, generation_mapping=generation_mapping
-                )
-                .order_by("-created_at")
-                .first()
+        if settings.ATTENDANCE_WRITE_BEHIND:
+            pending = CheckInQueue.get_pending(event.id, generation_mapping.id)
+            if pending is not None:
+                return pending
+        current = (
+            AttendanceCurrent.objects.filter(
+                event=event, generation_mapping=generation_mapping
             )
-            if attendance is None or attendance.status is None:
-                return Attendance(status=AttendanceStatus.UNCHECKED)
-            return attendance
-        except Attendance.DoesNotExist:
+            .select_related("attendance")
+            .first()
+        )
+        if current is None or current.status is None:
             return Attendance(status=AttendanceStatus.UNCHECKED)
+        return current.attendance
+
+    @staticmethod
+    def get_attendance_status_map(events, user: User) -> dict[int, int]:
+        """이벤트 목록에 대한 사용자의 최신 출석 상태를 한 번의 쿼리로 조회"""
+        return dict(
+            AttendanceCurrent.objects.filter(
+                event__in=events, generation_mapping__member__user=user
+            ).values_list("event_id", "status")
+        )
+
+    @staticmethod
+    def get_upcoming_events(
+        generation_id, user: User, past_limit: int = None, past_cursor: str = None
+    ) -> tuple[list[Event], str | None]:
+        """
+        기수의 다가오는 이벤트와 지난 이벤트를 한 번의 쿼리로 조회
+
+        각 이벤트에는 is_past(지난 이벤트 여부)와 user_attendance_status(사용자의
+        출석 상태)가 함께 조회되며, 다가오는 이벤트는 시작 시간 오름차순, 지난 이벤트는
+        내림차순으로 정렬됩니다.
+
+        Args:
+            past_limit: 지난 이벤트 최대 개수, None이면 전부 조회
+            past_cursor: 이전 조회에서 받은 커서, 그 다음 지난 이벤트부터 조회
+
+        Returns:
+            (이벤트 목록, 다음 지난 이벤트 커서)
+        """
+        yesterday = timezone.now().date() - timedelta(days=1)
+        events = Event.objects.filter(generation__id=generation_id).annotate(
+            is_past=Case(
+                When(date__lt=yesterday, then=Value(True)),
+                default=Value(False),
+                output_field=BooleanField(),
+            ),
+            user_attendance_status=Coalesce(
+                Subquery(
+                    AttendanceCurrent.objects.filter(
+                        event=OuterRef("pk"), generation_mapping__member__user=user
+                    ).values("status")[:1]
+                ),
+                Value(AttendanceStatus.UNCHECKED),
+            ),
+        )
+
+        if past_cursor:
+            start_datetime, event_id = EventService._decode_cursor(past_cursor)
+            events = events.filter(
+                Q(is_past=False)
+                | Q(start_datetime__lt=start_datetime)
+                | Q(start_datetime=start_datetime, id__lt=event_id)
+            )
+
+        if past_limit:
+            # 지난 이벤트에만 순번을 매겨 past_limit + 1개까지 조회 (다음 페이지 확인용)
+            # 윈도우 함수는 OR 조건으로 필터링할 수 없으므로 Case로 감싸서 사용
+            events = events.annotate(
+                past_rank=Case(
+                    When(is_past=False, then=Value(0)),
+                    default=Window(
+                        RowNumber(),
+                        partition_by=[F("is_past")],
+                        order_by=[F("start_datetime").desc(), F("id").desc()],
+                    ),
+                )
+            ).filter(past_rank__lte=past_limit + 1)
+
+        events = list(
+            events.order_by(
+                "is_past",
+                Case(When(is_past=False, then=F("start_datetime"))).asc(),
+                F("start_datetime").desc(),
+                F("id").desc(),
+            )
+        )
+
+        next_cursor = None
+        past_events = [event for event in events if event.is_past]
+        if past_limit and len(past_events) > past_limit:
+            events.remove(past_events[past_limit])
+            next_cursor = EventService._encode_cursor(past_events[past_limit - 1])
+        return events, next_cursor
+
+    @staticmethod
+    def _encode_cursor(event: Event) -> str:
+        value = f"{event.start_datetime.isoformat()}|{event.id}"
+        return base64.urlsafe_b64encode(value.encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+        try:
+            value = base64.urlsafe_b64decode(cursor.encode()).decode()
+            start_datetime, event_id = value.split("|")
+            return datetime.fromisoformat(start_datetime), int(event_id)
+        except (binascii.Error, UnicodeError, ValueError):
+            raise CustomException(ErrorCode.INVALID_CURSOR)
+
+    @staticmethod
+    def get_attendance_roster(event: Event):
+        """
+        이벤트 출석부
+
+        가장 최근 불참 신청이나 수정 요청이 아직 승인되지 않은 멤버를 먼저, 그다음
+        이름순(KOREAN_COLLATION)으로 DB에서 정렬합니다. 출석/불참 신청/수정 요청은
+        prefetch하므로 iterator(chunk_size=...)로 나눠서 읽을 수 있습니다.
+        """
+
+        def latest_is_approved(model):
+            return Subquery(
+                model.objects.filter(event=event, gen_member=OuterRef("pk"))
+                .order_by("-created_at", "-id")
+                .values("is_approved")[:1]
+            )
+
+        return (
+            GenMember.objects.filter(generation_id=event.generation_id)
+            .select_related("member__user")
+            .annotate(
+                latest_absent_apply_approved=latest_is_approved(AbsentApply),
+                latest_edit_request_approved=latest_is_approved(EditRequest),
+                has_pending_request=Case(
+                    When(
+                        Q(latest_absent_apply_approved=False)
+                        | Q(latest_edit_request_approved=False),
+                        then=Value(True),
+                    ),
+                    default=Value(False),
+                    output_field=BooleanField(),
+                ),
+            )
+            .prefetch_related(
+                Prefetch(
+                    "current_attendances",
+                    queryset=AttendanceCurrent.objects.filter(
+                        event=event
+                    ).select_related("attendance__created_by__member__user"),
+                    to_attr="event_current_attendances",
+                ),
+                Prefetch(
+                    "absentapply_set",
+                    queryset=AbsentApply.objects.filter(event=event).order_by(
+                        "created_at"
+                    ),
+                    to_attr="event_absent_applies",
+                ),
+                Prefetch(
+                    "editrequest_set",
+                    queryset=EditRequest.objects.filter(event=event).order_by(
+                        "created_at"
+                    ),
+                    to_attr="event_edit_requests",
+                ),
+            )
+            .order_by(
+                F("has_pending_request").desc(),
+                Collate("member__user__username", settings.KOREAN_COLLATION),
+                "id",
+            )
+        )
 
     @staticmethod
     def get_member_log(event: Event, gen_member_id: int):
@@ -0,0 +1,21 @@
+from django.db.models.signals import pre_delete
+from django.dispatch import receiver
+
+from api.club.models import GenMember
+from api.event.models import AttendanceCurrent, Event
+
+
+@receiver(pre_delete, sender=GenMember)
+def remove_gen_member_attendances(sender, instance: GenMember, **kwargs):
+    """
+    기수 멤버 삭제 전 최신 출석 상태를 이벤트별 출석 통계에서 빼줌
+
+    회원 탈퇴처럼 User 삭제의 CASCADE로 함께 삭제되는 경우에도 호출됩니다.
+    """
+    AttendanceCurrent.remove(instance.current_attendances.all())
+
+
+@receiver(pre_delete, sender=Event)
+def remove_event_attendances(sender, instance: Event, **kwargs):
+    """이벤트 삭제 전 최신 출석 상태를 멤버별 출석 통계에서 빼줌"""
+    AttendanceCurrent.remove(instance.current_attendances.all())
@@ -0,0 +1,209 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+
+from api.club.models import GenMember
+from api.club.services.apply_service import ApplyService
+from api.club.services.club_service import ClubService
+from api.event.models import (
+    Attendance,
+    AttendanceCurrent,
+    AttendanceStatus,
+    Event,
+    EventAttendanceStats,
+    GenMemberAttendanceStats,
+)
+from api.event.service.event_service import EventService
+from api.userapp.models import User
+from scheduler.tasks import reconcile_attendance_stats
+
+
+class AttendanceCurrentTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", identifier="testuser")
+        self.club, self.member = ClubService.create_club(
+            user=self.user,
+            name="Test Club",
+            description="Test Club Description",
+            short_description="Test Club",
+            image=None,
+            generation_data={
+                "name": "Test Generation",
+                "start_date": timezone.now().date(),
+                "end_date": (timezone.now() + timedelta(days=1)).date(),
+            },
+        )
+        now = timezone.now()
+        self.event = Event.objects.create(
+            generation=self.club.current_generation,
+            title="Test Event",
+            date=now.date(),
+            start_datetime=now,
+            end_datetime=now + timedelta(hours=1),
+            start_minutes=-10,
+            late_minutes=10,
+            fail_minutes=30,
+            location="Test Location",
+        )
+        self.gen_member = GenMember.objects.get(
+            member=self.member, generation=self.event.generation
+        )
+
+    def get_current(self):
+        return AttendanceCurrent.objects.get(
+            event=self.event, generation_mapping=self.gen_member
+        )
+
+    def create_attendance(self, status):
+        return Attendance.objects.create(
+            event=self.event, generation_mapping=self.gen_member, status=status
+        )
+
+    def test_latest_attendance_is_projected(self):
+        self.create_attendance(AttendanceStatus.UNCHECKED)
+        latest = self.create_attendance(AttendanceStatus.LATE)
+
+        current = self.get_current()
+        self.assertEqual(current.attendance_id, latest.id)
+        self.assertEqual(current.status, AttendanceStatus.LATE)
+        self.assertEqual(AttendanceCurrent.objects.filter(event=self.event).count(), 1)
+
+    def test_editing_old_attendance_keeps_latest(self):
+        old = self.create_attendance(AttendanceStatus.PRESENT)
+        latest = self.create_attendance(AttendanceStatus.ABSENT)
+
+        old.status = AttendanceStatus.LATE
+        old.save()
+
+        current = self.get_current()
+        self.assertEqual(current.attendance_id, latest.id)
+        self.assertEqual(current.status, AttendanceStatus.ABSENT)
+
+    def test_deleting_latest_attendance_falls_back(self):
+        old = self.create_attendance(AttendanceStatus.PRESENT)
+        latest = self.create_attendance(AttendanceStatus.ABSENT)
+
+        latest.delete()
+        self.assertEqual(self.get_current().attendance_id, old.id)
+
+        old.delete()
+        self.assertFalse(AttendanceCurrent.objects.filter(event=self.event).exists())
+
+    def test_bulk_created_attendances_are_synced(self):
+        attendances = Attendance.objects.bulk_create(
+            [
+                Attendance(
+                    event=self.event,
+                    generation_mapping=self.gen_member,
+                    status=AttendanceStatus.ABSENT,
+                )
+            ]
+        )
+        AttendanceCurrent.sync(attendances)
+
+        self.assertEqual(self.get_current().status, AttendanceStatus.ABSENT)
+
+    def test_change_attendance_status_is_read_back(self):
+        EventService.change_attendance_status(
+            self.event.id,
+            self.member.id,
+            AttendanceStatus.LATE,
+            self.user,
+            send_notification=False,
+        )
+
+        attendance = EventService.get_me(self.event, self.user)
+        self.assertEqual(attendance.status, AttendanceStatus.LATE)
+        self.assertTrue(attendance.is_modified)
+
+    @mock.patch("api.event.service.event_service.fcm_component.send_to_users")
+    def test_attend_all_skips_present_members(self, send_to_users):
+        attendances = EventService.attend_all(self.event, self.user)
+
+        self.assertEqual(len(attendances), 1)
+        self.assertEqual(self.get_current().status, AttendanceStatus.PRESENT)
+        send_to_users.assert_called_once()
+        self.assertEqual(send_to_users.call_args.args[0], [self.user])
+
+        send_to_users.reset_mock()
+        self.assertEqual(EventService.attend_all(self.event, self.user), [])
+        send_to_users.assert_not_called()
+
+    def get_stats(self):
+        member = GenMemberAttendanceStats.objects.filter(gen_member=self.gen_member)
+        event = EventAttendanceStats.objects.filter(event=self.event)
+        return (
+            member.values_list("present_count", "late_count", "absent_count").first(),
+            event.values_list("present_count", "late_count", "absent_count").first(),
+        )
+
+    def test_stats_follow_latest_status(self):
+        self.create_attendance(AttendanceStatus.UNCHECKED)
+        self.assertEqual(self.get_stats(), (None, None))
+
+        late = self.create_attendance(AttendanceStatus.LATE)
+        self.assertEqual(self.get_stats(), ((0, 1, 0), (0, 1, 0)))
+
+        late.status = AttendanceStatus.PRESENT
+        late.save()
+        self.assertEqual(self.get_stats(), ((1, 0, 0), (1, 0, 0)))
+
+        Attendance.objects.filter(event=self.event).first().delete()
+        late.delete()
+        self.assertEqual(self.get_stats(), ((0, 0, 0), (0, 0, 0)))
+
+    def test_deleting_latest_attendance_updates_stats(self):
+        self.create_attendance(AttendanceStatus.PRESENT)
+        latest = self.create_attendance(AttendanceStatus.LATE)
+
+        latest.delete()
+
+        self.assertEqual(self.get_current().status, AttendanceStatus.PRESENT)
+        self.assertEqual(self.get_stats(), ((1, 0, 0), (1, 0, 0)))
+
+    def test_user_deletion_updates_event_stats(self):
+        other = User.objects.create_user(username="other", identifier="other")
+        _, gen_member = ApplyService.join_generation(
+            other, self.club.current_generation
+        )
+        Attendance.objects.create(
+            event=self.event,
+            generation_mapping=gen_member,
+            status=AttendanceStatus.LATE,
+        )
+        self.create_attendance(AttendanceStatus.PRESENT)
+
+        other.delete()
+
+        self.assertEqual(self.get_stats(), ((1, 0, 0), (1, 0, 0)))
+
+    def test_update_status_updates_stats(self):
+        self.create_attendance(AttendanceStatus.UNCHECKED)
+
+        updated = AttendanceCurrent.update_status(
+            AttendanceCurrent.objects.filter(
+                event=self.event, status=AttendanceStatus.UNCHECKED
+            ),
+            AttendanceStatus.ABSENT,
+        )
+
+        self.assertEqual(updated, 1)
+        self.assertEqual(self.get_current().status, AttendanceStatus.ABSENT)
+        self.assertEqual(self.get_stats(), ((0, 0, 1), (0, 0, 1)))
+
+    def test_reconcile_fixes_drift(self):
+        self.create_attendance(AttendanceStatus.PRESENT)
+        GenMemberAttendanceStats.objects.filter(gen_member=self.gen_member).update(
+            present_count=5, absent_count=2
+        )
+        EventAttendanceStats.objects.filter(event=self.event).delete()
+
+        result = reconcile_attendance_stats()
+
+        self.assertEqual(result, {"fixed_members": 1, "fixed_events": 1})
+        self.assertEqual(self.get_stats(), ((1, 0, 0), (1, 0, 0)))
+        self.assertEqual(
+            reconcile_attendance_stats(), {"fixed_members": 0, "fixed_events": 0}
+        )
@@ -0,0 +1,198 @@
+import json
+from contextlib import nullcontext
+from datetime import timedelta
+from unittest import mock
+
+from django.db import IntegrityError
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from api.club.models import GenMember
+from api.club.services.club_service import ClubService
+from api.event.models import (
+    Attendance,
+    AttendanceCurrent,
+    AttendanceStatus,
+    Event,
+    GenMemberAttendanceStats,
+)
+from api.event.service.checkin_queue import CheckInQueue
+from api.event.service.event_service import EventService
+from api.userapp.models import User
+
+
+class CheckInQueueTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", identifier="testuser")
+        self.club, self.member = ClubService.create_club(
+            user=self.user,
+            name="Test Club",
+            description="Test Club Description",
+            short_description="Test Club",
+            image=None,
+            generation_data={
+                "name": "Test Generation",
+                "start_date": timezone.now().date(),
+                "end_date": (timezone.now() + timedelta(days=1)).date(),
+            },
+        )
+        now = timezone.now()
+        self.event = Event.objects.create(
+            generation=self.club.current_generation,
+            title="Test Event",
+            date=now.date(),
+            start_datetime=now,
+            end_datetime=now + timedelta(hours=1),
+            start_minutes=-10,
+            late_minutes=10,
+            fail_minutes=30,
+            location="Test Location",
+        )
+        self.gen_member = GenMember.objects.get(
+            member=self.member, generation=self.event.generation
+        )
+
+    def make_payload(self, status, created_at):
+        return {
+            "event_id": self.event.id,
+            "generation_mapping_id": self.gen_member.id,
+            "user_id": self.user.id,
+            "status": status,
+            "latitude": None,
+            "longitude": None,
+            "device_id": None,
+            "model": None,
+            "created_at": created_at.isoformat(),
+        }
+
+    def get_current(self):
+        return AttendanceCurrent.objects.get(
+            event=self.event, generation_mapping=self.gen_member
+        )
+
+    def test_queued_checkin_is_saved(self):
+        created_at = timezone.now() - timedelta(seconds=5)
+
+        attendances = CheckInQueue._create_attendances(
+            [self.make_payload(AttendanceStatus.PRESENT, created_at)]
+        )
+
+        self.assertEqual(len(attendances), 1)
+        current = self.get_current()
+        self.assertEqual(current.status, AttendanceStatus.PRESENT)
+        self.assertEqual(current.attendance.created_at, created_at)
+
+    def test_edit_before_drain_is_kept(self):
+        payload = self.make_payload(
+            AttendanceStatus.PRESENT, timezone.now() - timedelta(seconds=5)
+        )
+        EventService.change_attendance_status(
+            self.event.id,
+            self.member.id,
+            AttendanceStatus.LATE,
+            self.user,
+            send_notification=False,
+        )
+
+        CheckInQueue._create_attendances([payload])
+
+        # 늦게 저장된 출석은 이력에만 남고 최신 상태와 통계는 관리자 수정을 유지
+        self.assertEqual(Attendance.objects.filter(event=self.event).count(), 2)
+        self.assertEqual(self.get_current().status, AttendanceStatus.LATE)
+        stats = GenMemberAttendanceStats.objects.get(gen_member=self.gen_member)
+        self.assertEqual((stats.present_count, stats.late_count), (0, 1))
+
+    def drain_after_absent_marked(self):
+        payload = self.make_payload(
+            AttendanceStatus.LATE, timezone.now() - timedelta(seconds=5)
+        )
+        Attendance.objects.create(
+            event=self.event,
+            generation_mapping=self.gen_member,
+            status=AttendanceStatus.UNCHECKED,
+        )
+        # 출석 전 기록이 큐의 출석보다 먼저 만들어지고, 그 뒤 결석 처리됨
+        Attendance.objects.filter(event=self.event).update(
+            status=AttendanceStatus.ABSENT,
+            is_modified=True,
+            created_at=timezone.now() - timedelta(minutes=10),
+            modified_at=timezone.now(),
+        )
+        AttendanceCurrent.update_status(
+            AttendanceCurrent.objects.filter(event=self.event), AttendanceStatus.ABSENT
+        )
+
+        CheckInQueue._create_attendances([payload])
+
+    def test_absent_marked_before_drain_is_kept(self):
+        self.drain_after_absent_marked()
+
+        self.assertEqual(self.get_current().status, AttendanceStatus.ABSENT)
+
+    def test_refresh_keeps_absent_marked_after_late_checkin(self):
+        self.drain_after_absent_marked()
+
+        # 이후 같은 칸의 이력이 수정/삭제되어 다시 계산해도 결석 처리가 최신
+        AttendanceCurrent.refresh(self.event.id, self.gen_member.id)
+
+        self.assertEqual(self.get_current().status, AttendanceStatus.ABSENT)
+        stats = GenMemberAttendanceStats.objects.get(gen_member=self.gen_member)
+        self.assertEqual(
+            (stats.present_count, stats.late_count, stats.absent_count), (0, 0, 1)
+        )
+
+
+@mock.patch("api.event.service.checkin_queue.transaction.atomic", lambda: nullcontext())
+class CheckInQueuePoisonTests(SimpleTestCase):
+    def setUp(self):
+        self.redis = mock.MagicMock()
+        self.pipeline = self.redis.pipeline.return_value
+        self.entries = [
+            (
+                f"{i}-0".encode(),
+                {
+                    b"data": json.dumps(
+                        {"event_id": 1, "generation_mapping_id": i}
+                    ).encode()
+                },
+            )
+            for i in range(1, 6)
+        ]
+
+    def create_attendances(self, payloads):
+        # generation_mapping_id가 3인 요청은 저장할 수 없음 (삭제된 멤버 등)
+        if any(p["generation_mapping_id"] == 3 for p in payloads):
+            raise IntegrityError("violates foreign key constraint")
+        return payloads
+
+    def acked_ids(self):
+        return [
+            message_id
+            for call in self.pipeline.xack.call_args_list
+            for message_id in call.args[2:]
+        ]
+
+    def write_batch(self, times_delivered):
+        self.redis.xpending_range.return_value = [{"times_delivered": times_delivered}]
+        with mock.patch.object(
+            CheckInQueue, "_create_attendances", side_effect=self.create_attendances
+        ):
+            return CheckInQueue._write_batch(self.redis, self.entries)
+
+    def test_bad_entry_does_not_block_batch(self):
+        self.assertEqual(self.write_batch(times_delivered=1), 4)
+
+        self.assertEqual(sorted(self.acked_ids()), [b"1-0", b"2-0", b"4-0", b"5-0"])
+        self.pipeline.xadd.assert_not_called()
+
+    def test_bad_entry_is_dead_lettered(self):
+        self.assertEqual(
+            self.write_batch(times_delivered=CheckInQueue.MAX_DELIVERIES), 4
+        )
+
+        self.assertIn(b"3-0", self.acked_ids())
+        self.pipeline.xadd.assert_called_once()
+        key, fields = self.pipeline.xadd.call_args.args
+        self.assertEqual(key, CheckInQueue.DEAD_LETTER_KEY)
+        self.assertEqual(fields["message_id"], b"3-0")
+        self.pipeline.hdel.assert_any_call("checkin:pending:1", 3)
@@ -1,3 +1,4 @@
+import json
 from datetime import timedelta
 from unittest.mock import patch
 
@@ -5,8 +6,10 @@ from django.utils import timezone
 from rest_framework.reverse import reverse
 from rest_framework.test import APIClient, APITestCase
 
+from api.club.models import Member
 from api.club.services.club_service import ClubService, GenMember
-from api.event.models import Attendance, AttendanceStatus, Event
+from api.event.models import AbsentApply, Attendance, AttendanceStatus, Event
+from api.event.models.edit_request import EditRequest
 from api.userapp.models import User
 from common.test_utils.image_utils import ImageTestUtils
 
@@ -26,6 +29,7 @@ class EventAttendanceViewTests(APITestCase):
             user=self.user,
             name="Test Club",
             description="Test Club Description",
+            short_description="Test Club",
             image=None,
             generation_data={
                 "name": "Test Generation",
@@ -39,8 +43,8 @@ class EventAttendanceViewTests(APITestCase):
             title="Test Event",
             description="Test Event Description",
             date=timezone.localtime(timezone.now()),
-            start_time=timezone.localtime(timezone.now()),
-            end_time=timezone.localtime(timezone.now()) + timedelta(days=1),
+            start_datetime=timezone.localtime(timezone.now()),
+            end_datetime=timezone.localtime(timezone.now()) + timedelta(days=1),
             start_minutes=0,
             late_minutes=10,
             fail_minutes=30,
@@ -55,7 +59,6 @@ class EventAttendanceViewTests(APITestCase):
         mock_storage.return_value = "test-image-path.jpg"
 
         now = timezone.localtime(timezone.now())
-        end_time = (now + timedelta(hours=1)).time()
 
         event = Event.objects.create(
             title="Test Event",
@@ -64,8 +67,8 @@ class EventAttendanceViewTests(APITestCase):
             images=[ImageTestUtils.create_test_image()],
             generation=self.club.current_generation,
             date=now.date(),
-            start_time=now.time(),
-            end_time=end_time,
+            start_datetime=now,
+            end_datetime=now + timedelta(hours=1),
             start_minutes=-10,
             late_minutes=10,
             fail_minutes=30,
@@ -127,3 +130,128 @@ class EventAttendanceViewTests(APITestCase):
         attendance.refresh_from_db()
         self.assertEqual(attendance.status, AttendanceStatus.LATE.value)
         self.assertEqual(attendance.is_modified, True)
+
+    def test_attendances_stream(self):
+        """?stream=1 응답이 일반 응답과 같은지 확인"""
+        generation = self.club.current_generation
+        gen_members = []
+        for name in ["나", "가", "다"]:
+            user = User.objects.create_user(username=name, identifier=name)
+            member = Member.objects.create(user=user, club=self.club)
+            gen_members.append(
+                GenMember.objects.create(member=member, generation=generation)
+            )
+        Attendance.objects.create(
+            event=self.event,
+            generation_mapping=gen_members[0],
+            status=AttendanceStatus.LATE,
+        )
+        AbsentApply.objects.create(
+            gen_member=gen_members[2], event=self.event, reason="개인 사정"
+        )
+
+        url = reverse("event-attendance", kwargs={"event_id": self.event.id})
+        response = self.client.get(url)
+        stream_response = self.client.get(url, {"stream": 1})
+
+        self.assertEqual(stream_response.status_code, 200)
+        self.assertEqual(
+            json.loads(b"".join(stream_response.streaming_content)), response.json()
+        )
+        members = response.json()["data"]["members"]
+        self.assertEqual(members[0]["member"]["user"]["username"], "다")
+
+    def test_attendances_pending_first(self):
+        """승인 대기 중인 신청이 있는 멤버가 먼저, 그다음 이름순으로 정렬"""
+        generation = self.club.current_generation
+        gen_members = {}
+        for name in ["하늘", "가람", "나래", "다온"]:
+            user = User.objects.create_user(username=name, identifier=name)
+            member = Member.objects.create(user=user, club=self.club)
+            gen_members[name] = GenMember.objects.create(
+                member=member, generation=generation
+            )
+        AbsentApply.objects.create(
+            gen_member=gen_members["하늘"], event=self.event, reason="개인 사정"
+        )
+        AbsentApply.objects.create(
+            gen_member=gen_members["가람"],
+            event=self.event,
+            reason="개인 사정",
+            is_approved=True,
+        )
+
+        response = self.client.get(
+            reverse("event-attendance", kwargs={"event_id": self.event.id})
+        )
+
+        usernames = [
+            member["member"]["user"]["username"]
+            for member in response.json()["data"]["members"]
+        ]
+        self.assertEqual(usernames[0], "하늘")
+        self.assertEqual(
+            [name for name in usernames if name in gen_members],
+            ["하늘", "가람", "나래", "다온"],
+        )
+
+    def test_attendances_pending_uses_latest_request(self):
+        """가장 최근 신청이 승인되지 않은 멤버만 승인 대기로 정렬"""
+        generation = self.club.current_generation
+        gen_members = {}
+        for name in ["가람", "나래", "다온"]:
+            user = User.objects.create_user(username=name, identifier=name)
+            member = Member.objects.create(user=user, club=self.club)
+            gen_members[name] = GenMember.objects.create(
+                member=member, generation=generation
+            )
+        # 가람: 예전 신청은 대기 중이지만 가장 최근 신청은 승인됨
+        AbsentApply.objects.create(
+            gen_member=gen_members["가람"], event=self.event, reason="개인 사정"
+        )
+        AbsentApply.objects.create(
+            gen_member=gen_members["가람"],
+            event=self.event,
+            reason="개인 사정",
+            is_approved=True,
+        )
+        # 다온: 가장 최근 수정 요청이 승인되지 않음
+        EditRequest.objects.create(
+            gen_member=gen_members["다온"], event=self.event, reason="출석 수정"
+        )
+
+        response = self.client.get(
+            reverse("event-attendance", kwargs={"event_id": self.event.id})
+        )
+
+        usernames = [
+            member["member"]["user"]["username"]
+            for member in response.json()["data"]["members"]
+        ]
+        self.assertEqual(usernames[0], "다온")
+        self.assertEqual(
+            [name for name in usernames if name in gen_members],
+            ["다온", "가람", "나래"],
+        )
+
+    def test_attendances_default_collation(self):
+        """기본 collation("C")은 ICU 없이도 동작하고 코드 포인트 순서로 정렬"""
+        generation = self.club.current_generation
+        for name in ["나래", "Alice", "가람"]:
+            user = User.objects.create_user(username=name, identifier=name)
+            member = Member.objects.create(user=user, club=self.club)
+            GenMember.objects.create(member=member, generation=generation)
+
+        response = self.client.get(
+            reverse("event-attendance", kwargs={"event_id": self.event.id})
+        )
+
+        self.assertEqual(response.status_code, 200)
+        usernames = [
+            member["member"]["user"]["username"]
+            for member in response.json()["data"]["members"]
+        ]
+        self.assertEqual(
+            [name for name in usernames if name in ["나래", "Alice", "가람"]],
+            ["Alice", "가람", "나래"],
+        )
@@ -1,12 +1,14 @@
 from datetime import timedelta
 from unittest.mock import patch
 
+from django.test import override_settings
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework.test import APIClient, APITestCase
 
+from api.club.models import GenMember
 from api.club.services.club_service import ClubService
-from api.event.models import Event
+from api.event.models import Attendance, AttendanceStatus, Event
 from api.userapp.models import User
 from common.test_utils.image_utils import ImageTestUtils
 
@@ -215,3 +217,119 @@ class EventViewSetTests(APITestCase):
         self.assertEqual(response.data["start_minutes"], 0)
         self.assertEqual(response.data["late_minutes"], 10)
         self.assertEqual(response.data["fail_minutes"], 30)
+
+
+class EventListQueryCountTests(APITestCase):
+    """이벤트 목록의 출석 상태 조회가 이벤트 수와 무관하게 일정한 쿼리 수로 처리되는지 확인"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username="testuser", identifier="testuser")
+        self.client.force_authenticate(user=self.user)
+        self.club, self.member = ClubService.create_club(
+            user=self.user,
+            name="Test Club",
+            description="Test Club Description",
+            short_description="Test Club",
+            image=None,
+            generation_data={
+                "name": "Test Generation",
+                "start_date": timezone.now().date(),
+                "end_date": (timezone.now() + timedelta(days=1)).date(),
+            },
+        )
+        self.generation = self.club.current_generation
+        gen_member = GenMember.objects.get(
+            member=self.member, generation=self.generation
+        )
+
+        now = timezone.now()
+        for i in range(10):
+            start = now + timedelta(days=i - 5)
+            event = Event.objects.create(
+                title=f"Test Event {i}",
+                location="Test Location",
+                images=[],
+                generation=self.generation,
+                date=start.date(),
+                start_datetime=start,
+                end_datetime=start + timedelta(hours=1),
+                start_minutes=0,
+                late_minutes=10,
+                fail_minutes=30,
+            )
+            if i % 2 == 0:
+                Attendance.objects.create(
+                    event=event,
+                    generation_mapping=gen_member,
+                    status=AttendanceStatus.LATE,
+                )
+
+    @override_settings(QUERY_COUNT_HEADER=True)
+    def test_upcoming_query_count(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                reverse("event-upcoming"), {"gid": self.generation.id}
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["X-Query-Count"], "1")
+        with override_settings(QUERY_COUNT_HEADER=False):
+            response = self.client.get(
+                reverse("event-upcoming"), {"gid": self.generation.id}
+            )
+        self.assertNotIn("X-Query-Count", response)
+        events = response.data["past_events"] + response.data["upcoming_events"]
+        self.assertEqual(
+            sorted(event["attendance_status"] for event in events),
+            [0] * 5 + [AttendanceStatus.LATE] * 5,
+        )
+
+    def test_upcoming_past_events_paging(self):
+        url = reverse("event-upcoming")
+
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                url, {"gid": self.generation.id, "past_limit": 3}
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["upcoming_events"]), 6)
+        first_page = response.data["past_events"]
+        self.assertEqual(
+            [event["title"] for event in first_page],
+            ["Test Event 3", "Test Event 2", "Test Event 1"],
+        )
+        self.assertIsNotNone(response.data["past_next_cursor"])
+
+        response = self.client.get(
+            url,
+            {
+                "gid": self.generation.id,
+                "past_limit": 3,
+                "past_cursor": response.data["past_next_cursor"],
+            },
+        )
+
+        self.assertEqual(
+            [event["title"] for event in response.data["past_events"]],
+            ["Test Event 0"],
+        )
+        self.assertIsNone(response.data["past_next_cursor"])
+
+    def test_upcoming_invalid_cursor(self):
+        response = self.client.get(
+            reverse("event-upcoming"),
+            {"gid": self.generation.id, "past_cursor": "invalid"},
+        )
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_generation_events_query_count(self):
+        with self.assertNumQueries(3):
+            response = self.client.get(
+                reverse("generations-events", kwargs={"pk": self.generation.id})
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data), 10)
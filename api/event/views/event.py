@@ -16,9 +16,11 @@ from api.event.serializers import (
 from api.event.serializers.event_serializer import (
     EventDefaultTimesSerializer,
     EventListForPCSerializer,
+    UpcomingEventQuerySerializer,
 )
 from api.event.service.event_service import EventService
 from common.responses.simple_response import SimpleResponse
+from common.utils.query_count import report_query_count
 
 
 class EventViewSet(
@@ -73,14 +75,24 @@ class EventViewSet(
         return Response(GenerationSimpleInfoSerializer(generation).data)
 
     @action(detail=False, methods=["get"])
+    @report_query_count
     def upcoming(self, request, *args, **kwargs):
         """
         다가오는 이벤트 정보
-        /events/upcoming/?gid={generation_id}
+        /events/upcoming/?gid={generation_id}&past_limit={limit}&past_cursor={cursor}
         """
-        generation_id = request.query_params.get("gid")
-        events = Event.objects.filter(generation__id=generation_id)
-        serializer = UpcomingEventSerializer(events, context={"user": request.user})
+        query = UpcomingEventQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        events, past_next_cursor = EventService.get_upcoming_events(
+            request.query_params.get("gid"),
+            request.user,
+            past_limit=query.validated_data.get("past_limit"),
+            past_cursor=query.validated_data.get("past_cursor"),
+        )
+        serializer = UpcomingEventSerializer(
+            events,
+            context={"user": request.user, "past_next_cursor": past_next_cursor},
+        )
         return Response(serializer.data)
 
     @swagger_auto_schema(
@@ -12,8 +12,11 @@ from api.event.serializers import (
     EventAttendanceSerializer,
     ModifyAttendanceSerializer,
 )
+from api.event.serializers.event_serializer import MemberAttendanceSerializer
 from api.event.service.event_service import EventService
 from common.responses.simple_response import SimpleResponse
+from common.responses.streaming_response import StreamingJSONResponse
+from common.serializers.field_projection import restrict_fields
 
 logger = logging.getLogger(__name__)
 
@@ -50,8 +53,24 @@ class EventAttendanceView(
         return Response(result.data)
 
     def attendances(self, request, *args, **kwargs):
-        """이벤트 출석 정보 조회"""
+        """
+        이벤트 출석 정보 조회
+        ?stream=1이면 멤버별 출석 정보를 한 행씩 스트리밍
+        """
         event = Event.objects.get(id=kwargs.get(self.lookup_field))
+        if StreamingJSONResponse.is_requested(request):
+            serializer = MemberAttendanceSerializer()
+            roster = EventService.get_attendance_roster(event)
+            return StreamingJSONResponse(
+                (
+                    serializer.to_representation(gen_member)
+                    for gen_member in roster.iterator(chunk_size=200)
+                ),
+                head=restrict_fields(
+                    EventAttendanceSerializer(event), ["id", "title", "date"]
+                ).data,
+                list_key="members",
+            )
         serializer = EventAttendanceSerializer(event)
         return Response(serializer.data)
 
@@ -0,0 +1,30 @@
+# Generated by Django 5.1.4 on 2026-10-18 09:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('club', '0015_generation_google_sheet_id'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotionPageMapping',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('database_id', models.CharField(max_length=64)),
+                ('page_id', models.CharField(max_length=64)),
+                ('content_hash', models.CharField(max_length=64)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('gen_member', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='notion_pages', to='club.genmember')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('database_id', 'gen_member'), name='unique_notion_page_per_gen_member')],
+            },
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.1.4 on 2026-10-18 09:29
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('club', '0015_generation_google_sheet_id'),
+        ('notion', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='notionpagemapping',
+            name='gen_member',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='notion_pages', to='club.genmember'),
+        ),
+    ]
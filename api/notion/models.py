@@ -1,3 +1,35 @@
 from django.db import models
 
-# Create your models here.
+from api.club.models import GenMember
+
+
+class NotionPageMapping(models.Model):
+    """
+    노션 출석 데이터베이스의 행(page)과 기수 멤버의 매핑
+
+    마지막으로 보낸 행 내용의 해시를 함께 저장해서, 다음 동기화 때 내용이 바뀐
+    행만 수정하고 새 멤버는 추가, 빠진 멤버는 보관(archive) 처리합니다.
+    """
+
+    def __str__(self):
+        return f"{self.database_id} - {self.gen_member_id} - {self.page_id}"
+
+    database_id = models.CharField(max_length=64)
+    # 기수 멤버가 삭제되어도 매핑을 남겨야 다음 동기화에서 노션 행을 보관 처리할 수 있음
+    gen_member = models.ForeignKey(
+        GenMember,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="notion_pages",
+    )
+    page_id = models.CharField(max_length=64)
+    content_hash = models.CharField(max_length=64)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["database_id", "gen_member"],
+                name="unique_notion_page_per_gen_member",
+            )
+        ]
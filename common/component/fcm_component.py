@@ -7,6 +7,8 @@ from api.userapp.models import User
 
 
 class FCMComponent:
+    MULTICAST_LIMIT = 500
+
     def __init__(self):
         pass
 
@@ -90,34 +92,40 @@ class FCMComponent:
                 print("FCM 토큰 리스트가 비어있습니다.")
                 return {"success_count": 0, "failure_count": 0}
 
-            # APNS 설정을 포함한 멀티캐스트 메시지 생성
-            message = messaging.MulticastMessage(
-                notification=messaging.Notification(
-                    title=title,
-                    body=body,
-                ),
-                apns=messaging.APNSConfig(
-                    headers={"apns-priority": "10"},
-                    payload=messaging.APNSPayload(
-                        aps=messaging.Aps(
-                            sound="default",
-                            badge=1,
-                            content_available=True,
-                            mutable_content=True,
-                        )
+            success_count = 0
+            failure_count = 0
+            # FCM은 멀티캐스트 한 번에 최대 500개 토큰까지 허용
+            for i in range(0, len(tokens), self.MULTICAST_LIMIT):
+                # APNS 설정을 포함한 멀티캐스트 메시지 생성
+                message = messaging.MulticastMessage(
+                    notification=messaging.Notification(
+                        title=title,
+                        body=body,
                     ),
-                ),
-                data=data if data else {},
-                tokens=tokens,
-            )
+                    apns=messaging.APNSConfig(
+                        headers={"apns-priority": "10"},
+                        payload=messaging.APNSPayload(
+                            aps=messaging.Aps(
+                                sound="default",
+                                badge=1,
+                                content_available=True,
+                                mutable_content=True,
+                            )
+                        ),
+                    ),
+                    data=data if data else {},
+                    tokens=tokens[i : i + self.MULTICAST_LIMIT],
+                )
 
-            # 메시지 전송
-            response = messaging.send_each_for_multicast(message)
-            logger.info(response)
+                # 메시지 전송
+                response = messaging.send_each_for_multicast(message)
+                logger.info(response)
+                success_count += response.success_count
+                failure_count += response.failure_count
 
             return {
-                "success_count": response.success_count,
-                "failure_count": response.failure_count,
+                "success_count": success_count,
+                "failure_count": failure_count,
             }
 
         except Exception as e:
@@ -128,12 +128,32 @@ class ErrorCode(Enum):
         "CE013",
         status.HTTP_400_BAD_REQUEST,
     )
+    INVALID_CURSOR = (
+        "유효하지 않은 커서입니다",
+        "CE014",
+        status.HTTP_400_BAD_REQUEST,
+    )
+    EXPORT_JOB_NOT_FOUND = (
+        "내보내기 작업을 찾을 수 없습니다",
+        "CE015",
+        status.HTTP_404_NOT_FOUND,
+    )
     ## 출석 관련 오류
     ALREADY_CHECKED_IN = (
         "이미 출석 체크를 완료하였습니다",
         "CI001",
         status.HTTP_400_BAD_REQUEST,
     )
+    LOCATION_REQUIRED = (
+        "위치 정보가 필요합니다",
+        "CI002",
+        status.HTTP_400_BAD_REQUEST,
+    )
+    OUT_OF_GEOFENCE = (
+        "출석 가능한 위치가 아닙니다",
+        "CI003",
+        status.HTTP_400_BAD_REQUEST,
+    )
 
     ## PC 세션 관련 에러
     PC_SESSION_EXPIRED = (
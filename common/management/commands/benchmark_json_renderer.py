@@ -0,0 +1,108 @@
+import time
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework.response import Response
+
+from config.json_renderer import CustomJSONRenderer, StdlibJSONRenderer
+
+
+def build_roster_payload(members_count: int) -> dict:
+    """EventAttendanceSerializer 응답과 같은 구조의 출석부 데이터"""
+    now = timezone.now()
+    members = []
+    for i in range(members_count):
+        created_at = now - timedelta(minutes=i, microseconds=i * 137)
+        members.append(
+            {
+                "member_id": i + 1,
+                "gen_member_id": i + 1,
+                "member": {
+                    "id": i + 1,
+                    "user": {
+                        "id": i + 1,
+                        "username": f"멤버{i}",
+                        "email": f"member{i}@example.com",
+                        "phone_number": "010-0000-0000",
+                        "profile_image": None,
+                        "initialized": True,
+                    },
+                    "tags": ["개발", "디자인"][: i % 3],
+                    "short_description": "한 줄 소개",
+                    "description": None,
+                    "profile_image": None,
+                },
+                "attendance_status": {
+                    "id": i + 1,
+                    "status": i % 4,
+                    "created_at": created_at,
+                    "updated_at": created_at,
+                    "latitude": Decimal("37.566535") + Decimal(i) / 10**6,
+                    "longitude": Decimal("126.977969"),
+                    "device_id": uuid.UUID(int=i),
+                    "is_modified": i % 5 == 0,
+                },
+                "absent_apply": None,
+                "edit_request": None,
+            }
+        )
+    return {
+        "id": 1,
+        "title": "정기 세션",
+        "date": now.date(),
+        "members": members,
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "대표적인 출석부 응답으로 표준 json 렌더러와 orjson 렌더러의 "
+        "인코딩 시간을 비교합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--members",
+            type=int,
+            default=300,
+            help="출석부 멤버 수 (기본값: 300)",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=200,
+            help="렌더러별 반복 횟수 (기본값: 200)",
+        )
+
+    def handle(self, *args, **options):
+        payload = build_roster_payload(options["members"])
+        renderer_context = {"response": Response(status=200)}
+
+        results = {}
+        outputs = {}
+        for renderer in (StdlibJSONRenderer(), CustomJSONRenderer()):
+            name = type(renderer).__name__
+            started = time.perf_counter()
+            for _ in range(options["repeat"]):
+                outputs[name] = renderer.render(
+                    payload, renderer_context=renderer_context
+                )
+            results[name] = (time.perf_counter() - started) / options["repeat"]
+
+        self.stdout.write(
+            f"멤버 {options['members']}명, 응답 크기 "
+            f"{len(outputs['CustomJSONRenderer']) / 1024:.1f}KB"
+        )
+        for name, elapsed in results.items():
+            self.stdout.write(f"{name:<20} {elapsed * 1000:>8.3f} ms")
+        self.stdout.write(
+            f"speedup: {results['StdlibJSONRenderer'] / results['CustomJSONRenderer']:.1f}x"
+        )
+
+        if outputs["StdlibJSONRenderer"] == outputs["CustomJSONRenderer"]:
+            self.stdout.write(self.style.SUCCESS("두 렌더러의 출력이 같습니다."))
+        else:
+            self.stdout.write(self.style.ERROR("두 렌더러의 출력이 다릅니다."))
@@ -0,0 +1,16 @@
+from rest_framework.pagination import CursorPagination
+
+
+class DefaultCursorPagination(CursorPagination):
+    """
+    커서 기반 페이지네이션
+
+    ?cursor=로 다음/이전 페이지를, ?page_size=로 페이지 크기를 지정합니다.
+    정렬 기준(ordering)은 뷰에서 지정하며 첫 번째 기준은 모델 인스턴스의 속성이어야
+    합니다. (연관 모델 필드로 정렬하려면 annotate 후 사용)
+    """
+
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
+    ordering = "-id"
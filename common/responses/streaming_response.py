@@ -0,0 +1,56 @@
+from collections.abc import Iterable
+
+from django.http import StreamingHttpResponse
+from rest_framework import status as http_status
+
+from config.json_renderer import CustomJSONRenderer
+
+
+class StreamingJSONResponse(StreamingHttpResponse):
+    """
+    {status, message, data} 응답을 한 행씩 인코딩해서 스트리밍
+
+    head가 없으면 data는 rows의 목록이고, head가 있으면 data는 head의 필드 뒤에
+    list_key로 rows의 목록을 이어 붙인 객체입니다. rows를 queryset.iterator()로
+    만들면 전체 응답을 메모리에 올리지 않고 내려줄 수 있습니다.
+    """
+
+    renderer = CustomJSONRenderer()
+
+    def __init__(
+        self,
+        rows: Iterable[dict],
+        head: dict | None = None,
+        list_key: str | None = None,
+        status: int = http_status.HTTP_200_OK,
+    ):
+        super().__init__(
+            self.stream(rows, head, list_key, status),
+            content_type="application/json",
+            status=status,
+        )
+
+    @staticmethod
+    def is_requested(request) -> bool:
+        """?stream=1로 스트리밍 응답을 요청했는지 확인"""
+        return request.query_params.get("stream") in ("1", "true")
+
+    @classmethod
+    def encode(cls, data) -> bytes:
+        return cls.renderer.encode(data, None, None)
+
+    @classmethod
+    def stream(cls, rows, head, list_key, status):
+        yield b'{"status":%d,"message":"success","data":' % status
+        if head is not None:
+            opening = cls.encode(head)[:-1]
+            if opening != b"{":
+                opening += b","
+            yield opening + cls.encode(list_key) + b":["
+        else:
+            yield b"["
+
+        for i, row in enumerate(rows):
+            yield (b"," if i else b"") + cls.encode(row)
+
+        yield b"]}}" if head is not None else b"]}"
@@ -0,0 +1,43 @@
+from rest_framework import serializers
+
+
+def parse_fields(value: str | None) -> list[str] | None:
+    """?fields=id,member.user.username 형식의 쿼리 파라미터를 필드 경로 목록으로 변환"""
+    if not value:
+        return None
+    return [path.strip() for path in value.split(",") if path.strip()]
+
+
+def restrict_fields(serializer: serializers.BaseSerializer, paths: list[str] | None):
+    """
+    직렬화기에서 paths에 포함된 필드만 남김
+
+    "member.user.username"처럼 점(.)으로 중첩 직렬화기의 필드를 지정할 수 있으며,
+    "member"처럼 중첩 직렬화기 이름만 지정하면 하위 필드를 모두 남깁니다.
+    존재하지 않는 필드 이름은 무시합니다.
+    """
+    if not paths:
+        return serializer
+
+    if isinstance(serializer, serializers.ListSerializer):
+        restrict_fields(serializer.child, paths)
+        return serializer
+
+    nested_paths: dict[str, list[str]] = {}
+    for path in paths:
+        name, _, rest = path.partition(".")
+        nested_paths.setdefault(name, [])
+        if rest and nested_paths[name] is not None:
+            nested_paths[name].append(rest)
+        elif not rest:
+            # 이름만 지정한 경우 하위 필드 전체
+            nested_paths[name] = None
+
+    for name in list(serializer.fields):
+        if name not in nested_paths:
+            serializer.fields.pop(name)
+        elif nested_paths[name] and isinstance(
+            serializer.fields[name], serializers.BaseSerializer
+        ):
+            restrict_fields(serializer.fields[name], nested_paths[name])
+    return serializer
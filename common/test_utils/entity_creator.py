@@ -1,9 +1,11 @@
+import uuid
 from datetime import timedelta
 from functools import wraps
 from unittest.mock import patch
 
 from django.utils import timezone
 
+from api.club.models import GenMember
 from api.club.services.apply_service import ApplyService
 from api.club.services.club_service import ClubService
 from api.event.models import Attendance, AttendanceStatus, Event
@@ -29,12 +31,14 @@ class EntityCreator:
         self.generation = None
         self.users = []
         self.members = []
+        self.generation_mappings = []
         self.events = []
         self.attendances = []
 
     @mock_storage
-    def create_club(self, club_name=None, user_name=None):
+    def create_club(self, club_name=None, user_name=None, with_image=True):
         """클럽과 기본 Role을 생성"""
+        user_name = user_name or "owner"
         self.users.append(
             User.objects.create_user(username=user_name, identifier=user_name)
         )
@@ -43,8 +47,9 @@ class EntityCreator:
         self.club, member = ClubService.create_club(
             user=self.users[0],
             name=name,
-            image=ImageTestUtils.create_test_image(),
+            image=ImageTestUtils.create_test_image() if with_image else None,
             description=f"{name} Description",
+            short_description=name,
             generation_data={
                 "name": "Test Generation",
                 "start_date": timezone.now().date(),
@@ -53,54 +58,73 @@ class EntityCreator:
         )
         self.members.append(member)
         self.generation = self.club.current_generation
+        self.generation_mappings.append(
+            GenMember.objects.get(member=member, generation=self.generation)
+        )
         return self.club
 
     @mock_storage
-    def _create_users(self, count=1, start_index=0):
+    def _create_users(
+        self, count=1, start_index=0, with_image=True, username_prefix="testuser"
+    ):
         """여러 User 생성"""
+        users = []
         for i in range(start_index, start_index + count):
             user = User.objects.create_user(
-                username=f"testuser{i}",
-                identifier=f"testuser{i}",
-                profile_image=ImageTestUtils.create_test_image(),
+                username=f"{username_prefix}{i}",
+                identifier=f"{username_prefix}{i}",
+                profile_image=ImageTestUtils.create_test_image()
+                if with_image
+                else None,
             )
-            self.users.append(user)
-        return self.users
+            users.append(user)
+        self.users.extend(users)
+        return users
 
-    def create_members(self, user_count=1):
+    def create_members(self, user_count=1, with_image=True, username_prefix="testuser"):
         """User, Member, GenerationMapping 생성"""
+        if not self.generation:
+            self.create_club()
 
-        users = self.create_users(count=user_count)
+        users = self._create_users(
+            count=user_count,
+            start_index=len(self.users),
+            with_image=with_image,
+            username_prefix=username_prefix,
+        )
 
         for user in users:
             member, generation_mapping = ApplyService.join_generation(
                 user, self.generation
             )
             self.members.append(member)
+            self.generation_mappings.append(generation_mapping)
 
         return self.members
 
     @mock_storage
-    def create_event(self, count=1):
+    def create_event(self, count=1, start_datetime=None, with_image=True):
         """Event 생성"""
         if not self.generation:
-            self.create_generation()
+            self.create_club()
 
+        start_datetime = start_datetime or timezone.now()
         for i in range(count):
             event = Event.objects.create(
                 generation=self.generation,
                 title=f"Test Event {i}",
                 description=f"Test Description {i}",
-                date=timezone.now().date(),
-                start_time="10:00",
-                end_time="11:00",
+                date=timezone.localtime(start_datetime).date(),
+                start_datetime=start_datetime,
+                end_datetime=start_datetime + timedelta(hours=1),
                 start_minutes=0,
                 late_minutes=10,
                 fail_minutes=20,
                 location="Test Location",
                 location_link="Test Location Link",
                 attendance_type="QR",
-                images=[ImageTestUtils.create_test_image()],
+                qr_code=str(uuid.uuid4()),
+                images=[ImageTestUtils.create_test_image()] if with_image else [],
             )
             self.events.append(event)
         return self.events
@@ -0,0 +1,85 @@
+from collections.abc import Sequence
+
+import numpy as np
+
+from api.club.models import Generation, GenMember
+from api.event.models import AttendanceCurrent, AttendanceStatus, Event
+
+# 출석 기록이 없는 칸
+MISSING = -1
+
+STATUS_LABELS = {
+    AttendanceStatus.PRESENT: "출석",
+    AttendanceStatus.LATE: "지각",
+    AttendanceStatus.ABSENT: "결석",
+}
+
+
+class AttendanceMatrix:
+    """
+    기수 멤버 × 이벤트 최신 출석 상태 행렬
+
+    statuses[i, j]는 gen_members[i]의 events[j] 출석 상태(AttendanceStatus)이며
+    기록이 없으면 MISSING입니다. 엑셀/구글 시트/노션 내보내기에서 같이 사용합니다.
+    """
+
+    def __init__(
+        self,
+        gen_members: Sequence[GenMember],
+        events: Sequence[Event],
+        statuses: np.ndarray,
+    ):
+        self.gen_members = gen_members
+        self.events = events
+        self.statuses = statuses
+        self.row_index = {gen_member.id: i for i, gen_member in enumerate(gen_members)}
+        self.column_index = {event.id: j for j, event in enumerate(events)}
+
+    @classmethod
+    def build(cls, generation: Generation, gen_members=None) -> "AttendanceMatrix":
+        """
+        기수의 이벤트와 멤버, 최신 출석 상태를 불러와 행렬을 만듦 (쿼리 3번)
+
+        Args:
+            gen_members: 행으로 사용할 GenMember 목록, 없으면 기수의 모든 멤버
+        """
+        events = list(
+            Event.objects.filter(generation=generation).order_by(
+                "date", "start_datetime"
+            )
+        )
+        if gen_members is None:
+            gen_members = GenMember.objects.filter(
+                generation=generation
+            ).select_related("member__user")
+        gen_members = list(gen_members)
+
+        matrix = cls(
+            gen_members,
+            events,
+            np.full((len(gen_members), len(events)), MISSING, dtype=np.int8),
+        )
+        cells = [
+            (matrix.row_index[gen_member_id], matrix.column_index[event_id], status)
+            for gen_member_id, event_id, status in AttendanceCurrent.objects.filter(
+                event__generation=generation
+            ).values_list("generation_mapping_id", "event_id", "status")
+            if gen_member_id in matrix.row_index and event_id in matrix.column_index
+        ]
+        if cells:
+            rows, columns, statuses = np.array(cells, dtype=np.int64).T
+            matrix.statuses[rows, columns] = statuses
+        return matrix
+
+    def count(self, status: int, axis: int) -> np.ndarray:
+        """상태별 개수 (axis=1: 멤버별, axis=0: 이벤트별)"""
+        return np.count_nonzero(self.statuses == status, axis=axis)
+
+    def to_labels(
+        self, labels: dict[int, str] = STATUS_LABELS, default: str = "-"
+    ) -> list[list[str]]:
+        """각 칸을 표시용 문자열로 변환 (labels에 없는 상태와 빈 칸은 default)"""
+        table = np.full(len(AttendanceStatus) + 1, default, dtype=object)
+        for status, label in labels.items():
+            table[status + 1] = label
+        return table[self.statuses.astype(np.intp) + 1].tolist()
@@ -1,5 +1,9 @@
+import threading
 import time
-from typing import Optional
+from collections import OrderedDict, deque
+from typing import Optional, Sequence
+
+import numpy as np
 
 
 class HashTimeGenerator:
@@ -25,6 +29,39 @@ class HashTimeGenerator:
         # print()
         return v
 
+    @classmethod
+    def custom_hash_batch(
+        cls, data: Sequence[bytes], seed: int = 0x9E3779B185EBCA87
+    ) -> np.ndarray:
+        """
+        custom_hash를 여러 입력에 대해 한 번에 계산 (uint64 벡터 연산)
+
+        Returns:
+            입력 순서와 같은 uint64 해시 배열
+        """
+        count = len(data)
+        lengths = np.fromiter((len(d) for d in data), dtype=np.int64, count=count)
+        max_length = int(lengths.max(initial=0))
+
+        # 가변 길이 바이트열을 (count, max_length) 행렬로 펼침
+        flat = np.frombuffer(b"".join(data), dtype=np.uint8)
+        starts = np.cumsum(lengths) - lengths
+        rows = np.repeat(np.arange(count), lengths)
+        cols = np.arange(flat.size) - np.repeat(starts, lengths)
+        matrix = np.zeros((count, max_length), dtype=np.uint64)
+        matrix[rows, cols] = flat
+
+        prime1 = np.uint64(11400714785074694791)
+        shift31, shift33 = np.uint64(31), np.uint64(33)
+        v = np.full(count, seed, dtype=np.uint64)
+        with np.errstate(over="ignore"):
+            for col in range(max_length):
+                x = (v ^ matrix[:, col]) * prime1
+                x = (x << shift31) | (x >> shift33)
+                x ^= x >> shift33
+                v = np.where(col < lengths, x, v)
+        return v
+
     @classmethod
     def to_base(cls, n: int, charset: str, length: int) -> str:
         base = len(charset)
@@ -50,6 +87,68 @@ class HashTimeGenerator:
         # print(f"hash_value: {hash_value}")
         return cls.to_base(hash_value % (base**code_length), charset, code_length)
 
+    @classmethod
+    def generate_code_batch(
+        cls,
+        values: Sequence[str],
+        times_in_seconds: Sequence[int],
+        charset: Optional[str] = None,
+        code_length: int = 10,
+    ) -> list[str]:
+        """
+        (value, time_in_seconds) 쌍 목록의 코드를 한 번에 생성
+
+        결과는 같은 인자로 generate_code를 호출한 것과 동일합니다.
+        """
+        charset = charset or cls.DEFAULT_CHARSET
+        base = len(charset)
+        if not values:
+            return []
+
+        hashes = cls.custom_hash_batch(
+            [
+                f"{value}:{time_in_seconds}".encode("utf-8")
+                for value, time_in_seconds in zip(values, times_in_seconds)
+            ]
+        )
+        modulus = base**code_length
+        if modulus < 2**64:
+            hashes = hashes % np.uint64(modulus)
+
+        digits = np.empty((len(hashes), code_length), dtype=np.uint64)
+        base_uint = np.uint64(base)
+        for position in range(code_length - 1, -1, -1):
+            digits[:, position] = hashes % base_uint
+            hashes = hashes // base_uint
+
+        chars = np.array(list(charset), dtype="<U1")[digits]
+        return np.ascontiguousarray(chars).view(f"<U{code_length}").ravel().tolist()
+
+    @classmethod
+    def generate_code_window_batch(
+        cls,
+        values: Sequence[str],
+        current_time: int | None = None,
+        time_range: int = 10,
+    ) -> dict[str, list[str]]:
+        """
+        여러 value에 대해 최근 time_range초 동안의 코드 목록을 한 번에 생성
+
+        Returns:
+            value -> [현재 시간 코드, 1초 전 코드, ...]
+        """
+        if current_time is None:
+            current_time = cls.get_current_time_in_seconds()
+        offsets = range(time_range)
+        codes = cls.generate_code_batch(
+            [value for value in values for _ in offsets],
+            [current_time - offset for _ in values for offset in offsets],
+        )
+        return {
+            value: codes[index * time_range : (index + 1) * time_range]
+            for index, value in enumerate(values)
+        }
+
     @classmethod
     def auto_generate_code(
         cls,
@@ -71,6 +170,15 @@ class HashTimeGenerator:
             code_list.append(cls.auto_generate_code(value, current_time, -i))
         return code_list
 
+    @classmethod
+    def is_valid_code(cls, value: str, code: str, time_range: int = 10) -> bool:
+        """
+        최근 time_range초 동안 유효한 코드인지 확인
+
+        같은 value에 대한 코드 목록은 초 단위로 한 번만 계산되고 캐싱됩니다.
+        """
+        return code in get_code_window(time_range).get_codes(value)
+
     @staticmethod
     def get_current_time_in_seconds() -> int:
         """
@@ -82,6 +190,68 @@ class HashTimeGenerator:
         return int(time.time())
 
 
+class RollingCodeWindow:
+    """
+    value별로 최근 time_range초 동안 유효한 코드를 보관하는 프로세스 로컬 링 버퍼
+
+    같은 초에 들어온 요청은 계산된 코드 집합을 그대로 재사용하고,
+    시간이 흐르면 새로 지난 초의 코드만 추가로 계산합니다.
+    """
+
+    MAX_VALUES = 512
+
+    def __init__(self, time_range: int = 10, max_values: int = MAX_VALUES):
+        self.time_range = time_range
+        self.max_values = max_values
+        # value -> (마지막 계산 시간, 코드 링 버퍼, 코드 집합)
+        self._windows: OrderedDict[str, tuple[int, deque, frozenset]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_codes(self, value: str, current_time: int | None = None) -> frozenset:
+        if current_time is None:
+            current_time = HashTimeGenerator.get_current_time_in_seconds()
+
+        with self._lock:
+            window = self._windows.get(value)
+            if window is not None and window[0] == current_time:
+                self._windows.move_to_end(value)
+                return window[2]
+
+            if window is not None and 0 < current_time - window[0] < self.time_range:
+                # 지난 초의 코드만 추가 계산
+                codes = window[1]
+                for time_in_seconds in range(window[0] + 1, current_time + 1):
+                    codes.append(
+                        HashTimeGenerator.generate_code(value, time_in_seconds)
+                    )
+            else:
+                codes = deque(
+                    reversed(
+                        HashTimeGenerator.generate_code_window_batch(
+                            [value], current_time, self.time_range
+                        )[value]
+                    ),
+                    maxlen=self.time_range,
+                )
+
+            code_set = frozenset(codes)
+            self._windows[value] = (current_time, codes, code_set)
+            self._windows.move_to_end(value)
+            while len(self._windows) > self.max_values:
+                self._windows.popitem(last=False)
+            return code_set
+
+
+_code_windows: dict[int, RollingCodeWindow] = {}
+
+
+def get_code_window(time_range: int = 10) -> RollingCodeWindow:
+    """time_range별로 하나의 RollingCodeWindow를 공유"""
+    if time_range not in _code_windows:
+        _code_windows[time_range] = RollingCodeWindow(time_range)
+    return _code_windows[time_range]
+
+
 def main():
     """테스트 및 사용 예시"""
     print("=== Python 버전 테스트 ===")
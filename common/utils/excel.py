@@ -1,14 +1,41 @@
-from io import BytesIO
+import tempfile
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from django.conf import settings
 from django.utils import timezone
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, NamedStyle, PatternFill
 from openpyxl.utils import get_column_letter
 
-from api.club.models import Generation, GenMember
-from api.event.models import Attendance, AttendanceStatus, Event
+from api.club.models import Generation
+from api.event.models import AttendanceStatus
+from common.utils.attendance_matrix import AttendanceMatrix
+
+MB = 1024 * 1024
+
+# 8MB 이상이면 멀티파트 업로드
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * MB, multipart_chunksize=8 * MB, max_concurrency=4
+)
+
+
+def _solid_fill(color: str) -> PatternFill:
+    return PatternFill(start_color=color, end_color=color, fill_type="solid")
+
+
+def _named_styles() -> list[NamedStyle]:
+    """워크북에 한 번만 등록하고 셀에서는 이름으로 참조하는 스타일"""
+    return [
+        NamedStyle(name="header", fill=_solid_fill("E6E6E6"), font=Font(bold=True)),
+        NamedStyle(name="stats", fill=_solid_fill("F2F2F2")),
+        NamedStyle(name="stats_bold", fill=_solid_fill("F2F2F2"), font=Font(bold=True)),
+        NamedStyle(name="bold", font=Font(bold=True)),
+        NamedStyle(name="present", fill=_solid_fill("D9EBD9")),
+        NamedStyle(name="late", fill=_solid_fill("FFF2CC")),
+        NamedStyle(name="absent", fill=_solid_fill("FFD9D9")),
+    ]
 
 
 def create_attendance_excel(generation: Generation) -> str:
@@ -21,37 +48,31 @@ def create_attendance_excel(generation: Generation) -> str:
     Returns:
         생성된 엑셀 파일의 S3 URL
     """
-    # 색상 정의
-    HEADER_FILL = PatternFill(
-        start_color="E6E6E6", end_color="E6E6E6", fill_type="solid"
-    )
-    STATS_FILL = PatternFill(
-        start_color="F2F2F2", end_color="F2F2F2", fill_type="solid"
-    )
-    PRESENT_FILL = PatternFill(
-        start_color="D9EBD9", end_color="D9EBD9", fill_type="solid"
-    )
-    LATE_FILL = PatternFill(start_color="FFF2CC", end_color="FFF2CC", fill_type="solid")
-    ABSENT_FILL = PatternFill(
-        start_color="FFD9D9", end_color="FFD9D9", fill_type="solid"
-    )
-    BOLD_FONT = Font(bold=True)
-
     # 데이터 가져오기
-    events = Event.objects.filter(generation=generation).order_by(
-        "date", "start_datetime"
-    )
-    generation_mappings = GenMember.objects.filter(
-        generation=generation
-    ).select_related("member__user")
-    attendances = Attendance.objects.filter(
-        event__in=events, generation_mapping__in=generation_mappings
-    )
-
-    # 워크북 생성
-    wb = Workbook()
-    ws = wb.active
-    ws.title = f"{generation.club.name} - {generation.name} - 출석 정보"
+    matrix = AttendanceMatrix.build(generation)
+    events = matrix.events
+    generation_mappings = matrix.gen_members
+    labels = matrix.to_labels()
+    status_styles = {"출석": "present", "지각": "late", "결석": "absent"}
+    stats_statuses = [
+        AttendanceStatus.PRESENT,
+        AttendanceStatus.LATE,
+        AttendanceStatus.ABSENT,
+    ]
+    member_stats = [matrix.count(status, axis=1) for status in stats_statuses]
+    event_stats = [matrix.count(status, axis=0) for status in stats_statuses]
+
+    # 워크북 생성 (write-only: 행을 순서대로 기록하고 셀 스타일은 공유)
+    wb = Workbook(write_only=True)
+    for style in _named_styles():
+        wb.add_named_style(style)
+    ws = wb.create_sheet(f"{generation.club.name} - {generation.name} - 출석 정보")
+
+    def styled(value, style=None):
+        cell = WriteOnlyCell(ws, value=value)
+        if style is not None:
+            cell.style = style
+        return cell
 
     # 헤더 생성
     headers = [f"이름(총 {len(generation_mappings)}명)"]
@@ -60,100 +81,51 @@ def create_attendance_excel(generation: Generation) -> str:
         headers.append(event_header)
     headers.extend(["출석", "지각", "결석"])
 
-    # 헤더 입력 및 스타일 적용
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col, value=header)
-        cell.fill = HEADER_FILL
-        cell.font = BOLD_FONT
+    # 열 너비는 행을 기록하기 전에 지정해야 함
+    for col in range(1, len(headers) + 1):
+        ws.column_dimensions[get_column_letter(col)].width = 15
+
+    ws.append([styled(header, "header") for header in headers])
 
     # 출석 데이터 입력
-    row = 2
-    for mapping in generation_mappings:
-        present_count = late_count = absent_count = 0
-        ws.cell(row=row, column=1, value=mapping.member.user.username)
-
-        for col, event in enumerate(events, 2):
-            attendance = (
-                attendances.filter(event=event, generation_mapping=mapping)
-                .order_by("-modified_at")
-                .first()
-            )
-
-            status = (
-                "출석"
-                if attendance and attendance.status == AttendanceStatus.PRESENT
-                else "지각"
-                if attendance and attendance.status == AttendanceStatus.LATE
-                else "결석"
-                if attendance and attendance.status == AttendanceStatus.ABSENT
-                else "-"
-            )
-
-            cell = ws.cell(row=row, column=col, value=status)
-
-            # 상태별 스타일 및 카운트
-            if status == "출석":
-                cell.fill = PRESENT_FILL
-                present_count += 1
-            elif status == "지각":
-                cell.fill = LATE_FILL
-                late_count += 1
-            elif status == "결석":
-                cell.fill = ABSENT_FILL
-                absent_count += 1
-
-        # 통계 추가
-        for col, value in enumerate(
-            [present_count, late_count, absent_count], len(events) + 2
-        ):
-            cell = ws.cell(row=row, column=col, value=value)
-            cell.fill = STATS_FILL
-
-        row += 1
+    for i, mapping in enumerate(generation_mappings):
+        ws.append(
+            [mapping.member.user.username]
+            + [styled(status, status_styles.get(status)) for status in labels[i]]
+            + [styled(int(counts[i]), "stats") for counts in member_stats]
+        )
 
     # 이벤트별 통계 추가
     stats_labels = ["출석", "지각", "결석"]
     for idx, label in enumerate(stats_labels):
-        ws.cell(row=row + idx, column=1, value=label).font = BOLD_FONT
-
-        for col in range(2, len(events) + 2):
-            column_data = [ws.cell(row=r, column=col).value for r in range(2, row)]
-            count = column_data.count(label)
-            cell = ws.cell(row=row + idx, column=col, value=str(count))
-            cell.fill = STATS_FILL
-            cell.font = BOLD_FONT
-
-    # 열 너비 자동 조정
-    for col in range(1, len(headers) + 1):
-        ws.column_dimensions[get_column_letter(col)].width = 15
+        ws.append(
+            [styled(label, "bold")]
+            + [styled(str(count), "stats_bold") for count in event_stats[idx]]
+        )
 
     # 파일 이름 생성
     filename = f"{generation.club.name}_{generation.name}_출석정보_{timezone.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
 
-    # 엑셀 파일을 메모리에 저장
-    excel_file = BytesIO()
-    wb.save(excel_file)
-    excel_file.seek(0)
+    # S3 경로 설정 (excel 폴더 아래에 저장)
+    s3_path = f"excel/{filename}"
 
-    # S3에 업로드
+    # 임시 파일에 저장한 뒤 S3에 업로드 (큰 파일은 멀티파트로 나눠서 전송)
     s3_client = boto3.client(
         "s3",
         aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
         aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
         region_name=settings.AWS_S3_REGION_NAME,
     )
-
-    # S3 경로 설정 (excel 폴더 아래에 저장)
-    s3_path = f"excel/{filename}"
-
-    # S3에 업로드
-    s3_client.upload_fileobj(
-        excel_file,
-        settings.AWS_STORAGE_BUCKET_NAME,
-        s3_path,
-        ExtraArgs={
-            "ContentType": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-        },
-    )
+    with tempfile.NamedTemporaryFile(suffix=".xlsx") as excel_file:
+        wb.save(excel_file.name)
+        s3_client.upload_file(
+            excel_file.name,
+            settings.AWS_STORAGE_BUCKET_NAME,
+            s3_path,
+            ExtraArgs={
+                "ContentType": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+            },
+            Config=TRANSFER_CONFIG,
+        )
 
     return s3_path
@@ -0,0 +1,164 @@
+import math
+from functools import lru_cache
+
+import numpy as np
+
+# 평균 지구 반지름 (m)
+EARTH_RADIUS_M = 6_371_008.8
+
+
+def haversine_distance(
+    latitude: float, longitude: float, center_latitude: float, center_longitude: float
+) -> float:
+    """두 좌표 사이의 거리 (m)"""
+    lat1, lon1, lat2, lon2 = map(
+        math.radians, (latitude, longitude, center_latitude, center_longitude)
+    )
+    a = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(a))
+
+
+def haversine_distances(
+    latitudes, longitudes, center_latitude: float, center_longitude: float
+) -> np.ndarray:
+    """여러 좌표와 한 지점 사이의 거리 (m)를 한 번에 계산"""
+    lat1 = np.radians(np.asarray(latitudes, dtype=np.float64))
+    lon1 = np.radians(np.asarray(longitudes, dtype=np.float64))
+    lat2 = math.radians(center_latitude)
+    lon2 = math.radians(center_longitude)
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * math.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(a))
+
+
+class Geofence:
+    """
+    출석 가능한 영역
+
+    다각형(polygon)이 있으면 다각형 내부 여부로, 없으면 중심 좌표와 반경(m)으로 판단합니다.
+    다각형은 [[위도, 경도], ...] 형식이며 경계 상자를 미리 계산해 대부분의 외부 좌표는
+    바로 걸러냅니다.
+    """
+
+    def __init__(
+        self,
+        center_latitude: float | None = None,
+        center_longitude: float | None = None,
+        radius: float | None = None,
+        polygon: list[list[float]] | None = None,
+    ):
+        self.center_latitude = center_latitude
+        self.center_longitude = center_longitude
+        self.radius = radius
+
+        self.polygon = None
+        if polygon:
+            self.polygon = np.asarray(polygon, dtype=np.float64)
+            self._lat = self.polygon[:, 0]
+            self._lon = self.polygon[:, 1]
+            # 각 변의 다음 꼭짓점
+            self._next_lat = np.roll(self._lat, -1)
+            self._next_lon = np.roll(self._lon, -1)
+            self._min_lat, self._min_lon = self.polygon.min(axis=0)
+            self._max_lat, self._max_lon = self.polygon.max(axis=0)
+
+    @classmethod
+    def from_event(cls, event) -> "Geofence | None":
+        """이벤트에 설정된 영역, 설정되지 않았으면 None"""
+        polygon = (
+            tuple(tuple(point) for point in event.geofence_polygon)
+            if event.geofence_polygon
+            else None
+        )
+        has_circle = (
+            event.geofence_latitude is not None
+            and event.geofence_longitude is not None
+            and event.geofence_radius is not None
+        )
+        if not polygon and not has_circle:
+            return None
+        return _get_geofence(
+            float(event.geofence_latitude) if has_circle else None,
+            float(event.geofence_longitude) if has_circle else None,
+            event.geofence_radius if has_circle else None,
+            polygon,
+        )
+
+    def contains(self, latitude: float, longitude: float) -> bool:
+        """한 좌표가 영역 안에 있는지 확인"""
+        latitude, longitude = float(latitude), float(longitude)
+        if self.polygon is not None:
+            if not (
+                self._min_lat <= latitude <= self._max_lat
+                and self._min_lon <= longitude <= self._max_lon
+            ):
+                return False
+            return bool(self._crossings(latitude, longitude) % 2 == 1)
+
+        return (
+            haversine_distance(
+                latitude, longitude, self.center_latitude, self.center_longitude
+            )
+            <= self.radius
+        )
+
+    def contains_many(self, latitudes, longitudes) -> np.ndarray:
+        """여러 좌표가 영역 안에 있는지 한 번에 확인"""
+        latitudes = np.asarray(latitudes, dtype=np.float64)
+        longitudes = np.asarray(longitudes, dtype=np.float64)
+        if self.polygon is not None:
+            crossings = self._crossings(latitudes[:, None], longitudes[:, None])
+            return crossings % 2 == 1
+
+        return (
+            haversine_distances(
+                latitudes, longitudes, self.center_latitude, self.center_longitude
+            )
+            <= self.radius
+        )
+
+    def _crossings(self, latitude, longitude):
+        """좌표에서 경도 방향으로 뻗은 반직선이 다각형 변과 만나는 횟수 (ray casting)"""
+        straddles = (self._lat > latitude) != (self._next_lat > latitude)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            crossing_lon = (self._next_lon - self._lon) * (latitude - self._lat) / (
+                self._next_lat - self._lat
+            ) + self._lon
+        return np.count_nonzero(straddles & (longitude < crossing_lon), axis=-1)
+
+
+@lru_cache(maxsize=256)
+def _get_geofence(center_latitude, center_longitude, radius, polygon) -> Geofence:
+    """같은 설정의 Geofence는 재사용 (다각형 전처리 비용 제거)"""
+    return Geofence(center_latitude, center_longitude, radius, polygon)
+
+
+def score_outliers(latitudes, longitudes, min_spread: float = 10.0) -> np.ndarray:
+    """
+    좌표 묶음에서 GPS 이상치 점수를 계산
+
+    중앙값 위치로부터의 거리에 대한 robust z-score(MAD 기반)를 반환합니다.
+    일반적으로 3.5를 넘으면 이상치로 봅니다.
+
+    Args:
+        min_spread: MAD의 최소값 (m), GPS 오차 수준의 흩어짐은 이상치로 보지 않음
+    """
+    latitudes = np.asarray(latitudes, dtype=np.float64)
+    longitudes = np.asarray(longitudes, dtype=np.float64)
+    if latitudes.size == 0:
+        return np.zeros(0)
+
+    distances = haversine_distances(
+        latitudes,
+        longitudes,
+        float(np.median(latitudes)),
+        float(np.median(longitudes)),
+    )
+    median = np.median(distances)
+    mad = max(np.median(np.abs(distances - median)), min_spread)
+    return 0.6745 * (distances - median) / mad
@@ -1,43 +1,50 @@
+from functools import lru_cache
+
+import numpy as np
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
 
-from api.club.models import Generation, GenMember
-from api.event.models import Attendance, AttendanceStatus, Event
+from api.club.models import Generation
+from api.event.models import AttendanceStatus
+from common.utils.attendance_matrix import AttendanceMatrix
 
+SCOPES = [
+    "https://www.googleapis.com/auth/spreadsheets",
+    "https://www.googleapis.com/auth/drive.file",
+]
+SHEET_ID = 0
+# 기존 시트 값을 읽어올 범위 (첫 번째 시트 전체)
+READ_RANGE = "A1:ZZZ"
 
-def create_attendance_sheet(generation: Generation) -> str:
-    """
-    특정 기수의 출석 정보를 구글 시트로 생성합니다.
 
-    Args:
-        generation: Generation 모델
+@lru_cache(maxsize=1)
+def get_google_services():
+    """
+    구글 시트/드라이브 API 클라이언트 (프로세스당 한 번 생성)
 
-    Returns:
-        생성된 구글 시트의 URL
+    서비스 계정 파일 로드와 discovery 문서 생성 비용을 매 요청마다 내지 않도록
+    캐시합니다. gunicorn sync 워커/Celery prefork 워커는 프로세스당 하나의 스레드로
+    요청을 처리하므로 클라이언트를 공유해도 안전합니다.
     """
-    # Google Sheets API 설정
-    SCOPES = [
-        "https://www.googleapis.com/auth/spreadsheets",
-        "https://www.googleapis.com/auth/drive.file",
-    ]
     credentials = service_account.Credentials.from_service_account_file(
         "wasso-google-sheet.json", scopes=SCOPES
     )
-    service = build("sheets", "v4", credentials=credentials)
+    sheets = build("sheets", "v4", credentials=credentials)
+    drive = build("drive", "v3", credentials=credentials)
+    return sheets, drive
 
-    # 데이터 가져오기
-    events = Event.objects.filter(generation=generation).order_by(
-        "date", "start_datetime"
-    )
-    generation_mappings = GenMember.objects.filter(
-        generation=generation
-    ).select_related("member__user")
-    attendances = Attendance.objects.filter(
-        event__in=events, generation_mapping__in=generation_mappings
-    )
 
-    # 시트 제목 생성
-    sheet_title = f"{generation.club.name} - {generation.name} - 출석 정보"
+def build_attendance_values(generation: Generation) -> list[list]:
+    """헤더 + 멤버별 출석/통계 + 이벤트별 통계 행으로 이루어진 시트 값"""
+    matrix = AttendanceMatrix.build(generation)
+    events = matrix.events
+    generation_mappings = matrix.gen_members
+    stats_statuses = [
+        AttendanceStatus.PRESENT,
+        AttendanceStatus.LATE,
+        AttendanceStatus.ABSENT,
+    ]
 
     # 헤더 행 생성 (날짜 + 이벤트명 + 통계)
     headers = [f"이름(총 {len(generation_mappings)}명)"]
@@ -46,80 +53,93 @@ def create_attendance_sheet(generation: Generation) -> str:
         headers.append(event_header)
     headers.extend(["출석", "지각", "결석"])  # 통계 컬럼 추가
 
-    # 출석 데이터 매트릭스 생성
-    attendance_data = []
-    for mapping in generation_mappings:
-        row = [mapping.member.user.username]  # 첫 열은 멤버 이름
-        present_count = late_count = absent_count = 0
-
-        for event in events:
-            attendance = (
-                attendances.filter(event=event, generation_mapping=mapping)
-                .order_by("-modified_at")
-                .first()
-            )
-            status = (
-                "출석"
-                if attendance and attendance.status == AttendanceStatus.PRESENT
-                else "지각"
-                if attendance and attendance.status == AttendanceStatus.LATE
-                else "결석"
-                if attendance and attendance.status == AttendanceStatus.ABSENT
-                else "-"
-            )
-            row.append(status)
-
-            # 상태별 카운트
-            if status == "출석":
-                present_count += 1
-            elif status == "지각":
-                late_count += 1
-            elif status == "결석":
-                absent_count += 1
-
-        # 통계 추가
-        row.extend([present_count, late_count, absent_count])
-        attendance_data.append(row)
-
-    # 이벤트별 통계 행 추가 (출석/지각/결석 별도 행)
-    present_stats = ["출석"]
-    late_stats = ["지각"]
-    absent_stats = ["결석"]
-
-    for i in range(len(events)):
-        column_data = [
-            row[i + 1] for row in attendance_data
-        ]  # i+1은 이름 컬럼을 건너뛰기 위함
-        present_count = column_data.count("출석")
-        late_count = column_data.count("지각")
-        absent_count = column_data.count("결석")
-
-        present_stats.append(str(present_count))
-        late_stats.append(str(late_count))
-        absent_stats.append(str(absent_count))
-
-    # 마지막 통계 컬럼들은 빈칸으로 채움
-    present_stats.extend([""] * 3)
-    late_stats.extend([""] * 3)
-    absent_stats.extend([""] * 3)
-
-    # 새 스프레드시트 생성
-    spreadsheet = {"properties": {"title": sheet_title}}
-    spreadsheet = service.spreadsheets().create(body=spreadsheet).execute()
-    spreadsheet_id = spreadsheet["spreadsheetId"]
-
-    # 데이터 업데이트
-    values = [headers] + attendance_data + [present_stats, late_stats, absent_stats]
-    body = {"values": values}
-    service.spreadsheets().values().update(
-        spreadsheetId=spreadsheet_id, range="A1", valueInputOption="RAW", body=body
-    ).execute()
+    # 출석 데이터 매트릭스 생성 (이름 + 이벤트별 상태 + 멤버별 통계)
+    member_stats = np.column_stack(
+        [matrix.count(status, axis=1) for status in stats_statuses]
+    ).tolist()
+    attendance_data = [
+        [mapping.member.user.username, *labels, *stats]
+        for mapping, labels, stats in zip(
+            generation_mappings, matrix.to_labels(), member_stats
+        )
+    ]
+
+    # 이벤트별 통계 행 추가 (출석/지각/결석 별도 행, 마지막 통계 컬럼들은 빈칸)
+    event_stats = [
+        [label, *map(str, matrix.count(status, axis=0)), "", "", ""]
+        for label, status in zip(["출석", "지각", "결석"], stats_statuses)
+    ]
+
+    return [headers] + attendance_data + event_stats
 
-    # 스타일링 적용
-    requests = [
+
+def changed_ranges(previous: list[list], current: list[list]):
+    """
+    이전 값과 비교해 바뀐 칸을 행별 연속 구간으로 반환
+
+    current가 더 작으면 남는 칸은 빈 값("")으로 지웁니다.
+
+    Returns:
+        (row, column, values) 목록
+    """
+    ranges = []
+    rows = max(len(previous), len(current))
+    for r in range(rows):
+        before = previous[r] if r < len(previous) else []
+        after = current[r] if r < len(current) else []
+        width = max(len(before), len(after))
+        start = None
+        for c in range(width + 1):
+            old = before[c] if c < len(before) else ""
+            new = after[c] if c < len(after) else ""
+            if c < width and old != new:
+                if start is None:
+                    start = c
+            elif start is not None:
+                values = [after[i] if i < len(after) else "" for i in range(start, c)]
+                ranges.append((r, start, values))
+                start = None
+    return ranges
+
+
+def _cell(value) -> dict:
+    if value == "" or value is None:
+        return {}
+    if isinstance(value, (int, float)):
+        return {"userEnteredValue": {"numberValue": value}}
+    return {"userEnteredValue": {"stringValue": str(value)}}
+
+
+def _value_requests(previous: list[list], current: list[list]) -> list[dict]:
+    return [
+        {
+            "updateCells": {
+                "start": {"sheetId": SHEET_ID, "rowIndex": row, "columnIndex": column},
+                "rows": [{"values": [_cell(value) for value in values]}],
+                "fields": "userEnteredValue",
+            }
+        }
+        for row, column, values in changed_ranges(previous, current)
+    ]
+
+
+def _shape(values: list[list]) -> tuple[int, int]:
+    return len(values), len(values[0]) if values else 0
+
+
+def _format_requests(rows: int, columns: int) -> list[dict]:
+    """헤더/통계 서식 (기존 서식을 지운 뒤 현재 크기에 맞춰 다시 적용)"""
+    return [
+        {
+            "repeatCell": {
+                "range": {"sheetId": SHEET_ID},
+                "cell": {},
+                "fields": "userEnteredFormat(backgroundColor,textFormat)",
+            }
+        },
         {
             "repeatCell": {
-                "range": {"sheetId": 0, "startRowIndex": 0, "endRowIndex": 1},
+                "range": {"sheetId": SHEET_ID, "startRowIndex": 0, "endRowIndex": 1},
                 "cell": {
                     "userEnteredFormat": {
                         "backgroundColor": {"red": 0.9, "green": 0.9, "blue": 0.9},
@@ -132,9 +152,9 @@ def create_attendance_sheet(generation: Generation) -> str:
         {
             "repeatCell": {
                 "range": {
-                    "sheetId": 0,
-                    "startColumnIndex": len(headers) - 3,
-                    "endColumnIndex": len(headers),
+                    "sheetId": SHEET_ID,
+                    "startColumnIndex": columns - 3,
+                    "endColumnIndex": columns,
                 },
                 "cell": {
                     "userEnteredFormat": {
@@ -147,9 +167,9 @@ def create_attendance_sheet(generation: Generation) -> str:
         {
             "repeatCell": {
                 "range": {
-                    "sheetId": 0,
-                    "startRowIndex": len(attendance_data) + 1,
-                    "endRowIndex": len(attendance_data) + 4,  # 3개 행으로 변경
+                    "sheetId": SHEET_ID,
+                    "startRowIndex": rows - 3,
+                    "endRowIndex": rows,  # 이벤트별 통계 3개 행
                 },
                 "cell": {
                     "userEnteredFormat": {
@@ -160,68 +180,106 @@ def create_attendance_sheet(generation: Generation) -> str:
                 "fields": "userEnteredFormat(backgroundColor,textFormat)",
             }
         },
+    ]
+
+
+def _conditional_format_requests() -> list[dict]:
+    """출석 상태별 색상 (시트를 만들 때 한 번만 추가)"""
+    colors = {
+        "출석": {"red": 0.85, "green": 0.92, "blue": 0.85},
+        "지각": {"red": 1.0, "green": 0.95, "blue": 0.8},
+        "결석": {"red": 1.0, "green": 0.85, "blue": 0.85},
+    }
+    return [
         {
             "addConditionalFormatRule": {
                 "rule": {
-                    "ranges": [{"sheetId": 0, "startRowIndex": 1}],
-                    "booleanRule": {
-                        "condition": {
-                            "type": "TEXT_EQ",
-                            "values": [{"userEnteredValue": "출석"}],
-                        },
-                        "format": {
-                            "backgroundColor": {
-                                "red": 0.85,
-                                "green": 0.92,
-                                "blue": 0.85,
-                            }
-                        },
-                    },
-                }
-            }
-        },
-        {
-            "addConditionalFormatRule": {
-                "rule": {
-                    "ranges": [{"sheetId": 0, "startRowIndex": 1}],
-                    "booleanRule": {
-                        "condition": {
-                            "type": "TEXT_EQ",
-                            "values": [{"userEnteredValue": "지각"}],
-                        },
-                        "format": {
-                            "backgroundColor": {"red": 1.0, "green": 0.95, "blue": 0.8}
-                        },
-                    },
-                }
-            }
-        },
-        {
-            "addConditionalFormatRule": {
-                "rule": {
-                    "ranges": [{"sheetId": 0, "startRowIndex": 1}],
+                    "ranges": [{"sheetId": SHEET_ID, "startRowIndex": 1}],
                     "booleanRule": {
                         "condition": {
                             "type": "TEXT_EQ",
-                            "values": [{"userEnteredValue": "결석"}],
-                        },
-                        "format": {
-                            "backgroundColor": {"red": 1.0, "green": 0.85, "blue": 0.85}
+                            "values": [{"userEnteredValue": label}],
                         },
+                        "format": {"backgroundColor": color},
                     },
                 }
             }
-        },
+        }
+        for label, color in colors.items()
     ]
 
-    service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id, body={"requests": requests}
-    ).execute()
 
-    # Drive API를 사용하여 권한 설정
-    drive_service = build("drive", "v3", credentials=credentials)
-    drive_service.permissions().create(
-        fileId=spreadsheet_id, body={"role": "reader", "type": "anyone"}
+def _read_values(sheets, spreadsheet_id: str) -> list[list] | None:
+    """기존 시트 값, 시트가 삭제되었거나 접근할 수 없으면 None"""
+    try:
+        response = (
+            sheets.spreadsheets()
+            .values()
+            .get(
+                spreadsheetId=spreadsheet_id,
+                range=READ_RANGE,
+                valueRenderOption="UNFORMATTED_VALUE",
+            )
+            .execute()
+        )
+    except HttpError as e:
+        if e.resp.status in (403, 404):
+            return None
+        raise
+    return response.get("values", [])
+
+
+def create_attendance_sheet(generation: Generation) -> str:
+    """
+    특정 기수의 출석 정보를 구글 시트로 내보냅니다.
+
+    이전에 내보낸 시트가 있으면 재사용하고 바뀐 칸만 다시 씁니다.
+    값과 서식은 한 번의 batchUpdate로 반영합니다.
+
+    Args:
+        generation: Generation 모델
+
+    Returns:
+        구글 시트의 URL
+    """
+    sheets, drive = get_google_services()
+    values = build_attendance_values(generation)
+
+    spreadsheet_id = generation.google_sheet_id
+    previous = _read_values(sheets, spreadsheet_id) if spreadsheet_id else None
+
+    requests = []
+    if previous is None:
+        # 새 스프레드시트 생성
+        sheet_title = f"{generation.club.name} - {generation.name} - 출석 정보"
+        spreadsheet = (
+            sheets.spreadsheets()
+            .create(body={"properties": {"title": sheet_title}})
+            .execute()
+        )
+        spreadsheet_id = spreadsheet["spreadsheetId"]
+        previous = []
+        requests.extend(_conditional_format_requests())
+
+        # Drive API를 사용하여 권한 설정
+        drive.permissions().create(
+            fileId=spreadsheet_id, body={"role": "reader", "type": "anyone"}
+        ).execute()
+
+        generation.google_sheet_id = spreadsheet_id
+        Generation.objects.filter(id=generation.id).update(
+            google_sheet_id=spreadsheet_id
+        )
+
+    requests.extend(_value_requests(previous, values))
+    # 멤버/이벤트 수가 그대로면 서식 위치도 같으므로 다시 적용하지 않음
+    if _shape(previous) != _shape(values):
+        requests.extend(_format_requests(len(values), len(values[0])))
+    if not requests:
+        return f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}"
+
+    sheets.spreadsheets().batchUpdate(
+        spreadsheetId=spreadsheet_id, body={"requests": requests}
     ).execute()
 
     return f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}"
@@ -1,174 +1,112 @@
-import os
+import hashlib
+import json
 import threading
-from typing import Dict, List
+from typing import Callable, Dict, List
 
 import requests
 
 from api.club.models import Generation, GenMember
-from api.event.models import Attendance, AttendanceStatus, Event
+from api.notion.models import NotionPageMapping
 from api.userapp.models import User
 from common.component import FCMComponent
+from common.utils.attendance_matrix import AttendanceMatrix
+from common.utils.notion_client import NotionClient, get_notion_client
 
 fcm_component = FCMComponent()
 
 
 class NotionAttendanceManager:
-    def __init__(self):
-        self.headers = {
-            "Authorization": f"Bearer {os.getenv('NOTION_TOKEN')}",
-            "Content-Type": "application/json",
-            "Notion-Version": "2022-06-28",
-        }
-        self.base_url = "https://api.notion.com/v1"
+    def __init__(self, client: NotionClient = None):
+        self.client = client or get_notion_client()
 
     def _create_database(
         self, notion_parent_page_id: str, title: str, properties: Dict
     ) -> str:
         """Create a new Notion database"""
-        url = f"{self.base_url}/databases"
         payload = {
             "parent": {"page_id": notion_parent_page_id},
             "title": [{"type": "text", "text": {"content": title}}],
             "properties": properties,
         }
-        response = requests.post(url, headers=self.headers, json=payload)
-        response.raise_for_status()
-        return response.json()["id"]
+        return self.client.post("databases", payload)["id"]
 
     def _update_database_row(self, database_id: str, row: Dict):
         """Update a single database row"""
-        url = f"{self.base_url}/pages"
         payload = {"parent": {"database_id": database_id}, "properties": row}
-        response = requests.post(url, headers=self.headers, json=payload)
-        response.raise_for_status()
-        return response.json()
-
-    def _update_database_rows(self, database_id: str, rows: List[Dict]):
-        """Update database rows with attendance data - sequential processing"""
-        results = []
-        for i, row in enumerate(rows):
-            # 진행 상황 출력 (선택 사항)
-            print(f"Updating row {i+1}/{len(rows)}")
-            result = self._update_database_row(database_id, row)
-            results.append(result)
-            # 각 요청 사이에 약간의 지연 추가 (Notion API 속도 제한 방지)
-            # if i < len(rows) - 1:
-            #     time.sleep(0.5)
-        return results
+        return self.client.post("pages", payload)
 
     def _get_database_pages(self, database_id: str) -> List[str]:
         """Get all pages in a database to delete them"""
-        url = f"{self.base_url}/databases/{database_id}/query"
-        response = requests.post(url, headers=self.headers)
-        response.raise_for_status()
-        return [page["id"] for page in response.json().get("results", [])]
+        return [
+            page["id"]
+            for page in self.client.paginate(f"databases/{database_id}/query")
+        ]
 
     def _delete_database_pages(self, database_id: str):
         """Archive all existing pages in the database"""
         page_ids = self._get_database_pages(database_id)
-        for page_id in page_ids:
-            url = f"{self.base_url}/pages/{page_id}"
-            payload = {"archived": True}
-            response = requests.patch(url, headers=self.headers, json=payload)
-            response.raise_for_status()
+        self.client.map_concurrent(self._archive_page, page_ids)
 
     def _update_database_schema(
         self, database_id: str, properties: Dict, title: str = None
     ):
         """Update database schema with new properties and optionally the title"""
-        url = f"{self.base_url}/databases/{database_id}"
         payload = {"properties": properties}
 
         # Add title to payload if provided
         if title:
             payload["title"] = [{"type": "text", "text": {"content": title}}]
 
-        response = requests.patch(url, headers=self.headers, json=payload)
-        response.raise_for_status()
+        self.client.patch(f"databases/{database_id}", payload)
 
-    def update_attendance_database_async(
-        self, generation: Generation, database_id: str = None, user: User = None
-    ):
-        """
-        비동기적으로 출석 정보를 업데이트하고 완료 시 사용자에게 알림
-        """
+    @staticmethod
+    def notify_completed(generation: Generation, user: User):
+        """동기화 완료 알림"""
+        fcm_component.send_to_user(
+            user,
+            "노션 동기화 완료",
+            f"{generation.club.name} - {generation.name}의 출석 정보가 노션에 성공적으로 업데이트되었습니다.",
+        )
 
-        def background_task():
-            try:
-                self.update_attendance_database(generation, database_id)
-                # 작업 완료 후 알림 전송
-                if user:
-                    fcm_component.send_to_user(
-                        user,
-                        "노션 동기화 완료",
-                        f"{generation.club.name} - {generation.name}의 출석 정보가 노션에 성공적으로 업데이트되었습니다.",
-                    )
-            except Exception as e:
-                # 오류 발생 시 알림
-                if user:
-                    fcm_component.send_to_user(
-                        user,
-                        "노션 동기화 실패",
-                        f"{generation.club.name} - {generation.name}의 출석 정보 업데이트 중 오류가 발생했습니다: {str(e)}",
-                    )
-                raise e
-
-        # 별도 스레드에서 작업 실행
-        thread = threading.Thread(target=background_task)
-        thread.daemon = True
-        thread.start()
-
-        return {
-            "status": "processing",
-            "message": "노션 데이터베이스 업데이트가 백그라운드에서 처리 중입니다. 완료 시 알림이 발송됩니다.",
-        }
+    @staticmethod
+    def notify_failed(generation: Generation, user: User, error: Exception):
+        """동기화 실패 알림"""
+        fcm_component.send_to_user(
+            user,
+            "노션 동기화 실패",
+            f"{generation.club.name} - {generation.name}의 출석 정보 업데이트 중 오류가 발생했습니다: {str(error)}",
+        )
 
     def update_attendance_database(
-        self, generation: Generation, database_id: str = None
+        self,
+        generation: Generation,
+        database_id: str = None,
+        full: bool = False,
+        progress: Callable[[int, int], None] = None,
     ):
         """
         Main function to create/update attendance database for a generation
         If database_id is provided, updates existing database instead of creating new one
+
+        이전 동기화의 행 매핑(NotionPageMapping)이 있으면 내용이 바뀐 행만 수정하고,
+        새 멤버의 행은 추가, 빠진 멤버의 행은 보관합니다. 매핑이 없거나 full=True면
+        기존 행을 모두 보관하고 다시 만듭니다.
+
+        progress가 있으면 행을 하나 반영할 때마다 (완료 수, 전체 수)로 호출합니다.
         """
         # Get required data from Django models
         club = generation.club
-        events = Event.objects.filter(generation=generation).order_by(
-            "date", "start_datetime"
-        )
-        gen_members = GenMember.objects.filter(generation=generation, is_current=True)
-
-        # Create database title and properties
         db_title = f"{club.name} - {generation.name} - 출석 정보"
-        properties = {
-            "이름": {"title": {}},
-        }
-
-        # Add event columns
-        for event in events:
-            column_name = f"{event.date.strftime('%m/%d')} {event.title}"
-            properties[column_name] = {
-                "select": {
-                    "options": [
-                        {"name": "출석", "color": "green"},
-                        {"name": "지각", "color": "yellow"},
-                        {"name": "결석", "color": "red"},
-                        {"name": "미인증", "color": "gray"},
-                    ]
-                }
-            }
+        properties, rows = self._build_rows(generation)
 
         if database_id:
             # Check if database exists before updating
             try:
                 # Verify database exists by making a request to get it
-                url = f"{self.base_url}/databases/{database_id}"
-                response = requests.get(url, headers=self.headers)
-                response.raise_for_status()
+                self.client.get(f"databases/{database_id}")
 
                 # Update existing database
                 self._update_database_schema(database_id, properties, db_title)
-                # Clear existing data
-                self._delete_database_pages(database_id)
             except requests.exceptions.HTTPError as e:
                 if e.response.status_code == 404:
                     # Database not found, raise a more descriptive error
@@ -184,38 +122,181 @@ class NotionAttendanceManager:
         #     # Create new database
         #     database_id = self._create_database(page_id, db_title, properties)
 
-        # Prepare and update rows
-        rows = []
-        for gen_member in gen_members:
+        mappings = {
+            mapping.gen_member_id: mapping
+            for mapping in NotionPageMapping.objects.filter(database_id=database_id)
+        }
+        if full or not mappings:
+            # Clear existing data
+            self._delete_database_pages(database_id)
+            NotionPageMapping.objects.filter(database_id=database_id).delete()
+            mappings = {}
+
+        self._sync_rows(database_id, rows, mappings, progress)
+
+        return database_id
+
+    def _build_rows(self, generation: Generation) -> tuple[Dict, Dict[int, Dict]]:
+        """데이터베이스 속성(스키마)과 gen_member_id별 행 속성"""
+        matrix = AttendanceMatrix.build(
+            generation,
+            GenMember.objects.filter(
+                generation=generation, is_current=True
+            ).select_related("member__user"),
+        )
+        column_names = [
+            f"{event.date.strftime('%m/%d')} {event.title}" for event in matrix.events
+        ]
+
+        properties = {
+            "이름": {"title": {}},
+        }
+        # Add event columns
+        for column_name in column_names:
+            properties[column_name] = {
+                "select": {
+                    "options": [
+                        {"name": "출석", "color": "green"},
+                        {"name": "지각", "color": "yellow"},
+                        {"name": "결석", "color": "red"},
+                        {"name": "미인증", "color": "gray"},
+                    ]
+                }
+            }
+
+        rows = {}
+        for gen_member, labels in zip(
+            matrix.gen_members, matrix.to_labels(default="미정")
+        ):
             member = gen_member.member
             row_data = {
                 "이름": {"title": [{"text": {"content": member.user.username}}]}
             }
 
-            for event in events:
-                column_name = f"{event.date.strftime('%m/%d')} {event.title}"
-                attendance = (
-                    Attendance.objects.filter(
-                        generation_mapping=gen_member, event=event
-                    )
-                    .order_by("-modified_at")
-                    .first()
-                )
+            for column_name, status in zip(column_names, labels):
+                row_data[column_name] = {"select": {"name": status}}
 
-                status = "미정"
-                if attendance:
-                    if attendance.status == AttendanceStatus.PRESENT:
-                        status = "출석"
-                    elif attendance.status == AttendanceStatus.LATE:
-                        status = "지각"
-                    elif attendance.status == AttendanceStatus.ABSENT:
-                        status = "결석"
+            rows[gen_member.id] = row_data
 
-                row_data[column_name] = {"select": {"name": status}}
+        return properties, rows
 
-            rows.append(row_data)
+    @staticmethod
+    def _row_hash(row: Dict) -> str:
+        encoded = json.dumps(row, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(encoded.encode()).hexdigest()
 
-        # Update database with rows
-        self._update_database_rows(database_id, rows)
+    def _update_page(self, page_id: str, row: Dict) -> bool:
+        """
+        Update properties of an existing page
 
-        return database_id
+        Returns:
+            페이지가 노션에서 삭제되어 수정하지 못했으면 False
+        """
+        response = self.client.request(
+            "PATCH", f"pages/{page_id}", json={"properties": row}
+        )
+        if self._is_page_gone(response):
+            return False
+        response.raise_for_status()
+        return not response.json().get("archived", False)
+
+    def _archive_page(self, page_id: str):
+        response = self.client.request(
+            "PATCH", f"pages/{page_id}", json={"archived": True}
+        )
+        if not self._is_page_gone(response):
+            response.raise_for_status()
+
+    @staticmethod
+    def _is_page_gone(response: requests.Response) -> bool:
+        """
+        페이지가 삭제되었거나 휴지통에 있는지
+
+        휴지통(archived)에 있는 페이지를 수정하면 404가 아니라
+        400 validation_error ("Can't edit block that is archived")가 옵니다.
+        """
+        if response.status_code == 404:
+            return True
+        if response.status_code != 400:
+            return False
+        try:
+            error = response.json()
+        except ValueError:
+            return False
+        return error.get("code") == "validation_error" and "archived" in error.get(
+            "message", ""
+        )
+
+    def _sync_rows(
+        self,
+        database_id: str,
+        rows: Dict[int, Dict],
+        mappings: Dict[int, NotionPageMapping],
+        progress: Callable[[int, int], None] = None,
+    ):
+        """해시가 바뀐 행만 수정, 새 멤버는 추가, 빠진 멤버는 보관 (동시 요청)"""
+        created, updated, removed = [], [], []
+        lock = threading.Lock()
+        done = 0
+
+        def report():
+            nonlocal done
+            if progress is None:
+                return
+            with lock:
+                done += 1
+                progress(done, total)
+
+        def upsert(change):
+            gen_member_id, row, content_hash = change
+            mapping = mappings.get(gen_member_id)
+            if mapping is not None:
+                if self._update_page(mapping.page_id, row):
+                    mapping.content_hash = content_hash
+                    updated.append(mapping)
+                    report()
+                    return
+                # 노션에서 지워진 행은 새로 만듦
+                removed.append(mapping)
+
+            page = self._update_database_row(database_id, row)
+            created.append(
+                NotionPageMapping(
+                    database_id=database_id,
+                    gen_member_id=gen_member_id,
+                    page_id=page["id"],
+                    content_hash=content_hash,
+                )
+            )
+            report()
+
+        def archive(mapping):
+            self._archive_page(mapping.page_id)
+            removed.append(mapping)
+            report()
+
+        changes = []
+        for gen_member_id, row in rows.items():
+            content_hash = self._row_hash(row)
+            mapping = mappings.get(gen_member_id)
+            if mapping is None or mapping.content_hash != content_hash:
+                changes.append((gen_member_id, row, content_hash))
+        left = [
+            mapping
+            for gen_member_id, mapping in mappings.items()
+            if gen_member_id not in rows
+        ]
+        total = len(changes) + len(left)
+        if progress is not None:
+            progress(0, total)
+
+        try:
+            self.client.map_concurrent(upsert, changes)
+            self.client.map_concurrent(archive, left)
+        finally:
+            # 중간에 실패해도 이미 반영된 행은 다음 동기화에서 다시 보내지 않도록 저장
+            NotionPageMapping.objects.filter(
+                id__in=[mapping.id for mapping in removed]
+            ).delete()
+            NotionPageMapping.objects.bulk_update(updated, ["content_hash"])
+            NotionPageMapping.objects.bulk_create(created)
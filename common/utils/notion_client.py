@@ -0,0 +1,171 @@
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, Iterator, List
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# 다시 보내도 결과가 같은 요청만 연결 오류/5xx에 재시도
+IDEMPOTENT_METHODS = {"GET", "PATCH", "DELETE"}
+# 노션이 처리하지 않은 것이 확실한 응답 (POST도 재시도)
+NOT_PROCESSED_STATUSES = {429, 503}
+
+
+class TokenBucket:
+    """초당 rate개의 토큰이 채워지는 버킷 (여러 스레드에서 공유)"""
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """토큰 하나를 얻을 때까지 대기"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated_at) * self.rate
+                )
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class NotionClient:
+    """
+    노션 API 클라이언트
+
+    - 하나의 Session으로 연결을 재사용 (요청마다 TLS handshake를 하지 않음)
+    - 모든 요청은 토큰 버킷을 거쳐 NOTION_RATE_LIMIT 이하로 전송
+    - 429/5xx는 Retry-After 또는 지수 백오프 후 재시도
+      (페이지 생성 등 멱등이 아닌 요청은 429/503일 때만 재시도)
+    - 목록 조회는 has_more/next_cursor를 따라 끝까지 조회
+    """
+
+    base_url = "https://api.notion.com/v1"
+
+    def __init__(
+        self,
+        token: str | None = None,
+        rate_limit: float | None = None,
+        max_concurrency: int | None = None,
+        max_retries: int | None = None,
+    ):
+        self.max_concurrency = max_concurrency or settings.NOTION_MAX_CONCURRENCY
+        self.max_retries = (
+            max_retries if max_retries is not None else settings.NOTION_MAX_RETRIES
+        )
+        self.bucket = TokenBucket(rate_limit or settings.NOTION_RATE_LIMIT)
+
+        self.session = requests.Session()
+        self.session.headers.update(
+            {
+                "Authorization": f"Bearer {token or settings.NOTION_TOKEN}",
+                "Content-Type": "application/json",
+                "Notion-Version": settings.NOTION_VERSION,
+            }
+        )
+        adapter = HTTPAdapter(pool_maxsize=self.max_concurrency)
+        self.session.mount("https://", adapter)
+
+    def _backoff(self, attempt: int, response: requests.Response | None) -> float:
+        retry_after = (
+            response.headers.get("Retry-After") if response is not None else None
+        )
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+        return min(2**attempt, 30) + random.uniform(0, 0.5)
+
+    def request(
+        self, method: str, path: str, idempotent: bool | None = None, **kwargs
+    ) -> requests.Response:
+        """
+        재시도를 포함한 요청 (응답 상태 확인은 호출하는 쪽에서)
+
+        GET/PATCH/DELETE는 연결 오류와 429/5xx에 재시도합니다. POST는 같은 페이지가
+        두 번 만들어질 수 있으므로 노션이 요청을 처리하지 않은 429/503에만 재시도하며,
+        조회처럼 다시 보내도 되는 POST는 idempotent=True로 호출합니다.
+
+        재시도 횟수를 넘기면 마지막 응답을 그대로 반환하고,
+        연결 오류가 계속되면 마지막 예외를 다시 발생시킵니다.
+        """
+        if idempotent is None:
+            idempotent = method.upper() in IDEMPOTENT_METHODS
+        retry_statuses = RETRY_STATUSES if idempotent else NOT_PROCESSED_STATUSES
+        url = f"{self.base_url}/{path.lstrip('/')}"
+        for attempt in range(self.max_retries + 1):
+            self.bucket.acquire()
+            try:
+                response = self.session.request(method, url, timeout=30, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if not idempotent or attempt == self.max_retries:
+                    raise
+                response = None
+            else:
+                if (
+                    response.status_code not in retry_statuses
+                    or attempt == self.max_retries
+                ):
+                    return response
+            time.sleep(self._backoff(attempt, response))
+
+    def get(self, path: str) -> Dict:
+        response = self.request("GET", path)
+        response.raise_for_status()
+        return response.json()
+
+    def post(
+        self, path: str, payload: Dict | None = None, idempotent: bool = False
+    ) -> Dict:
+        response = self.request("POST", path, idempotent=idempotent, json=payload or {})
+        response.raise_for_status()
+        return response.json()
+
+    def patch(self, path: str, payload: Dict) -> Dict:
+        response = self.request("PATCH", path, json=payload)
+        response.raise_for_status()
+        return response.json()
+
+    def paginate(self, path: str, payload: Dict | None = None) -> Iterator[Dict]:
+        """POST 목록 조회(databases/{id}/query 등)의 모든 결과를 순서대로 반환"""
+        payload = {**(payload or {}), "page_size": 100}
+        while True:
+            data = self.post(path, payload, idempotent=True)
+            yield from data.get("results", [])
+            if not data.get("has_more"):
+                return
+            payload["start_cursor"] = data["next_cursor"]
+
+    def map_concurrent(self, func: Callable, items: Iterable) -> List:
+        """
+        func를 max_concurrency개 스레드로 실행하고 items 순서대로 결과를 반환
+
+        요청 속도는 토큰 버킷이 제한하므로 스레드 수는 응답 대기 시간을 겹치는 용도입니다.
+        하나라도 실패하면 나머지 작업이 끝난 뒤 첫 번째 예외를 다시 발생시킵니다.
+        """
+        items = list(items)
+        if self.max_concurrency <= 1 or len(items) <= 1:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            futures = [executor.submit(func, item) for item in items]
+        return [future.result() for future in futures]
+
+
+@lru_cache(maxsize=1)
+def get_notion_client() -> NotionClient:
+    """프로세스에서 공유하는 노션 클라이언트 (연결 풀과 요청 제한을 함께 사용)"""
+    return NotionClient()
@@ -0,0 +1,35 @@
+from functools import wraps
+
+from django.conf import settings
+from django.db import connection
+
+
+class QueryCounter:
+    """현재 스레드의 DB 커넥션에서 실행된 쿼리 수 집계 (connection.execute_wrapper용)"""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def report_query_count(func):
+    """
+    DRF 뷰 메소드에서 실행된 DB 쿼리 수를 X-Query-Count 응답 헤더로 전달하는 데코레이터
+
+    DEBUG이거나 QUERY_COUNT_HEADER 설정이 켜져 있을 때만 집계하고 헤더를 붙입니다.
+    """
+
+    @wraps(func)
+    def wrapper(view_instance, request, *args, **kwargs):
+        if not (settings.DEBUG or settings.QUERY_COUNT_HEADER):
+            return func(view_instance, request, *args, **kwargs)
+        counter = QueryCounter()
+        with connection.execute_wrapper(counter):
+            response = func(view_instance, request, *args, **kwargs)
+        response["X-Query-Count"] = str(counter.count)
+        return response
+
+    return wrapper
@@ -0,0 +1,72 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.utils.encoding import filepath_to_uri
+from storages.backends.s3boto3 import S3Boto3Storage
+
+
+class StorageURLCache:
+    """
+    S3 파일 경로 -> URL 캐시
+
+    하나의 S3Boto3Storage를 재사용하고, 만든 URL은 프로세스 메모리에 보관합니다.
+    서명된 URL은 서명이 만료되기 한참 전(만료 시간의 절반)에 캐시에서 제거되며,
+    STORAGE_PUBLIC_READ_PREFIXES로 시작하는 경로는 서명 없이 FILE_SERVER_URL로 바로 만듭니다.
+    """
+
+    _storage = None
+    _cache: OrderedDict[str, tuple[str, float]] = OrderedDict()
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_storage(cls) -> S3Boto3Storage:
+        if cls._storage is None:
+            cls._storage = S3Boto3Storage()
+        return cls._storage
+
+    @classmethod
+    def url(cls, path: str | None) -> str | None:
+        if not path:
+            return None
+        if cls._is_public(path):
+            return f"{settings.FILE_SERVER_URL.rstrip('/')}/{filepath_to_uri(path)}"
+
+        now = time.monotonic()
+        with cls._lock:
+            cached = cls._cache.get(path)
+            if cached is not None and cached[1] > now:
+                cls._cache.move_to_end(path)
+                return cached[0]
+
+        url = cls.get_storage().url(path)
+        with cls._lock:
+            cls._cache[path] = (url, now + cls._get_ttl())
+            cls._cache.move_to_end(path)
+            while len(cls._cache) > settings.STORAGE_URL_CACHE_SIZE:
+                cls._cache.popitem(last=False)
+        return url
+
+    @classmethod
+    def urls(cls, paths) -> list[str]:
+        return [cls.url(path) for path in paths or []]
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._cache.clear()
+
+    @classmethod
+    def _is_public(cls, path: str) -> bool:
+        prefixes = settings.STORAGE_PUBLIC_READ_PREFIXES
+        return bool(settings.FILE_SERVER_URL and prefixes) and path.startswith(
+            tuple(prefixes)
+        )
+
+    @classmethod
+    def _get_ttl(cls) -> float:
+        storage = cls.get_storage()
+        if storage.querystring_auth:
+            return min(settings.STORAGE_URL_CACHE_TTL, storage.querystring_expire / 2)
+        return settings.STORAGE_URL_CACHE_TTL
@@ -0,0 +1,44 @@
+from types import SimpleNamespace
+
+import numpy as np
+from django.test import SimpleTestCase
+
+from api.event.models import AttendanceStatus
+from common.utils.attendance_matrix import MISSING, AttendanceMatrix
+
+
+class AttendanceMatrixTest(SimpleTestCase):
+    def setUp(self):
+        P, L, A, U = (
+            AttendanceStatus.PRESENT,
+            AttendanceStatus.LATE,
+            AttendanceStatus.ABSENT,
+            AttendanceStatus.UNCHECKED,
+        )
+        self.matrix = AttendanceMatrix(
+            [SimpleNamespace(id=10), SimpleNamespace(id=20)],
+            [SimpleNamespace(id=1), SimpleNamespace(id=2), SimpleNamespace(id=3)],
+            np.array([[P, L, MISSING], [A, P, U]], dtype=np.int8),
+        )
+
+    def test_counts(self):
+        self.assertEqual(
+            self.matrix.count(AttendanceStatus.PRESENT, axis=1).tolist(), [1, 1]
+        )
+        self.assertEqual(
+            self.matrix.count(AttendanceStatus.PRESENT, axis=0).tolist(), [1, 1, 0]
+        )
+        self.assertEqual(
+            self.matrix.count(AttendanceStatus.ABSENT, axis=0).tolist(), [1, 0, 0]
+        )
+
+    def test_labels(self):
+        self.assertEqual(
+            self.matrix.to_labels(),
+            [["출석", "지각", "-"], ["결석", "출석", "-"]],
+        )
+        self.assertEqual(self.matrix.to_labels(default="미정")[0][2], "미정")
+
+    def test_index(self):
+        self.assertEqual(self.matrix.row_index, {10: 0, 20: 1})
+        self.assertEqual(self.matrix.column_index, {1: 0, 2: 1, 3: 2})
@@ -0,0 +1,110 @@
+import random
+import uuid
+
+from django.test import SimpleTestCase
+
+from common.utils.code_generator import HashTimeGenerator, RollingCodeWindow
+
+
+class RollingCodeWindowTest(SimpleTestCase):
+    value = "e582a7a3-a936-4730-ba9f-c3988b2f73ec"
+
+    def expected_codes(self, current_time, time_range=10):
+        return {
+            HashTimeGenerator.generate_code(self.value, current_time - i)
+            for i in range(time_range)
+        }
+
+    def test_window_matches_code_list(self):
+        window = RollingCodeWindow(time_range=10)
+        current_time = 1_700_000_000
+
+        self.assertEqual(
+            window.get_codes(self.value, current_time),
+            self.expected_codes(current_time),
+        )
+
+    def test_window_rolls_forward(self):
+        window = RollingCodeWindow(time_range=10)
+        current_time = 1_700_000_000
+        window.get_codes(self.value, current_time)
+
+        for offset in (1, 3, 9, 10, 25):
+            self.assertEqual(
+                window.get_codes(self.value, current_time + offset),
+                self.expected_codes(current_time + offset),
+            )
+
+    def test_window_width_is_configurable(self):
+        window = RollingCodeWindow(time_range=3)
+        current_time = 1_700_000_000
+
+        codes = window.get_codes(self.value, current_time)
+
+        self.assertEqual(codes, self.expected_codes(current_time, time_range=3))
+        self.assertNotIn(
+            HashTimeGenerator.generate_code(self.value, current_time - 3), codes
+        )
+
+    def test_window_evicts_least_recently_used_value(self):
+        window = RollingCodeWindow(time_range=2, max_values=2)
+
+        window.get_codes("a", 100)
+        window.get_codes("b", 100)
+        window.get_codes("a", 100)
+        window.get_codes("c", 100)
+
+        self.assertEqual(list(window._windows.keys()), ["a", "c"])
+
+
+class GenerateCodeBatchTest(SimpleTestCase):
+    def test_batch_matches_scalar(self):
+        rng = random.Random(1013)
+        values = [str(uuid.UUID(int=rng.getrandbits(128))) for _ in range(200)]
+        values += ["", "a", "출석-코드", "x" * 300]
+        times = [rng.randrange(0, 2_000_000_000) for _ in values]
+
+        self.assertEqual(
+            HashTimeGenerator.generate_code_batch(values, times),
+            [
+                HashTimeGenerator.generate_code(value, time_in_seconds)
+                for value, time_in_seconds in zip(values, times)
+            ],
+        )
+
+    def test_batch_matches_scalar_with_custom_charset_and_length(self):
+        values = ["event-1", "event-2", "event-3"]
+        times = [0, 1_700_000_000, 2**40]
+
+        for charset, code_length in (("0123456789", 6), (None, 4), ("ab", 70)):
+            self.assertEqual(
+                HashTimeGenerator.generate_code_batch(
+                    values, times, charset=charset, code_length=code_length
+                ),
+                [
+                    HashTimeGenerator.generate_code(
+                        value, time_in_seconds, charset=charset, code_length=code_length
+                    )
+                    for value, time_in_seconds in zip(values, times)
+                ],
+            )
+
+    def test_custom_hash_batch_matches_scalar(self):
+        data = [b"", b"\x00", b"\xff" * 17, "한글".encode("utf-8")]
+
+        self.assertEqual(
+            [int(h) for h in HashTimeGenerator.custom_hash_batch(data)],
+            [HashTimeGenerator.custom_hash(d) for d in data],
+        )
+
+    def test_window_batch(self):
+        current_time = 1_700_000_000
+
+        windows = HashTimeGenerator.generate_code_window_batch(
+            ["a", "b"], current_time, time_range=3
+        )
+
+        self.assertEqual(
+            windows["b"],
+            [HashTimeGenerator.generate_code("b", current_time - i) for i in range(3)],
+        )
@@ -0,0 +1,93 @@
+from types import SimpleNamespace
+
+import numpy as np
+from django.test import SimpleTestCase
+
+from common.utils.geofence import (
+    Geofence,
+    haversine_distance,
+    haversine_distances,
+    score_outliers,
+)
+
+# 서울시청 부근
+CENTER = (37.5665, 126.9780)
+SQUARE = [
+    [37.5660, 126.9770],
+    [37.5660, 126.9790],
+    [37.5670, 126.9790],
+    [37.5670, 126.9770],
+]
+
+
+class HaversineTest(SimpleTestCase):
+    def test_known_distance(self):
+        # 위도 0.001도는 약 111m
+        self.assertAlmostEqual(
+            haversine_distance(37.5665, 126.9780, 37.5675, 126.9780), 111.2, delta=0.5
+        )
+
+    def test_vectorized_matches_scalar(self):
+        latitudes = [37.5, 37.6, 35.1]
+        longitudes = [127.0, 126.9, 129.0]
+
+        np.testing.assert_allclose(
+            haversine_distances(latitudes, longitudes, *CENTER),
+            [
+                haversine_distance(lat, lon, *CENTER)
+                for lat, lon in zip(latitudes, longitudes)
+            ],
+        )
+
+
+class GeofenceTest(SimpleTestCase):
+    def test_circle(self):
+        geofence = Geofence(*CENTER, radius=100)
+
+        self.assertTrue(geofence.contains(37.5670, 126.9780))
+        self.assertFalse(geofence.contains(37.5680, 126.9780))
+
+    def test_polygon(self):
+        geofence = Geofence(polygon=SQUARE)
+
+        self.assertTrue(geofence.contains(37.5665, 126.9780))
+        self.assertFalse(geofence.contains(37.5665, 126.9800))
+        self.assertFalse(geofence.contains(37.5700, 126.9780))
+
+    def test_contains_many_matches_contains(self):
+        rng = np.random.default_rng(9)
+        latitudes = rng.uniform(37.5655, 37.5675, 200)
+        longitudes = rng.uniform(126.9765, 126.9795, 200)
+
+        for geofence in (Geofence(*CENTER, radius=80), Geofence(polygon=SQUARE)):
+            self.assertEqual(
+                list(geofence.contains_many(latitudes, longitudes)),
+                [
+                    geofence.contains(lat, lon)
+                    for lat, lon in zip(latitudes, longitudes)
+                ],
+            )
+
+    def test_from_event(self):
+        event = SimpleNamespace(
+            geofence_latitude=None,
+            geofence_longitude=None,
+            geofence_radius=None,
+            geofence_polygon=None,
+        )
+        self.assertIsNone(Geofence.from_event(event))
+
+        event.geofence_polygon = SQUARE
+        self.assertIs(Geofence.from_event(event), Geofence.from_event(event))
+
+
+class ScoreOutliersTest(SimpleTestCase):
+    def test_far_point_scores_high(self):
+        rng = np.random.default_rng(3)
+        latitudes = np.append(CENTER[0] + rng.normal(0, 0.0001, 50), 37.60)
+        longitudes = np.append(CENTER[1] + rng.normal(0, 0.0001, 50), 127.05)
+
+        scores = score_outliers(latitudes, longitudes)
+
+        self.assertGreater(scores[-1], 3.5)
+        self.assertTrue((scores[:-1] < 3.5).all())
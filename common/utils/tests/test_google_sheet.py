@@ -1,12 +1,19 @@
-from datetime import date, time
+from datetime import date, datetime
 from unittest.mock import MagicMock, patch
 
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+from googleapiclient.errors import HttpError
 
 from api.club.models import Club, Generation, GenMember, Member
 from api.event.models import Attendance, AttendanceStatus, Event
 from api.userapp.models import User
-from common.utils.google_sheet import create_attendance_sheet
+from common.utils.google_sheet import (
+    build_attendance_values,
+    changed_ranges,
+    create_attendance_sheet,
+    get_google_services,
+)
 
 
 class GoogleSheetTest(TestCase):
@@ -37,8 +44,8 @@ class GoogleSheetTest(TestCase):
             generation=self.generation,
             title="첫 번째 모임",
             date=date(2024, 1, 15),
-            start_time=time(18, 0),
-            end_time=time(20, 0),
+            start_datetime=timezone.make_aware(datetime(2024, 1, 15, 18, 0)),
+            end_datetime=timezone.make_aware(datetime(2024, 1, 15, 20, 0)),
             start_minutes=0,
             late_minutes=10,
             fail_minutes=30,
@@ -48,8 +55,8 @@ class GoogleSheetTest(TestCase):
             generation=self.generation,
             title="두 번째 모임",
             date=date(2024, 1, 22),
-            start_time=time(18, 0),
-            end_time=time(20, 0),
+            start_datetime=timezone.make_aware(datetime(2024, 1, 22, 18, 0)),
+            end_datetime=timezone.make_aware(datetime(2024, 1, 22, 20, 0)),
             start_minutes=0,
             late_minutes=10,
             fail_minutes=30,
@@ -78,6 +85,9 @@ class GoogleSheetTest(TestCase):
             status=AttendanceStatus.PRESENT,
         )
 
+    def tearDown(self):
+        get_google_services.cache_clear()
+
     @patch("common.utils.google_sheet.service_account.Credentials")
     @patch("common.utils.google_sheet.build")
     def test_create_attendance_sheet(self, mock_build, mock_credentials):
@@ -95,33 +105,112 @@ class GoogleSheetTest(TestCase):
         self.assertEqual(
             result, "https://docs.google.com/spreadsheets/d/test_spreadsheet_id"
         )
+        self.generation.refresh_from_db()
+        self.assertEqual(self.generation.google_sheet_id, "test_spreadsheet_id")
 
-        # API 호출 검증
+        # API 호출 검증 (값과 서식은 batchUpdate 한 번으로 반영)
         mock_service.spreadsheets().create().execute.assert_called_once()
-        mock_service.spreadsheets().values().update().execute.assert_called_once()
+        mock_service.spreadsheets().values().update().execute.assert_not_called()
         mock_service.spreadsheets().batchUpdate().execute.assert_called_once()
 
-        # 데이터 형식 검증 - 수정된 부분
-        mock_calls = mock_service.mock_calls
-
-        # update 호출에서 사용된 인자 찾기
-        for call in mock_calls:
-            if "values().update" in str(call):
-                # logger.info(f"Update call: {call}")
-                # call[2]는 kwargs를 포함
-                values = call[2]["body"]["values"]
-
-                # 헤더 검증
-                self.assertEqual(values[0][0], "이름(총 2명)")
-                self.assertEqual(values[0][1], "01/15 첫 번째 모임")
-                self.assertEqual(values[0][2], "01/22 두 번째 모임")
-
-                # 데이터 검증
-                self.assertEqual(values[1][0], "test_user1")
-                self.assertEqual(values[1][1], "출석")
-                self.assertEqual(values[1][2], "지각")
-
-                self.assertEqual(values[2][0], "test_user2")
-                self.assertEqual(values[2][1], "결석")
-                self.assertEqual(values[2][2], "출석")
-                break
+        # 데이터 형식 검증
+        values = build_attendance_values(self.generation)
+
+        # 헤더 검증
+        self.assertEqual(values[0][0], "이름(총 2명)")
+        self.assertEqual(values[0][1], "01/15 첫 번째 모임")
+        self.assertEqual(values[0][2], "01/22 두 번째 모임")
+
+        # 데이터 검증
+        self.assertEqual(values[1][0], "test_user1")
+        self.assertEqual(values[1][1], "출석")
+        self.assertEqual(values[1][2], "지각")
+
+        self.assertEqual(values[2][0], "test_user2")
+        self.assertEqual(values[2][1], "결석")
+        self.assertEqual(values[2][2], "출석")
+
+    @patch("common.utils.google_sheet.service_account.Credentials")
+    @patch("common.utils.google_sheet.build")
+    def test_reuse_attendance_sheet(self, mock_build, mock_credentials):
+        """이전에 내보낸 시트를 재사용하고 바뀐 칸만 다시 씀"""
+        mock_service = MagicMock()
+        mock_build.return_value = mock_service
+        Generation.objects.filter(id=self.generation.id).update(
+            google_sheet_id="existing_id"
+        )
+        self.generation.refresh_from_db()
+
+        previous = build_attendance_values(self.generation)
+        previous[1][2] = "결석"
+        mock_service.spreadsheets().values().get().execute.return_value = {
+            "values": previous
+        }
+
+        result = create_attendance_sheet(self.generation)
+
+        self.assertEqual(result, "https://docs.google.com/spreadsheets/d/existing_id")
+        mock_service.spreadsheets().create().execute.assert_not_called()
+        requests = mock_service.spreadsheets().batchUpdate.call_args.kwargs["body"][
+            "requests"
+        ]
+        self.assertEqual(
+            requests,
+            [
+                {
+                    "updateCells": {
+                        "start": {"sheetId": 0, "rowIndex": 1, "columnIndex": 2},
+                        "rows": [
+                            {"values": [{"userEnteredValue": {"stringValue": "지각"}}]}
+                        ],
+                        "fields": "userEnteredValue",
+                    }
+                }
+            ],
+        )
+
+    @patch("common.utils.google_sheet.service_account.Credentials")
+    @patch("common.utils.google_sheet.build")
+    def test_recreate_deleted_sheet(self, mock_build, mock_credentials):
+        """이전 시트가 삭제되었거나 접근할 수 없으면 새 시트를 만듦"""
+        mock_service = MagicMock()
+        mock_build.return_value = mock_service
+        Generation.objects.filter(id=self.generation.id).update(
+            google_sheet_id="deleted_id"
+        )
+        self.generation.refresh_from_db()
+        mock_service.spreadsheets().values().get().execute.side_effect = HttpError(
+            MagicMock(status=404, reason="Not Found"), b""
+        )
+        mock_service.spreadsheets().create().execute.return_value = {
+            "spreadsheetId": "new_id"
+        }
+
+        result = create_attendance_sheet(self.generation)
+
+        self.assertEqual(result, "https://docs.google.com/spreadsheets/d/new_id")
+        self.generation.refresh_from_db()
+        self.assertEqual(self.generation.google_sheet_id, "new_id")
+        mock_service.spreadsheets().batchUpdate().execute.assert_called_once()
+
+
+class ChangedRangesTest(SimpleTestCase):
+    def test_changed_runs(self):
+        previous = [["a", "b", "c", "d"], ["e", "f"]]
+        current = [["a", "x", "y", "d"], ["e", "f"], ["g", 1]]
+        self.assertEqual(
+            changed_ranges(previous, current),
+            [(0, 1, ["x", "y"]), (2, 0, ["g", 1])],
+        )
+
+    def test_clears_removed_cells(self):
+        previous = [["a", "b", "c"], ["d"]]
+        current = [["a"]]
+        self.assertEqual(
+            changed_ranges(previous, current),
+            [(0, 1, ["", ""]), (1, 0, [""])],
+        )
+
+    def test_unchanged(self):
+        values = [["a", 1, ""], ["b"]]
+        self.assertEqual(changed_ranges(values, [["a", 1], ["b", ""]]), [])
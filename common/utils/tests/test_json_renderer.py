@@ -0,0 +1,71 @@
+import json
+import uuid
+from datetime import datetime, time
+from decimal import Decimal
+from zoneinfo import ZoneInfo
+
+from django.test import SimpleTestCase
+from rest_framework.response import Response
+
+from common.management.commands.benchmark_json_renderer import build_roster_payload
+from config.json_renderer import CustomJSONRenderer, StdlibJSONRenderer
+
+
+class CustomJSONRendererTest(SimpleTestCase):
+    def assertSameOutput(self, data, status=200, accepted_media_type=None):
+        renderer_context = {"response": Response(status=status)}
+        self.assertEqual(
+            CustomJSONRenderer().render(data, accepted_media_type, renderer_context),
+            StdlibJSONRenderer().render(data, accepted_media_type, renderer_context),
+        )
+
+    def test_roster_payload(self):
+        self.assertSameOutput(build_roster_payload(20))
+
+    def test_special_values(self):
+        self.assertSameOutput(
+            {
+                "utc": datetime(2025, 3, 1, 9, 30, 15, 123456, tzinfo=ZoneInfo("UTC")),
+                "kst": datetime(2025, 3, 1, 9, 30, tzinfo=ZoneInfo("Asia/Seoul")),
+                "time": time(9, 30, 15, 500),
+                "decimal": Decimal("37.5665"),
+                "uuid": uuid.uuid4(),
+                "line_separator": "a\u2028b\u2029c",
+                "keys": {1: "one", 2: "two"},
+                "big": 2**70,
+            }
+        )
+
+    def test_error_and_empty_responses(self):
+        self.assertSameOutput(
+            {"status": 400, "message": "error", "code": "CE001"}, status=400
+        )
+        self.assertSameOutput(None, status=204)
+        self.assertSameOutput({"message": "잘못된 요청"}, status=400)
+
+    def test_indent(self):
+        self.assertSameOutput(
+            {"a": [1, 2]}, accepted_media_type="application/json; indent=4"
+        )
+
+    def test_float_exponent_format(self):
+        renderer_context = {"response": Response(status=200)}
+        data = {"values": [0.1, 1e-07, 1e16, 37.5665]}
+
+        custom = CustomJSONRenderer().render(data, None, renderer_context)
+        stdlib = StdlibJSONRenderer().render(data, None, renderer_context)
+
+        self.assertIn(b"1e-7", custom)
+        self.assertIn(b"1e-07", stdlib)
+        self.assertEqual(json.loads(custom), json.loads(stdlib))
+
+    def test_non_finite_floats_become_null(self):
+        renderer_context = {"response": Response(status=200)}
+        data = {"nan": float("nan"), "inf": float("inf")}
+
+        with self.assertRaises(ValueError):
+            StdlibJSONRenderer().render(data, None, renderer_context)
+        self.assertEqual(
+            json.loads(CustomJSONRenderer().render(data, None, renderer_context)),
+            {"status": 200, "message": "success", "data": {"nan": None, "inf": None}},
+        )
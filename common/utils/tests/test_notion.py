@@ -0,0 +1,138 @@
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import requests
+from django.test import SimpleTestCase, TestCase
+
+from api.club.models import Club, Generation, GenMember, Member
+from api.notion.models import NotionPageMapping
+from api.userapp.models import User
+from common.utils.notion import NotionAttendanceManager
+
+
+def make_row(name: str, status: str) -> dict:
+    return {
+        "이름": {"title": [{"text": {"content": name}}]},
+        "01/15 첫 번째 모임": {"select": {"name": status}},
+    }
+
+
+class NotionSyncRowsTest(TestCase):
+    def setUp(self):
+        club = Club.objects.create(name="테스트 동아리")
+        generation = Generation.objects.create(
+            club=club, name="1기", start_date=date(2024, 1, 1)
+        )
+        self.gen_members = []
+        for i in range(4):
+            user = User.objects.create(username=f"user{i}", identifier=f"user{i}")
+            member = Member.objects.create(user=user, club=club)
+            self.gen_members.append(
+                GenMember.objects.create(member=member, generation=generation)
+            )
+        self.manager = NotionAttendanceManager()
+
+    def map(self, gen_member, row, page_id):
+        return NotionPageMapping.objects.create(
+            database_id="db",
+            gen_member=gen_member,
+            page_id=page_id,
+            content_hash=self.manager._row_hash(row),
+        )
+
+    @patch.object(NotionAttendanceManager, "_archive_page")
+    @patch.object(NotionAttendanceManager, "_update_database_row")
+    @patch.object(NotionAttendanceManager, "_update_page", return_value=True)
+    def test_sync_only_changed_rows(self, mock_update, mock_create, mock_archive):
+        unchanged, changed, new, left = self.gen_members
+        rows = {
+            unchanged.id: make_row("user0", "출석"),
+            changed.id: make_row("user1", "지각"),
+            new.id: make_row("user2", "미정"),
+        }
+        self.map(unchanged, rows[unchanged.id], "page-0")
+        self.map(changed, make_row("user1", "미정"), "page-1")
+        self.map(left, make_row("user3", "출석"), "page-3")
+        mock_create.return_value = {"id": "page-2"}
+
+        mappings = {m.gen_member_id: m for m in NotionPageMapping.objects.all()}
+        self.manager._sync_rows("db", rows, mappings)
+
+        mock_update.assert_called_once_with("page-1", rows[changed.id])
+        mock_create.assert_called_once_with("db", rows[new.id])
+        mock_archive.assert_called_once_with("page-3")
+        self.assertEqual(
+            dict(NotionPageMapping.objects.values_list("gen_member_id", "page_id")),
+            {unchanged.id: "page-0", changed.id: "page-1", new.id: "page-2"},
+        )
+        self.assertEqual(
+            NotionPageMapping.objects.get(gen_member=changed).content_hash,
+            self.manager._row_hash(rows[changed.id]),
+        )
+
+    @patch.object(NotionAttendanceManager, "_update_database_row")
+    @patch.object(NotionAttendanceManager, "_update_page", return_value=False)
+    def test_recreate_deleted_page(self, mock_update, mock_create):
+        """노션에서 삭제된 행은 새로 만들고 매핑을 교체"""
+        gen_member = self.gen_members[0]
+        row = make_row("user0", "출석")
+        self.map(gen_member, make_row("user0", "결석"), "page-old")
+        mock_create.return_value = {"id": "page-new"}
+
+        mappings = {m.gen_member_id: m for m in NotionPageMapping.objects.all()}
+        self.manager._sync_rows("db", {gen_member.id: row}, mappings)
+
+        mock_create.assert_called_once_with("db", row)
+        self.assertEqual(
+            NotionPageMapping.objects.get(gen_member=gen_member).page_id, "page-new"
+        )
+
+    @patch.object(NotionAttendanceManager, "_archive_page")
+    def test_archive_deleted_gen_member(self, mock_archive):
+        """삭제된 기수 멤버의 매핑도 남아 있어서 노션 행을 보관 처리"""
+        gen_member = self.gen_members[3]
+        self.map(gen_member, make_row("user3", "출석"), "page-3")
+        gen_member.delete()
+
+        mappings = {m.gen_member_id: m for m in NotionPageMapping.objects.all()}
+        self.manager._sync_rows("db", {}, mappings)
+
+        mock_archive.assert_called_once_with("page-3")
+        self.assertFalse(NotionPageMapping.objects.exists())
+
+
+class NotionUpdatePageTest(SimpleTestCase):
+    def setUp(self):
+        self.client = MagicMock()
+        self.manager = NotionAttendanceManager(client=self.client)
+
+    def respond(self, status_code, json):
+        response = MagicMock(status_code=status_code)
+        response.json.return_value = json
+        self.client.request.return_value = response
+        return response
+
+    def test_trashed_page(self):
+        """휴지통에 있는 페이지는 400으로 응답하므로 삭제된 페이지처럼 처리"""
+        response = self.respond(
+            400,
+            {
+                "object": "error",
+                "status": 400,
+                "code": "validation_error",
+                "message": "Can't edit block that is archived. You must unarchive the block before editing.",
+            },
+        )
+
+        self.assertFalse(self.manager._update_page("page", {}))
+        self.manager._archive_page("page")
+        response.raise_for_status.assert_not_called()
+
+    def test_other_validation_error_is_raised(self):
+        response = self.respond(
+            400, {"code": "validation_error", "message": "body failed validation"}
+        )
+        response.raise_for_status.side_effect = requests.HTTPError("400")
+
+        with self.assertRaises(requests.HTTPError):
+            self.manager._update_page("page", {})
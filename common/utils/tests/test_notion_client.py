@@ -0,0 +1,107 @@
+from unittest.mock import MagicMock, patch
+
+import requests
+from django.test import SimpleTestCase
+
+from common.utils.notion_client import NotionClient, TokenBucket
+
+
+def make_response(status_code=200, json=None, headers=None):
+    response = MagicMock(status_code=status_code, headers=headers or {})
+    response.json.return_value = json or {}
+    return response
+
+
+class NotionClientTest(SimpleTestCase):
+    def setUp(self):
+        self.client = NotionClient(
+            token="test", rate_limit=1000, max_concurrency=3, max_retries=2
+        )
+        self.client.session = MagicMock()
+
+    def test_paginate_follows_cursor(self):
+        self.client.session.request.side_effect = [
+            make_response(
+                json={"results": [{"id": 1}], "has_more": True, "next_cursor": "c1"}
+            ),
+            make_response(json={"results": [{"id": 2}], "has_more": False}),
+        ]
+
+        pages = list(self.client.paginate("databases/db/query"))
+
+        self.assertEqual(pages, [{"id": 1}, {"id": 2}])
+        second_payload = self.client.session.request.call_args_list[1].kwargs["json"]
+        self.assertEqual(second_payload, {"page_size": 100, "start_cursor": "c1"})
+
+    @patch("common.utils.notion_client.time.sleep")
+    def test_retry_after(self, mock_sleep):
+        self.client.session.request.side_effect = [
+            make_response(429, headers={"Retry-After": "2"}),
+            make_response(json={"id": "page"}),
+        ]
+
+        self.assertEqual(self.client.post("pages", {}), {"id": "page"})
+        mock_sleep.assert_called_once_with(2.0)
+
+    @patch("common.utils.notion_client.time.sleep")
+    def test_gives_up_after_max_retries(self, mock_sleep):
+        self.client.session.request.return_value = make_response(503)
+
+        response = self.client.request("GET", "databases/db")
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(self.client.session.request.call_count, 3)
+        self.assertEqual(mock_sleep.call_count, 2)
+
+    @patch("common.utils.notion_client.time.sleep")
+    def test_post_not_retried_on_connection_error(self, mock_sleep):
+        self.client.session.request.side_effect = requests.ConnectionError
+
+        with self.assertRaises(requests.ConnectionError):
+            self.client.post("pages", {})
+
+        self.assertEqual(self.client.session.request.call_count, 1)
+        mock_sleep.assert_not_called()
+
+    @patch("common.utils.notion_client.time.sleep")
+    def test_post_not_retried_on_server_error(self, mock_sleep):
+        self.client.session.request.return_value = make_response(502)
+
+        response = self.client.request("POST", "pages", json={})
+
+        self.assertEqual(response.status_code, 502)
+        self.assertEqual(self.client.session.request.call_count, 1)
+
+    @patch("common.utils.notion_client.time.sleep")
+    def test_idempotent_retried_on_connection_error(self, mock_sleep):
+        self.client.session.request.side_effect = [
+            requests.Timeout,
+            make_response(json={"results": [], "has_more": False}),
+        ]
+
+        self.assertEqual(list(self.client.paginate("databases/db/query")), [])
+        self.assertEqual(self.client.session.request.call_count, 2)
+
+    def test_map_concurrent_keeps_order(self):
+        self.assertEqual(
+            self.client.map_concurrent(lambda x: x * 2, range(10)),
+            [x * 2 for x in range(10)],
+        )
+
+
+class TokenBucketTest(SimpleTestCase):
+    @patch("common.utils.notion_client.time.sleep")
+    @patch("common.utils.notion_client.time.monotonic")
+    def test_waits_when_empty(self, mock_monotonic, mock_sleep):
+        mock_monotonic.return_value = 0.0
+        bucket = TokenBucket(rate=3)
+        for _ in range(3):
+            bucket.acquire()
+        mock_sleep.assert_not_called()
+
+        mock_sleep.side_effect = lambda wait: setattr(
+            mock_monotonic, "return_value", mock_monotonic.return_value + wait
+        )
+        bucket.acquire()
+        mock_sleep.assert_called_once()
+        self.assertAlmostEqual(mock_sleep.call_args.args[0], 1 / 3)
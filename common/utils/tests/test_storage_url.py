@@ -0,0 +1,63 @@
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from common.utils.storage_url import StorageURLCache
+
+
+@override_settings(
+    FILE_SERVER_URL="https://cdn.example.com/",
+    STORAGE_URL_CACHE_TTL=60,
+    STORAGE_URL_CACHE_SIZE=2,
+    STORAGE_PUBLIC_READ_PREFIXES=["event_images/"],
+)
+class StorageURLCacheTest(SimpleTestCase):
+    def setUp(self):
+        StorageURLCache.clear()
+        storage = StorageURLCache.get_storage()
+        patcher = mock.patch.object(
+            storage, "url", side_effect=lambda path: f"https://signed/{path}"
+        )
+        self.storage_url = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(StorageURLCache.clear)
+
+    def test_public_prefix_is_not_signed(self):
+        self.assertEqual(
+            StorageURLCache.url("event_images/a b.png"),
+            "https://cdn.example.com/event_images/a%20b.png",
+        )
+        self.storage_url.assert_not_called()
+
+    def test_signed_url_is_cached(self):
+        for _ in range(3):
+            url = StorageURLCache.url("event_qr_codes/qr.png")
+
+        self.assertEqual(url, "https://signed/event_qr_codes/qr.png")
+        self.storage_url.assert_called_once()
+
+    def test_expired_entry_is_signed_again(self):
+        with mock.patch("common.utils.storage_url.time.monotonic") as monotonic:
+            monotonic.return_value = 0
+            StorageURLCache.url("event_qr_codes/qr.png")
+            monotonic.return_value = 61
+            StorageURLCache.url("event_qr_codes/qr.png")
+
+        self.assertEqual(self.storage_url.call_count, 2)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        StorageURLCache.url("a.png")
+        StorageURLCache.url("b.png")
+        StorageURLCache.url("a.png")
+        StorageURLCache.url("c.png")
+        StorageURLCache.url("a.png")
+        StorageURLCache.url("b.png")
+
+        self.assertEqual(
+            [call.args[0] for call in self.storage_url.call_args_list],
+            ["a.png", "b.png", "c.png", "b.png"],
+        )
+
+    def test_empty_path(self):
+        self.assertIsNone(StorageURLCache.url(None))
+        self.assertEqual(StorageURLCache.urls(None), [])
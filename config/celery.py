@@ -26,6 +26,14 @@ app.conf.beat_schedule = {
             minute="*/5"
         ),  # 매 시간의 0,5,10,15,20,25,30,35,40,45,50,55분에 실행
     },
+    "drain-checkin-stream": {
+        "task": "scheduler.tasks.drain_checkin_stream",
+        "schedule": 2.0,  # 2초마다 QR 출석 큐 저장
+    },
+    "reconcile-attendance-stats": {
+        "task": "scheduler.tasks.reconcile_attendance_stats",
+        "schedule": crontab(hour=4, minute=0),  # 매일 새벽 4시 출석 통계 검증
+    },
 }
 
 app.conf.timezone = "Asia/Seoul"
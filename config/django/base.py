@@ -194,6 +194,29 @@ CACHES = {
 # Cache time to live is 15 minutes
 CACHE_TTL = 60 * 15
 
+# QR 코드 유효 시간 (초)
+QR_CODE_VALID_SECONDS = int(os.getenv("QR_CODE_VALID_SECONDS", 10))
+
+# DEBUG가 아니어도 일부 API 응답에 X-Query-Count(DB 쿼리 수) 헤더를 붙일지 여부
+QUERY_COUNT_HEADER = os.getenv("QUERY_COUNT_HEADER", "False") == "True"
+
+# QR 출석을 Redis Stream에 쌓아두고 배치로 저장할지 여부
+ATTENDANCE_WRITE_BEHIND = os.getenv("ATTENDANCE_WRITE_BEHIND", "False") == "True"
+CHECKIN_STREAM_BATCH_SIZE = int(os.getenv("CHECKIN_STREAM_BATCH_SIZE", 500))
+
+# QR 출석 시 사용하는 기수 명단 캐시 유지 시간 (초)
+ROSTER_CACHE_TTL = int(os.getenv("ROSTER_CACHE_TTL", 60 * 60 * 6))
+
+# 이름 정렬에 사용할 PostgreSQL collation
+# 기본값 "C"는 코드 포인트 순서(한글은 가나다순)이며, ICU를 지원하는 DB라면
+# "ko-KR-x-icu"로 설정할 수 있음
+KOREAN_COLLATION = os.getenv("KOREAN_COLLATION", "C")
+
+# 엑셀 등 백그라운드 내보내기 작업 상태 유지 시간 (초)
+EXPORT_JOB_TTL = int(os.getenv("EXPORT_JOB_TTL", 60 * 60 * 24))
+# 기수별로 하나만 실행하는 작업(노션 동기화 등)의 잠금 최대 유지 시간 (초)
+EXPORT_JOB_LOCK_TTL = int(os.getenv("EXPORT_JOB_LOCK_TTL", 60 * 30))
+
 # Cache session settings
 SESSION_ENGINE = "django.contrib.sessions.backends.cache"
 SESSION_CACHE_ALIAS = "default"
@@ -228,6 +251,7 @@ from config.settings.apple_settings import *  # noqa
 from config.settings.fcm_settings import *  # noqa
 from config.settings.jwt_settings import *  # noqa
 from config.settings.aws_settings import *  # noqa
+from config.settings.notion_settings import *  # noqa
 
 # Celery 설정
 CELERY_BROKER_URL = "redis://localhost:6379/0"
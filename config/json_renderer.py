@@ -1,19 +1,29 @@
+import orjson
 from rest_framework.renderers import JSONRenderer
 from rest_framework.status import is_success
+from rest_framework.utils.encoders import JSONEncoder
 
 
-class CustomJSONRenderer(JSONRenderer):
+class StdlibJSONRenderer(JSONRenderer):
+    """응답을 {status, message, data} 형식으로 감싸서 표준 json 모듈로 인코딩"""
+
     def render(self, data, accepted_media_type=None, renderer_context=None):
-        if isinstance(data, dict) and all(
+        if not self.is_error(data):
+            data = self.wrap(data, renderer_context)
+        return self.encode(data, accepted_media_type, renderer_context)
+
+    def is_error(self, data) -> bool:
+        """exception_handler에서 만든 에러 응답은 그대로 반환"""
+        return isinstance(data, dict) and all(
             key in data for key in ["status", "message", "code"]
-        ):
-            return super().render(data, accepted_media_type, renderer_context)
+        )
 
+    def wrap(self, data, renderer_context) -> dict:
         status_code = renderer_context["response"].status_code
         if data is None:
             data = {}
 
-        response = {
+        return {
             "status": status_code,
             "message": "success"
             if is_success(status_code)
@@ -21,4 +31,38 @@ class CustomJSONRenderer(JSONRenderer):
             "data": data,
         }
 
-        return super().render(response, accepted_media_type, renderer_context)
+    def encode(self, data, accepted_media_type, renderer_context) -> bytes:
+        return super().render(data, accepted_media_type, renderer_context)
+
+
+class CustomJSONRenderer(StdlibJSONRenderer):
+    """
+    StdlibJSONRenderer와 같은 응답을 orjson으로 인코딩
+
+    datetime, Decimal 등 orjson이 직접 처리하지 않는 값은 DRF의 JSONEncoder로 변환해
+    기존과 같은 형식으로 출력합니다. 들여쓰기가 필요한 경우(browsable API 등)나
+    orjson으로 인코딩할 수 없는 값(64비트를 넘는 정수 등)은 표준 json 모듈을 사용합니다.
+
+    float는 표준 json 모듈과 바이트 단위로 같지 않습니다.
+    - 지수 표기가 다름 (1e-07 -> 1e-7, 1e+16은 동일). 파싱한 값은 같습니다.
+    - NaN/Infinity는 ValueError 대신 null로 출력됩니다.
+    """
+
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    encoder = JSONEncoder()
+
+    def encode(self, data, accepted_media_type, renderer_context) -> bytes:
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().encode(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=self.encoder.default, option=self.options)
+        except orjson.JSONEncodeError:
+            return super().encode(data, accepted_media_type, renderer_context)
+
+        # 표준 json 렌더러와 같이 JavaScript에서 줄바꿈으로 해석되는 문자를 이스케이프
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+                b"\xe2\x80\xa9", b"\\u2029"
+            )
+        return ret
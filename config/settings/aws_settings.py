@@ -15,3 +15,13 @@ DEFAULT_FILE_STORAGE = "storages.backends.s3boto3.S3Boto3Storage"
 AWS_S3_ADDRESSING_STYLE = "virtual"
 AWS_S3_SIGNATURE_VERSION = "s3v4"
 AWS_QUERYSTRING_AUTH = False  # URL에 인증 파라미터 제거
+
+# 파일 URL 캐시 (common.utils.storage_url.StorageURLCache)
+STORAGE_URL_CACHE_TTL = int(os.getenv("STORAGE_URL_CACHE_TTL", 60 * 30))
+STORAGE_URL_CACHE_SIZE = int(os.getenv("STORAGE_URL_CACHE_SIZE", 10000))
+# 서명 없이 FILE_SERVER_URL(CDN)로 바로 제공할 경로 prefix (쉼표로 구분)
+STORAGE_PUBLIC_READ_PREFIXES = [
+    prefix
+    for prefix in os.getenv("STORAGE_PUBLIC_READ_PREFIXES", "").split(",")
+    if prefix
+]
@@ -0,0 +1,10 @@
+import os
+
+NOTION_TOKEN = os.getenv("NOTION_TOKEN")
+NOTION_VERSION = "2022-06-28"
+
+# 노션 API 평균 요청 제한 (초당 3회) 안에서 동시에 보낼 요청 수
+NOTION_RATE_LIMIT = float(os.getenv("NOTION_RATE_LIMIT", 3))
+NOTION_MAX_CONCURRENCY = int(os.getenv("NOTION_MAX_CONCURRENCY", 3))
+# 429/5xx 응답 재시도 횟수
+NOTION_MAX_RETRIES = int(os.getenv("NOTION_MAX_RETRIES", 5))
@@ -2,12 +2,22 @@ import logging
 from datetime import timedelta
 
 from celery import shared_task
-from django.db.models import OuterRef, Subquery
+from django.conf import settings
+from django.db import transaction
 from django.utils import timezone
 
+from api.club.models import Generation
 from api.club.models.generation_mapping import GenMember
-from api.event.models import Attendance, Event
+from api.club.services.roster_cache import RosterCache
+from api.event.models import (
+    Attendance,
+    AttendanceCurrent,
+    Event,
+    EventAttendanceStats,
+    GenMemberAttendanceStats,
+)
 from api.event.models.enums import AttendanceStatus
+from api.event.service.checkin_queue import CheckInQueue
 from api.userapp.models.user import User
 from common.component.fcm_component import FCMComponent
 from common.component.notification_template import NotificationTemplate
@@ -51,29 +61,19 @@ def event_start_push():
             continue
         logger.info(f"Processing event: {event.title} (ID: {event.id})")
 
+        # 출석이 몰리기 전에 기수 명단 캐시를 미리 생성
+        RosterCache.build(event.generation_id)
+
         # 해당 generation의 모든 GenMember 가져오기
         gen_members = GenMember.objects.filter(
             generation=event.generation, is_current=True
         )
 
         # 각 GenMember별로 가장 최신의 Attendance 상태가 UNCHECKED가 아닌 상태의 ID들
-        latest_attendance_status = (
-            Attendance.objects.filter(event=event, generation_mapping_id=OuterRef("id"))
-            .order_by("-modified_at", "-created_at")
-            .values("status")[:1]
-        )
-
         checked_gen_member_ids = (
-            gen_members.filter(
-                id__in=Subquery(
-                    Attendance.objects.filter(event=event)
-                    .values("generation_mapping_id")
-                    .distinct()
-                )
-            )
-            .annotate(latest_status=Subquery(latest_attendance_status))
-            .exclude(latest_status=AttendanceStatus.UNCHECKED)
-            .values_list("id", flat=True)
+            AttendanceCurrent.objects.filter(event=event)
+            .exclude(status=AttendanceStatus.UNCHECKED)
+            .values("generation_mapping_id")
         )
 
         # Attendance가 없거나 상태가 UNCHECKED인 GenMember들 필터링
@@ -106,6 +106,10 @@ def mark_absent_for_past_events():
     """
     logger.info("Starting mark_absent_for_past_events job")
 
+    # 아직 저장되지 않은 QR 출석이 결석으로 처리되지 않도록 먼저 반영
+    if settings.ATTENDANCE_WRITE_BEHIND:
+        CheckInQueue.drain(batch_size=settings.CHECKIN_STREAM_BATCH_SIZE)
+
     now = timezone.now().replace(second=0, microsecond=0)
     today = now.date()
 
@@ -150,16 +154,24 @@ def mark_absent_for_past_events():
                 "generation_mapping__member__user", flat=True
             )
         )
-        update_count = unchecked_attendances.update(
-            status=AttendanceStatus.ABSENT, is_modified=True, modified_at=now
-        )
+        with transaction.atomic():
+            update_count = unchecked_attendances.update(
+                status=AttendanceStatus.ABSENT, is_modified=True, modified_at=now
+            )
+            # update()는 save()를 거치지 않으므로 최신 상태와 통계도 함께 변경
+            AttendanceCurrent.update_status(
+                AttendanceCurrent.objects.filter(
+                    event=event, status=AttendanceStatus.UNCHECKED
+                ),
+                AttendanceStatus.ABSENT,
+            )
         total_updated += update_count
 
         logger.info(f"Updated {update_count} unchecked attendances to absent")
 
         # 출석 상태가 없는 멤버들에 대해 결석 상태로 생성
         new_attendances = []
-        for gen_member in gen_members:
+        for gen_member in gen_members.select_related("member"):
             if gen_member.id not in existing_attendance_member_ids:
                 new_attendances.append(
                     Attendance(
@@ -172,13 +184,14 @@ def mark_absent_for_past_events():
                 )
 
         if new_attendances:
-            Attendance.objects.bulk_create(new_attendances)
+            with transaction.atomic():
+                Attendance.objects.bulk_create(new_attendances)
+                AttendanceCurrent.sync(new_attendances)
             total_created += len(new_attendances)
             logger.info(f"Created {len(new_attendances)} new absent attendances")
             users_for_notification.extend(
-                new_attendances.values_list(
-                    "generation_mapping__member__user", flat=True
-                )
+                attendance.generation_mapping.member.user_id
+                for attendance in new_attendances
             )
 
         fcm_component = FCMComponent()
@@ -203,3 +216,52 @@ def mark_absent_for_past_events():
         "updated_attendances": total_updated,
         "created_attendances": total_created,
     }
+
+
+@shared_task
+def drain_checkin_stream():
+    """
+    Redis Stream에 쌓인 QR 출석 요청을 배치로 저장합니다.
+    (ATTENDANCE_WRITE_BEHIND가 켜져 있을 때만 동작)
+    """
+    if not settings.ATTENDANCE_WRITE_BEHIND:
+        return {"written_attendances": 0}
+
+    written = CheckInQueue.drain(batch_size=settings.CHECKIN_STREAM_BATCH_SIZE)
+    if written:
+        logger.info(f"Completed drain_checkin_stream job - Wrote {written} attendances")
+
+    return {"written_attendances": written}
+
+
+@shared_task
+def reconcile_attendance_stats():
+    """
+    미리 집계된 멤버별/이벤트별 출석 통계를 최신 출석 상태(AttendanceCurrent)와
+    비교해서 어긋난 값을 바로잡습니다.
+    """
+    fixed_members = 0
+    fixed_events = 0
+    for generation_id in Generation.all_objects.values_list("id", flat=True):
+        with transaction.atomic():
+            fixed_members += GenMemberAttendanceStats.reconcile(
+                GenMemberAttendanceStats.objects.filter(
+                    gen_member__generation_id=generation_id
+                ),
+                lambda: AttendanceCurrent.status_counts(
+                    "generation_mapping_id",
+                    generation_mapping__generation_id=generation_id,
+                ),
+            )
+            fixed_events += EventAttendanceStats.reconcile(
+                EventAttendanceStats.objects.filter(event__generation_id=generation_id),
+                lambda: AttendanceCurrent.status_counts(
+                    "event_id", event__generation_id=generation_id
+                ),
+            )
+
+    if fixed_members or fixed_events:
+        logger.warning(
+            f"Reconciled attendance stats - {fixed_members} members, {fixed_events} events"
+        )
+    return {"fixed_members": fixed_members, "fixed_events": fixed_events}